@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any
 from src.llm.models import ModelProvider
 from enum import Enum
 from app.backend.services.graph import extract_base_agent_key
@@ -135,6 +135,8 @@ class HedgeFundRequest(BaseHedgeFundRequest):
     live_trading: bool = False
     alpaca_api_key: Optional[str] = None
     alpaca_api_secret: Optional[str] = None
+    # Defaults to the configured provider; "local" reads the configured data.local_path, as clients may not name directories
+    data_provider: Optional[Literal["alpaca", "local"]] = None
 
     def get_start_date(self) -> str:
         """Calculate start date if not provided"""
@@ -3,6 +3,9 @@ from fastapi.responses import StreamingResponse
 import asyncio
 import json
 
+from src.data.cache import get_cache
+from src.tools.api import get_rate_limit_stats, get_request_stats
+
 router = APIRouter()
 
 
@@ -25,3 +28,13 @@ async def ping():
             await asyncio.sleep(1)
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
+
+
+@router.get("/cache/stats")
+async def cache_stats():
+    """Report in-memory cache usage and how many data requests were avoided or throttled."""
+    return {
+        "memory": get_cache().memory_stats(),
+        "requests": get_request_stats(),
+        "rate_limit": get_rate_limit_stats(),
+    }
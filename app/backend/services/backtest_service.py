@@ -6,12 +6,9 @@ from typing import Callable, Dict, List, Optional, Any
 import asyncio
 
 from src.tools.api import (
-    get_company_news,
     get_price_data,
-    get_prices,
-    get_financial_metrics,
-    get_insider_trades,
 )
+from src.tools.api_async import prefetch_async
 from app.backend.services.graph import run_graph_async, parse_hedge_fund_response
 from app.backend.services.portfolio import create_portfolio
 
@@ -219,7 +216,7 @@ class BacktestService:
 
         return total_value
 
-    def prefetch_data(self):
+    async def prefetch_data(self):
         """Pre-fetch all data needed for the backtest period."""
         end_date_dt = datetime.strptime(self.end_date, "%Y-%m-%d")
         start_date_dt = end_date_dt - relativedelta(years=1)
@@ -232,11 +229,8 @@ class BacktestService:
 
             api_key, _ = get_alpaca_keys()
 
-        for ticker in self.tickers:
-            get_prices(ticker, start_date_str, self.end_date, api_key=api_key)
-            get_financial_metrics(ticker, self.end_date, limit=10, api_key=api_key)
-            get_insider_trades(ticker, self.end_date, start_date=self.start_date, limit=1000, api_key=api_key)
-            get_company_news(ticker, self.end_date, start_date=self.start_date, limit=1000, api_key=api_key)
+        # Fetch all tickers and datasets concurrently without blocking the event loop
+        await prefetch_async(self.tickers, self.start_date, self.end_date, price_start_date=start_date_str, api_key=api_key)
 
     def _update_performance_metrics(self, performance_metrics: Dict[str, Any]):
         """Update performance metrics using daily returns."""
@@ -291,7 +285,7 @@ class BacktestService:
         Uses the pre-compiled graph for trading decisions.
         """
         # Pre-fetch all data at the start
-        self.prefetch_data()
+        await self.prefetch_data()
 
         dates = pd.date_range(self.start_date, self.end_date, freq="B")
         performance_metrics = {
@@ -1,15 +1,18 @@
 import asyncio
 import json
 import re
+from functools import partial
 from langchain_core.messages import HumanMessage
 from langgraph.graph import END, StateGraph
 
 from app.backend.services.agent_service import create_agent_function
 from src.agents.portfolio_manager import portfolio_management_agent
 from src.agents.risk_manager import risk_management_agent
-from src.main import start
-from src.utils.analysts import ANALYST_CONFIG
+from src.data.providers import bind_data_provider
+from src.main import prefetch, start
+from src.utils.analysts import ANALYST_CONFIG, get_data_requirements
 from src.graph.state import AgentState
+from src.config import get_data_config
 
 
 def extract_base_agent_key(unique_id: str) -> str:
@@ -44,6 +47,11 @@ def create_graph(graph_nodes: list, graph_edges: list) -> StateGraph:
     # Extract agent IDs from graph structure
     agent_ids = [node.id for node in graph_nodes]
     agent_ids_set = set(agent_ids)
+
+    # Prefetch what the analysts on the canvas read, once for all of them
+    requirements = get_data_requirements([extract_base_agent_key(agent_id) for agent_id in agent_ids])
+    graph.add_node("prefetch_node", bind_data_provider(partial(prefetch, requirements=requirements)))
+    graph.add_edge("start_node", "prefetch_node")
     
     # Track which nodes are portfolio managers for special handling
     portfolio_manager_nodes = set()
@@ -104,12 +112,12 @@ def create_graph(graph_nodes: list, graph_edges: list) -> StateGraph:
                 # Add edge between agent nodes (but not direct to portfolio managers)
                 graph.add_edge(edge.source, edge.target)
     
-    # Connect start_node to nodes that don't have incoming edges from other agents
+    # Connect the prefetch node to nodes that don't have incoming edges from other agents
     for agent_id in agent_ids:
         if agent_id not in nodes_with_incoming_edges:
             base_agent_key = extract_base_agent_key(agent_id)
             if base_agent_key in ANALYST_CONFIG and base_agent_key != "portfolio_manager":
-                graph.add_edge("start_node", agent_id)
+                graph.add_edge("prefetch_node", agent_id)
     
     # Connect analysts that have direct connections to portfolio managers to their corresponding risk managers
     for analyst_id, portfolio_manager_id in direct_to_portfolio_managers.items():
@@ -175,6 +183,7 @@ def run_graph(
                 "live_trading": getattr(request, "live_trading", False) if request else False,
                 "alpaca_api_key": getattr(request, "alpaca_api_key", None) if request else None,
                 "alpaca_api_secret": getattr(request, "alpaca_api_secret", None) if request else None,
+                "data_provider": getattr(request, "data_provider", None) or get_data_config()["provider"],
             },
         },
     )
@@ -0,0 +1,96 @@
+"""Measure cache-hit throughput of the data API with and without re-validation.
+
+Fills a fresh in-memory cache with a year of bars, a metrics history and
+insider-trade and news entries for one ticker, then calls ``get_prices``,
+``get_financial_metrics``, ``get_insider_trades`` and ``get_company_news``
+in a loop, the way a backtest queries them every day. The "per hit" variant
+reproduces the previous hit path, which validated a new pydantic model for
+every cached row on every call; the "shared" variant is the current path,
+which validates an entry's rows once and hands out the same frozen models on
+later hits. Run with::
+
+    python -m benchmarks.bench_cache_hits --seconds 1
+"""
+
+import argparse
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from src.data.cache import Cache
+from src.data.models import FinancialMetrics, InsiderTrade, Price
+from src.data.price_series import PriceSeries
+from src.data.sorted_rows import SortedRows
+from src.tools import api
+
+END_DATE = "2024-12-31"
+
+
+def _fill(cache: Cache) -> None:
+    days = [date(2024, 1, 1) + timedelta(days=i) for i in range(366)]
+    cache.set_prices("AAPL", [{"open": 1.0, "close": 2.0, "high": 3.0, "low": 0.5, "volume": 100, "time": f"{d}T05:00:00Z"} for d in days])
+    cache.add_price_range("AAPL", "2024-01-01", END_DATE)
+
+    fields = {name: 1.0 for name in FinancialMetrics.model_fields}
+    reports = [{**fields, "ticker": "AAPL", "period": "ttm", "currency": "USD", "report_period": f"{2014 + i // 4}-{3 * (i % 4) + 3:02d}-28"} for i in range(40)]
+    cache.set_metrics_history("AAPL", "ttm", reports, as_of=END_DATE, complete=True)
+
+    trade_fields = {name: None for name in InsiderTrade.model_fields}
+    trades = [{**trade_fields, "ticker": "AAPL", "issuer": "Apple", "transaction_shares": float(i), "filing_date": f"{d}"} for i, d in enumerate(days[:200])]
+    cache.set_insider_trades(f"AAPL_none_{END_DATE}_1000", trades)
+
+    news = [{"ticker": "AAPL", "title": f"headline {i}", "author": "a", "source": "s", "date": f"{d}T14:00:00Z", "url": f"https://news/{i}", "sentiment": None} for i, d in enumerate(days)]
+    cache.set_company_news("AAPL", news)
+    cache.add_news_range("AAPL", api.NEWS_HISTORY_START, END_DATE)
+
+
+def _calls() -> dict:
+    return {
+        "prices": lambda: api.get_prices("AAPL", "2024-01-01", END_DATE),
+        "financial_metrics": lambda: api.get_financial_metrics("AAPL", END_DATE, limit=40),
+        "insider_trades": lambda: api.get_insider_trades("AAPL", END_DATE),
+        "company_news": lambda: api.get_company_news("AAPL", END_DATE, start_date="2024-01-01"),
+    }
+
+
+@contextmanager
+def _validated_per_hit():
+    """Validate new models from the cached rows on every hit, as the previous hit path did."""
+
+    def models(self, model):
+        return [model(**row) for row in self.rows]
+
+    def to_prices(self):
+        return [Price(**row) for row in self.to_rows()]
+
+    with patch.object(SortedRows, "models", models), patch.object(PriceSeries, "to_prices", to_prices):
+        yield
+
+
+def _hits_per_second(call, seconds: float) -> float:
+    calls = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < seconds:
+        call()
+        calls += 1
+    return calls / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cache-hit throughput of the data API")
+    parser.add_argument("--seconds", type=float, default=1.0, help="Time spent on each dataset and variant")
+    args = parser.parse_args()
+
+    cache = Cache()
+    _fill(cache)
+    with patch("src.tools.api._cache", cache):
+        for name, call in _calls().items():
+            with _validated_per_hit():
+                before = _hits_per_second(call, args.seconds)
+            after = _hits_per_second(call, args.seconds)
+            print(f"{name:17s} {len(call()):4d} rows/hit   per hit: {before:9.0f} hits/s   shared: {after:9.0f} hits/s ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
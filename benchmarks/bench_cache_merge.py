@@ -0,0 +1,87 @@
+"""Compare the old copy-and-rebuild list merge with keyed, sorted cache rows.
+
+Grows 100k-row news and insider-trade histories through ``Cache.set_*`` in
+small batches, the way repeated fetches append to an entry, and times the
+whole build plus a read. The legacy variant reproduces the previous
+``Cache._merge_data``, which copied the list and rebuilt the key set on every
+call. Run with::
+
+    python -m benchmarks.bench_cache_merge --rows 100000 --batch 100
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from src.data.cache import Cache
+
+
+def _legacy_merge(existing: list[dict] | None, new_data: list[dict], key_field: str) -> list[dict]:
+    if not existing:
+        return new_data
+    existing_keys = {item[key_field] for item in existing}
+    merged = existing.copy()
+    merged.extend([item for item in new_data if item[key_field] not in existing_keys])
+    return merged
+
+
+def _news_rows(count: int) -> list[dict]:
+    start = datetime(2015, 1, 1)
+    return [
+        {"ticker": "AAPL", "title": f"headline {i}", "author": "a", "source": "s", "date": (start + timedelta(minutes=30 * i)).isoformat() + "Z", "url": f"https://news/{i}"}
+        for i in range(count)
+    ]
+
+
+def _trade_rows(count: int) -> list[dict]:
+    start = datetime(1990, 1, 1)
+    return [{"ticker": "AAPL", "filing_date": (start + timedelta(hours=i)).isoformat(), "shares": i} for i in range(count)]
+
+
+def _batches(rows: list[dict], size: int, shuffle: bool) -> list[list[dict]]:
+    batches = [rows[i:i + size] for i in range(0, len(rows), size)]
+    if shuffle:
+        random.Random(0).shuffle(batches)
+    return batches
+
+
+def _time_legacy(batches: list[list[dict]], key_field: str) -> float:
+    start = time.perf_counter()
+    entry = None
+    for batch in batches:
+        entry = _legacy_merge(entry, batch, key_field)
+    return time.perf_counter() - start
+
+
+def _time_cache(batches: list[list[dict]], setter: str, getter: str) -> float:
+    cache = Cache()
+    start = time.perf_counter()
+    for batch in batches:
+        getattr(cache, setter)("AAPL", batch)
+    getattr(cache, getter)("AAPL")
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cache row merging")
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows per history")
+    parser.add_argument("--batch", type=int, default=100, help="Rows added per set_* call")
+    args = parser.parse_args()
+
+    cases = [
+        ("company_news", _news_rows(args.rows), "url", "set_company_news", "get_company_news"),
+        ("insider_trades", _trade_rows(args.rows), "filing_date", "set_insider_trades", "get_insider_trades"),
+    ]
+    print(f"rows per history: {args.rows}, rows per set call: {args.batch}")
+    for name, rows, key_field, setter, getter in cases:
+        for order, shuffle in (("in order", False), ("shuffled", True)):
+            batches = _batches(rows, args.batch, shuffle)
+            legacy = _time_legacy(batches, key_field)
+            keyed = _time_cache(batches, setter, getter)
+            print(f"{name:15s} {order:9s} legacy merge: {legacy * 1000:9.1f} ms   sorted rows: {keyed * 1000:7.1f} ms ({legacy / keyed:.0f}x)")
+    print("The legacy variant leaves shuffled batches unsorted; sorted rows return them in time order.")
+
+
+if __name__ == "__main__":
+    main()
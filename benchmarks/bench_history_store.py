@@ -0,0 +1,75 @@
+"""Time a cold start over the memory-mapped price history store.
+
+Writes synthetic daily bars for many tickers to a temporary history store
+and to the SQLite tier, then measures how long a fresh cache takes to open
+every ticker and slice a one-year window, against the old per-ticker JSON
+decode. Run with::
+
+    python -m benchmarks.bench_history_store --tickers 500 --years 10
+"""
+
+import argparse
+import json
+import tempfile
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from src.data.cache import Cache
+from src.data.disk_cache import DiskCache
+from src.data.history_store import HistoryStore
+from src.data.price_series import PriceSeries
+
+
+def _synthetic_series(days: pd.DatetimeIndex, seed: int) -> PriceSeries:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(days))))
+    time_ns = (days + pd.Timedelta(hours=5)).asi8.astype(np.int64)
+    return PriceSeries(time_ns, close * 0.99, close, close * 1.01, close * 0.98, rng.integers(100_000, 10_000_000, len(days)))
+
+
+def _time_cold_start(cache: Cache, tickers: list[str], start_date: str, end_date: str) -> float:
+    start = time.perf_counter()
+    for ticker in tickers:
+        cache.get_prices(ticker).slice_dates(start_date, end_date).to_df()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold starts over the price history store")
+    parser.add_argument("--tickers", type=int, default=500, help="Number of synthetic tickers")
+    parser.add_argument("--years", type=int, default=10, help="Years of daily bars per ticker")
+    args = parser.parse_args()
+
+    days = pd.bdate_range(end="2024-12-31", periods=252 * args.years)
+    tickers = [f"T{i:04d}" for i in range(args.tickers)]
+    start_date, end_date = days[-252].strftime("%Y-%m-%d"), days[-1].strftime("%Y-%m-%d")
+
+    with tempfile.TemporaryDirectory() as root:
+        history = HistoryStore(f"{root}/history")
+        disk = DiskCache(f"{root}/cache.db", max_bytes=10 * 2**30)
+        legacy_blobs = {}
+        for seed, ticker in enumerate(tickers):
+            series = _synthetic_series(days, seed)
+            history.write(ticker, series)
+            disk.set("prices", ticker, series.to_bytes())
+            legacy_blobs[ticker] = zlib.compress(json.dumps(series.to_rows()).encode())
+
+        start = time.perf_counter()
+        for ticker in tickers:
+            PriceSeries.from_rows(json.loads(zlib.decompress(legacy_blobs[ticker]))).slice_dates(start_date, end_date).to_df()
+        legacy = time.perf_counter() - start
+        sqlite = _time_cold_start(Cache(disk=disk), tickers, start_date, end_date)
+        mapped = _time_cold_start(Cache(history=history), tickers, start_date, end_date)
+        disk.close()
+
+    print(f"tickers x bars: {args.tickers} x {len(days)}, reading a 1y window from each")
+    print(f"JSON rows decode:      {legacy * 1000:9.1f} ms")
+    print(f"SQLite npz blobs:      {sqlite * 1000:9.1f} ms")
+    print(f"memory-mapped history: {mapped * 1000:9.1f} ms ({mapped * 1000 / args.tickers:.3f} ms/ticker)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Compare bare ``requests.get`` with the pooled keep-alive HTTP client.
+
+Starts a local HTTP/1.1 stand-in server and times the same number of
+requests through both paths. Run with::
+
+    python -m benchmarks.bench_http_session --requests 500
+"""
+
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from src.tools.http_client import HttpClient
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    body = b'{"bars": []}'
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _time_calls(fn, url: str, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        fn(url)
+    return (time.perf_counter() - start) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs. unpooled HTTP requests")
+    parser.add_argument("--requests", type=int, default=500, help="Number of requests per variant")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/v2/stocks/AAPL/bars"
+
+    client = HttpClient()
+    client.request("GET", url)  # open the pooled connection outside the timed loop
+
+    bare = _time_calls(lambda u: requests.get(u, timeout=5), url, args.requests)
+    pooled = _time_calls(lambda u: client.request("GET", u), url, args.requests)
+
+    server.shutdown()
+    client.close()
+
+    print(f"requests per variant: {args.requests}")
+    print(f"bare requests.get:    {bare * 1000:.3f} ms/call")
+    print(f"pooled HttpClient:    {pooled * 1000:.3f} ms/call")
+    print(f"saved per call:       {(bare - pooled) * 1000:.3f} ms ({bare / pooled:.1f}x faster)")
+    print("Against a TLS endpoint the saving also includes one handshake per call.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Compare the legacy list-of-dicts price path with the columnar PriceSeries.
+
+Builds synthetic daily bars for many tickers, holds them in memory the way
+each cache representation does, and times the per-call work of serving a
+one-year window as a DataFrame: filtering cached rows, validating ``Price``
+models and building the frame, versus slicing arrays and wrapping them.
+Run with::
+
+    python -m benchmarks.bench_price_series --tickers 500 --years 10
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from src.data.models import Price
+from src.data.price_series import PriceSeries
+from src.tools.api import prices_to_df
+
+
+def _synthetic_rows(days: pd.DatetimeIndex, seed: int) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(days))))
+    volume = rng.integers(100_000, 10_000_000, len(days))
+    return [
+        {"open": c * 0.99, "close": c, "high": c * 1.01, "low": c * 0.98, "volume": int(v), "time": d.strftime("%Y-%m-%dT05:00:00Z")}
+        for c, v, d in zip(close.tolist(), volume.tolist(), days)
+    ]
+
+
+def _legacy_prices_to_df(prices: list[Price]) -> pd.DataFrame:
+    df = pd.DataFrame([p.model_dump() for p in prices])
+    df["Date"] = pd.to_datetime(df["time"])
+    df.set_index("Date", inplace=True)
+    numeric_cols = ["open", "close", "high", "low", "volume"]
+    for col in numeric_cols:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df.sort_index(inplace=True)
+    return df
+
+
+def _measure_memory(build) -> tuple[object, int]:
+    tracemalloc.start()
+    value = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, current
+
+
+def _time_calls(fn, tickers: list[str]) -> float:
+    start = time.perf_counter()
+    for ticker in tickers:
+        fn(ticker)
+    return (time.perf_counter() - start) / len(tickers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark list[Price] vs. PriceSeries price handling")
+    parser.add_argument("--tickers", type=int, default=500, help="Number of synthetic tickers")
+    parser.add_argument("--years", type=int, default=10, help="Years of daily bars per ticker")
+    parser.add_argument("--calls", type=int, default=200, help="Timed window reads per variant")
+    args = parser.parse_args()
+
+    days = pd.bdate_range(end="2024-12-31", periods=252 * args.years)
+    tickers = [f"T{i:04d}" for i in range(args.tickers)]
+    rows = {ticker: _synthetic_rows(days, seed) for seed, ticker in enumerate(tickers)}
+
+    legacy, legacy_bytes = _measure_memory(lambda: {t: [dict(r) for r in rows[t]] for t in tickers})
+    columnar, columnar_bytes = _measure_memory(lambda: {t: PriceSeries.from_rows(rows[t]) for t in tickers})
+    del rows
+
+    start_date, end_date = days[-252].strftime("%Y-%m-%d"), days[-1].strftime("%Y-%m-%d")
+
+    def legacy_call(ticker):
+        window = [r for r in legacy[ticker] if start_date <= r["time"][:10] <= end_date]
+        return _legacy_prices_to_df([Price(**r) for r in window])
+
+    def columnar_call(ticker):
+        return prices_to_df(columnar[ticker].slice_dates(start_date, end_date))
+
+    sample = [tickers[i % len(tickers)] for i in range(args.calls)]
+    assert np.allclose(legacy_call(sample[0])["close"].to_numpy(), columnar_call(sample[0])["close"].to_numpy())
+    legacy_time = _time_calls(legacy_call, sample)
+    columnar_time = _time_calls(columnar_call, sample)
+
+    print(f"tickers x bars:            {args.tickers} x {len(days)}")
+    print(f"resident cache, list[dict]:  {legacy_bytes / 2**20:8.1f} MiB")
+    print(f"resident cache, PriceSeries: {columnar_bytes / 2**20:8.1f} MiB ({legacy_bytes / columnar_bytes:.1f}x smaller)")
+    print(f"1y window -> DataFrame, legacy:      {legacy_time * 1000:8.3f} ms/call")
+    print(f"1y window -> DataFrame, PriceSeries: {columnar_time * 1000:8.3f} ms/call ({legacy_time / columnar_time:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
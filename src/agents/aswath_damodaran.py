@@ -14,6 +14,7 @@ from src.tools.api import (
     search_line_items,
 )
 from src.utils.api_key import get_api_key_from_state
+from src.utils.concurrency import run_per_ticker
 from src.utils.llm import call_llm
 from src.utils.progress import progress
 
@@ -38,10 +39,7 @@ def aswath_damodaran_agent(state: AgentState, agent_id: str = "aswath_damodaran_
     tickers   = data["tickers"]
     api_key  = get_api_key_from_state(state, "APCA_API_KEY_ID")
 
-    analysis_data: dict[str, dict] = {}
-    damodaran_signals: dict[str, dict] = {}
-
-    for ticker in tickers:
+    def analyze_ticker(ticker: str) -> dict:
         # ─── Fetch core data ────────────────────────────────────────────────────
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
         metrics = get_financial_metrics(ticker, end_date, period="ttm", limit=5, api_key=api_key)
@@ -100,7 +98,7 @@ def aswath_damodaran_agent(state: AgentState, agent_id: str = "aswath_damodaran_
         else:
             signal = "neutral"
 
-        analysis_data[ticker] = {
+        ticker_data = {
             "signal": signal,
             "score": total_score,
             "max_score": max_score,
@@ -116,15 +114,17 @@ def aswath_damodaran_agent(state: AgentState, agent_id: str = "aswath_damodaran_
         progress.update_status(agent_id, ticker, "Generating Damodaran analysis")
         damodaran_output = generate_damodaran_output(
             ticker=ticker,
-            analysis_data=analysis_data,
+            analysis_data={ticker: ticker_data},
             state=state,
             agent_id=agent_id,
         )
 
-        damodaran_signals[ticker] = damodaran_output.model_dump()
-
         progress.update_status(agent_id, ticker, "Done", analysis=damodaran_output.reasoning)
 
+        return damodaran_output.model_dump()
+
+    damodaran_signals: dict[str, dict] = run_per_ticker(tickers, analyze_ticker)
+
     # ─── Push message back to graph state ──────────────────────────────────────
     message = HumanMessage(content=json.dumps(damodaran_signals), name=agent_id)
 
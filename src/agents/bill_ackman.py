@@ -8,6 +8,7 @@ from typing_extensions import Literal
 from src.utils.progress import progress
 from src.utils.llm import call_llm
 from src.utils.api_key import get_api_key_from_state
+from src.utils.concurrency import run_per_ticker
 
 
 class BillAckmanSignal(BaseModel):
@@ -26,10 +27,8 @@ def bill_ackman_agent(state: AgentState, agent_id: str = "bill_ackman_agent"):
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "APCA_API_KEY_ID")
-    analysis_data = {}
-    ackman_analysis = {}
-    
-    for ticker in tickers:
+
+    def analyze_ticker(ticker: str) -> dict:
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
         metrics = get_financial_metrics(ticker, end_date, period="annual", limit=5, api_key=api_key)
         
@@ -87,7 +86,7 @@ def bill_ackman_agent(state: AgentState, agent_id: str = "bill_ackman_agent"):
         else:
             signal = "neutral"
         
-        analysis_data[ticker] = {
+        ticker_data = {
             "signal": signal,
             "score": total_score,
             "max_score": max_possible_score,
@@ -100,18 +99,20 @@ def bill_ackman_agent(state: AgentState, agent_id: str = "bill_ackman_agent"):
         progress.update_status(agent_id, ticker, "Generating Bill Ackman analysis")
         ackman_output = generate_ackman_output(
             ticker=ticker, 
-            analysis_data=analysis_data,
+            analysis_data={ticker: ticker_data},
             state=state,
             agent_id=agent_id,
         )
         
-        ackman_analysis[ticker] = {
+        progress.update_status(agent_id, ticker, "Done", analysis=ackman_output.reasoning)
+
+        return {
             "signal": ackman_output.signal,
             "confidence": ackman_output.confidence,
             "reasoning": ackman_output.reasoning
         }
-        
-        progress.update_status(agent_id, ticker, "Done", analysis=ackman_output.reasoning)
+
+    ackman_analysis = run_per_ticker(tickers, analyze_ticker)
     
     # Wrap results in a single message for the chain
     message = HumanMessage(
@@ -8,6 +8,7 @@ from typing_extensions import Literal
 from src.utils.progress import progress
 from src.utils.llm import call_llm
 from src.utils.api_key import get_api_key_from_state
+from src.utils.concurrency import run_per_ticker
 
 
 class CathieWoodSignal(BaseModel):
@@ -28,10 +29,8 @@ def cathie_wood_agent(state: AgentState, agent_id: str = "cathie_wood_agent"):
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "APCA_API_KEY_ID")
-    analysis_data = {}
-    cw_analysis = {}
 
-    for ticker in tickers:
+    def analyze_ticker(ticker: str) -> dict:
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
         metrics = get_financial_metrics(ticker, end_date, period="annual", limit=5, api_key=api_key)
 
@@ -82,20 +81,22 @@ def cathie_wood_agent(state: AgentState, agent_id: str = "cathie_wood_agent"):
         else:
             signal = "neutral"
 
-        analysis_data[ticker] = {"signal": signal, "score": total_score, "max_score": max_possible_score, "disruptive_analysis": disruptive_analysis, "innovation_analysis": innovation_analysis, "valuation_analysis": valuation_analysis}
+        ticker_data = {"signal": signal, "score": total_score, "max_score": max_possible_score, "disruptive_analysis": disruptive_analysis, "innovation_analysis": innovation_analysis, "valuation_analysis": valuation_analysis}
 
         progress.update_status(agent_id, ticker, "Generating Cathie Wood analysis")
         cw_output = generate_cathie_wood_output(
             ticker=ticker,
-            analysis_data=analysis_data,
+            analysis_data={ticker: ticker_data},
             state=state,
             agent_id=agent_id,
         )
 
-        cw_analysis[ticker] = {"signal": cw_output.signal, "confidence": cw_output.confidence, "reasoning": cw_output.reasoning}
-
         progress.update_status(agent_id, ticker, "Done", analysis=cw_output.reasoning)
 
+        return {"signal": cw_output.signal, "confidence": cw_output.confidence, "reasoning": cw_output.reasoning}
+
+    cw_analysis = run_per_ticker(tickers, analyze_ticker)
+
     message = HumanMessage(content=json.dumps(cw_analysis), name=agent_id)
 
     if state["metadata"].get("show_reasoning"):
@@ -4,10 +4,12 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
+from datetime import datetime, timedelta
 from typing_extensions import Literal
 from src.utils.progress import progress
 from src.utils.llm import call_llm
 from src.utils.api_key import get_api_key_from_state
+from src.utils.concurrency import run_per_ticker
 
 class CharlieMungerSignal(BaseModel):
     signal: Literal["bullish", "bearish", "neutral"]
@@ -24,10 +26,8 @@ def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agen
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "APCA_API_KEY_ID")
-    analysis_data = {}
-    munger_analysis = {}
-    
-    for ticker in tickers:
+
+    def analyze_ticker(ticker: str) -> dict:
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
         metrics = get_financial_metrics(ticker, end_date, period="annual", limit=10, api_key=api_key)  # Munger looks at longer periods
         
@@ -76,7 +76,7 @@ def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agen
             ticker,
             end_date,
             # Look back 1 year for news
-            start_date=None,
+            start_date=(datetime.fromisoformat(end_date) - timedelta(days=365)).date().isoformat(),
             limit=100,
             api_key=api_key,
         )
@@ -112,7 +112,7 @@ def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agen
         else:
             signal = "neutral"
         
-        analysis_data[ticker] = {
+        ticker_data = {
             "signal": signal,
             "score": total_score,
             "max_score": max_possible_score,
@@ -127,18 +127,20 @@ def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agen
         progress.update_status(agent_id, ticker, "Generating Charlie Munger analysis")
         munger_output = generate_munger_output(
             ticker=ticker, 
-            analysis_data=analysis_data,
+            analysis_data={ticker: ticker_data},
             state=state,
             agent_id=agent_id,
         )
         
-        munger_analysis[ticker] = {
+        progress.update_status(agent_id, ticker, "Done", analysis=munger_output.reasoning)
+
+        return {
             "signal": munger_output.signal,
             "confidence": munger_output.confidence,
             "reasoning": munger_output.reasoning
         }
-        
-        progress.update_status(agent_id, ticker, "Done", analysis=munger_output.reasoning)
+
+    munger_analysis = run_per_ticker(tickers, analyze_ticker)
     
     # Wrap results in a single message for the chain
     message = HumanMessage(
@@ -19,6 +19,7 @@ from src.tools.api import (
 from src.utils.llm import call_llm
 from src.utils.progress import progress
 from src.utils.api_key import get_api_key_from_state
+from src.utils.concurrency import run_per_ticker
 
 
 class MichaelBurrySignal(BaseModel):
@@ -39,10 +40,7 @@ def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"
     # We look one year back for insider trades / news flow
     start_date = (datetime.fromisoformat(end_date) - timedelta(days=365)).date().isoformat()
 
-    analysis_data: dict[str, dict] = {}
-    burry_analysis: dict[str, dict] = {}
-
-    for ticker in tickers:
+    def analyze_ticker(ticker: str) -> dict:
         # ------------------------------------------------------------------
         # Fetch raw data
         # ------------------------------------------------------------------
@@ -116,7 +114,7 @@ def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"
         # ------------------------------------------------------------------
         # Collect data for LLM reasoning & output
         # ------------------------------------------------------------------
-        analysis_data[ticker] = {
+        ticker_data = {
             "signal": signal,
             "score": total_score,
             "max_score": max_score,
@@ -130,18 +128,20 @@ def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"
         progress.update_status(agent_id, ticker, "Generating LLM output")
         burry_output = _generate_burry_output(
             ticker=ticker,
-            analysis_data=analysis_data,
+            analysis_data={ticker: ticker_data},
             state=state,
             agent_id=agent_id,
         )
 
-        burry_analysis[ticker] = {
+        progress.update_status(agent_id, ticker, "Done", analysis=burry_output.reasoning)
+
+        return {
             "signal": burry_output.signal,
             "confidence": burry_output.confidence,
             "reasoning": burry_output.reasoning,
         }
 
-        progress.update_status(agent_id, ticker, "Done", analysis=burry_output.reasoning)
+    burry_analysis: dict[str, dict] = run_per_ticker(tickers, analyze_ticker)
 
     # ----------------------------------------------------------------------
     # Return to the graph
@@ -8,6 +8,7 @@ from typing_extensions import Literal
 from src.utils.progress import progress
 from src.utils.llm import call_llm
 from src.utils.api_key import get_api_key_from_state
+from src.utils.concurrency import run_per_ticker
 
 
 class MohnishPabraiSignal(BaseModel):
@@ -23,12 +24,9 @@ def mohnish_pabrai_agent(state: AgentState, agent_id: str = "mohnish_pabrai_agen
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "APCA_API_KEY_ID")
 
-    analysis_data: dict[str, any] = {}
-    pabrai_analysis: dict[str, any] = {}
-
     # Pabrai focuses on: downside protection, simple business, moat via unit economics, FCF yield vs alternatives,
     # and potential for doubling in 2-3 years at low risk.
-    for ticker in tickers:
+    def analyze_ticker(ticker: str) -> dict:
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
         metrics = get_financial_metrics(ticker, end_date, period="annual", limit=8, api_key=api_key)
 
@@ -89,7 +87,7 @@ def mohnish_pabrai_agent(state: AgentState, agent_id: str = "mohnish_pabrai_agen
         else:
             signal = "neutral"
 
-        analysis_data[ticker] = {
+        ticker_data = {
             "signal": signal,
             "score": total_score,
             "max_score": max_score,
@@ -102,18 +100,20 @@ def mohnish_pabrai_agent(state: AgentState, agent_id: str = "mohnish_pabrai_agen
         progress.update_status(agent_id, ticker, "Generating Pabrai analysis")
         pabrai_output = generate_pabrai_output(
             ticker=ticker,
-            analysis_data=analysis_data,
+            analysis_data={ticker: ticker_data},
             state=state,
             agent_id=agent_id,
         )
 
-        pabrai_analysis[ticker] = {
+        progress.update_status(agent_id, ticker, "Done", analysis=pabrai_output.reasoning)
+
+        return {
             "signal": pabrai_output.signal,
             "confidence": pabrai_output.confidence,
             "reasoning": pabrai_output.reasoning,
         }
 
-        progress.update_status(agent_id, ticker, "Done", analysis=pabrai_output.reasoning)
+    pabrai_analysis: dict[str, any] = run_per_ticker(tickers, analyze_ticker)
 
     message = HumanMessage(content=json.dumps(pabrai_analysis), name=agent_id)
 
@@ -3,16 +3,18 @@ from src.tools.api import (
     get_market_cap,
     search_line_items,
     get_insider_trades,
-    get_company_news,
+    iter_company_news,
 )
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
+from itertools import islice
 from typing_extensions import Literal
 from src.utils.progress import progress
 from src.utils.llm import call_llm
 from src.utils.api_key import get_api_key_from_state
+from src.utils.concurrency import run_per_ticker
 
 
 class PeterLynchSignal(BaseModel):
@@ -43,10 +45,8 @@ def peter_lynch_agent(state: AgentState, agent_id: str = "peter_lynch_agent"):
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "APCA_API_KEY_ID")
-    analysis_data = {}
-    lynch_analysis = {}
 
-    for ticker in tickers:
+    def analyze_ticker(ticker: str) -> dict:
         progress.update_status(agent_id, ticker, "Gathering financial line items")
         # Relevant line items for Peter Lynch's approach
         financial_line_items = search_line_items(
@@ -78,7 +78,8 @@ def peter_lynch_agent(state: AgentState, agent_id: str = "peter_lynch_agent"):
         insider_trades = get_insider_trades(ticker, end_date, limit=50, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching company news")
-        company_news = get_company_news(ticker, end_date, limit=50, api_key=api_key)
+        # Only the newest articles are read, so older pages are never downloaded
+        company_news = list(islice(iter_company_news(ticker, end_date, page_size=50, api_key=api_key), 50))
 
         # Perform sub-analyses:
         progress.update_status(agent_id, ticker, "Analyzing growth")
@@ -117,7 +118,7 @@ def peter_lynch_agent(state: AgentState, agent_id: str = "peter_lynch_agent"):
         else:
             signal = "neutral"
 
-        analysis_data[ticker] = {
+        ticker_data = {
             "signal": signal,
             "score": total_score,
             "max_score": max_possible_score,
@@ -131,18 +132,20 @@ def peter_lynch_agent(state: AgentState, agent_id: str = "peter_lynch_agent"):
         progress.update_status(agent_id, ticker, "Generating Peter Lynch analysis")
         lynch_output = generate_lynch_output(
             ticker=ticker,
-            analysis_data=analysis_data[ticker],
+            analysis_data=ticker_data,
             state=state,
             agent_id=agent_id,
         )
 
-        lynch_analysis[ticker] = {
+        progress.update_status(agent_id, ticker, "Done", analysis=lynch_output.reasoning)
+
+        return {
             "signal": lynch_output.signal,
             "confidence": lynch_output.confidence,
             "reasoning": lynch_output.reasoning,
         }
 
-        progress.update_status(agent_id, ticker, "Done", analysis=lynch_output.reasoning)
+    lynch_analysis = run_per_ticker(tickers, analyze_ticker)
 
     # Wrap up results
     message = HumanMessage(content=json.dumps(lynch_analysis), name=agent_id)
@@ -3,11 +3,11 @@ from __future__ import annotations
 import json
 from typing import List, Optional
 
-import requests
 from pydantic import BaseModel
 from langchain_core.messages import HumanMessage
 
 from src.graph.state import AgentState
+from src.tools import http_client
 from src.utils.llm import call_llm
 from src.utils.progress import progress
 
@@ -25,7 +25,7 @@ def _fetch_screener_symbols(api_key: Optional[str]) -> List[str]:
     if api_key:
         headers["APCA-API-KEY-ID"] = api_key
     try:
-        resp = requests.get(ALPACA_SCREENER_URL, headers=headers, timeout=10)
+        resp = http_client.get(ALPACA_SCREENER_URL, headers=headers, timeout=10)
         data = resp.json() if resp.status_code == 200 else {}
         most_actives = data.get("most_actives", [])
         return [item.get("symbol") for item in most_actives if item.get("symbol")]
@@ -38,7 +38,7 @@ def _fetch_news_symbols(api_key: Optional[str]) -> List[str]:
     if api_key:
         headers["APCA-API-KEY-ID"] = api_key
     try:
-        resp = requests.get(ALPACA_NEWS_URL, headers=headers, params={"limit": 50}, timeout=10)
+        resp = http_client.get(ALPACA_NEWS_URL, headers=headers, params={"limit": 50}, timeout=10)
         data = resp.json() if resp.status_code == 200 else {}
         symbols: List[str] = []
         for article in data.get("news", []):
@@ -1,7 +1,7 @@
 from langchain_core.messages import HumanMessage
 from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.progress import progress
-from src.tools.api import get_prices, prices_to_df
+from src.tools.api import get_price_series_batch, prices_to_df
 import json
 import numpy as np
 import pandas as pd
@@ -24,16 +24,19 @@ def risk_management_agent(state: AgentState, agent_id: str = "risk_management_ag
 
     # First, fetch prices and calculate volatility for all relevant tickers
     all_tickers = set(tickers) | set(portfolio.get("positions", {}).keys())
-    
+
+    progress.update_status(agent_id, None, "Fetching price data")
+    prices_by_ticker = get_price_series_batch(
+        tickers=list(all_tickers),
+        start_date=data["start_date"],
+        end_date=data["end_date"],
+        api_key=api_key,
+    )
+
     for ticker in all_tickers:
-        progress.update_status(agent_id, ticker, "Fetching price data and calculating volatility")
-        
-        prices = get_prices(
-            ticker=ticker,
-            start_date=data["start_date"],
-            end_date=data["end_date"],
-            api_key=api_key,
-        )
+        progress.update_status(agent_id, ticker, "Calculating volatility")
+
+        prices = prices_by_ticker.get(ticker, [])
 
         if not prices:
             progress.update_status(agent_id, ticker, "Warning: No price data found")
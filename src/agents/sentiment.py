@@ -4,8 +4,10 @@ from src.utils.progress import progress
 import pandas as pd
 import numpy as np
 import json
+from itertools import islice
 from src.utils.api_key import get_api_key_from_state
-from src.tools.api import get_insider_trades, get_company_news
+from src.utils.concurrency import run_per_ticker
+from src.tools.api import get_insider_trades, iter_company_news
 
 
 ##### Sentiment Agent #####
@@ -15,10 +17,8 @@ def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analys
     end_date = data.get("end_date")
     tickers = data.get("tickers")
     api_key = get_api_key_from_state(state, "APCA_API_KEY_ID")
-    # Initialize sentiment analysis for each ticker
-    sentiment_analysis = {}
 
-    for ticker in tickers:
+    def analyze_ticker(ticker: str) -> dict:
         progress.update_status(agent_id, ticker, "Fetching insider trades")
 
         # Get the insider trades
@@ -37,8 +37,8 @@ def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analys
 
         progress.update_status(agent_id, ticker, "Fetching company news")
 
-        # Get the company news
-        company_news = get_company_news(ticker, end_date, limit=100, api_key=api_key)
+        # Get the 100 most recent articles; the stream stops requesting pages once it has them
+        company_news = list(islice(iter_company_news(ticker, end_date, page_size=100, api_key=api_key), 100))
 
         # Get the sentiment from the company news
         sentiment = pd.Series([n.sentiment for n in company_news]).dropna()
@@ -109,13 +109,15 @@ def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analys
             }
         }
 
-        sentiment_analysis[ticker] = {
+        progress.update_status(agent_id, ticker, "Done", analysis=json.dumps(reasoning, indent=4))
+
+        return {
             "signal": overall_signal,
             "confidence": confidence,
             "reasoning": reasoning,
         }
 
-        progress.update_status(agent_id, ticker, "Done", analysis=json.dumps(reasoning, indent=4))
+    sentiment_analysis = run_per_ticker(tickers, analyze_ticker)
 
     # Create the sentiment message
     message = HumanMessage(
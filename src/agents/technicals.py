@@ -4,11 +4,12 @@ from langchain_core.messages import HumanMessage
 
 from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.api_key import get_api_key_from_state
+from src.utils.concurrency import run_per_ticker
 import json
 import pandas as pd
 import numpy as np
 
-from src.tools.api import get_prices, prices_to_df
+from src.tools.api import get_price_series, prices_to_df
 from src.utils.progress import progress
 
 
@@ -46,14 +47,12 @@ def technical_analyst_agent(state: AgentState, agent_id: str = "technical_analys
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "APCA_API_KEY_ID")
-    # Initialize analysis for each ticker
-    technical_analysis = {}
 
-    for ticker in tickers:
+    def analyze_ticker(ticker: str) -> dict | None:
         progress.update_status(agent_id, ticker, "Analyzing price data")
 
         # Get the historical price data
-        prices = get_prices(
+        prices = get_price_series(
             ticker=ticker,
             start_date=start_date,
             end_date=end_date,
@@ -62,7 +61,7 @@ def technical_analyst_agent(state: AgentState, agent_id: str = "technical_analys
 
         if not prices:
             progress.update_status(agent_id, ticker, "Failed: No price data found")
-            continue
+            return None
 
         # Convert prices to a DataFrame
         prices_df = prices_to_df(prices)
@@ -104,7 +103,7 @@ def technical_analyst_agent(state: AgentState, agent_id: str = "technical_analys
         )
 
         # Generate detailed analysis report for this ticker
-        technical_analysis[ticker] = {
+        ticker_analysis = {
             "signal": combined_signal["signal"],
             "confidence": round(combined_signal["confidence"] * 100),
             "reasoning": {
@@ -135,7 +134,11 @@ def technical_analyst_agent(state: AgentState, agent_id: str = "technical_analys
                 },
             },
         }
-        progress.update_status(agent_id, ticker, "Done", analysis=json.dumps(technical_analysis, indent=4))
+        progress.update_status(agent_id, ticker, "Done", analysis=json.dumps({ticker: ticker_analysis}, indent=4))
+        return ticker_analysis
+
+    # Tickers without price data are left out
+    technical_analysis = {ticker: analysis for ticker, analysis in run_per_ticker(tickers, analyze_ticker).items() if analysis is not None}
 
     # Create the technical analyst message
     message = HumanMessage(
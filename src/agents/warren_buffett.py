@@ -8,6 +8,7 @@ from src.tools.api import get_financial_metrics, get_market_cap, search_line_ite
 from src.utils.llm import call_llm
 from src.utils.progress import progress
 from src.utils.api_key import get_api_key_from_state
+from src.utils.concurrency import run_per_ticker
 
 class WarrenBuffettSignal(BaseModel):
     signal: Literal["bullish", "bearish", "neutral"]
@@ -21,11 +22,8 @@ def warren_buffett_agent(state: AgentState, agent_id: str = "warren_buffett_agen
     end_date = data["end_date"]
     tickers = data["tickers"]
     api_key = get_api_key_from_state(state, "APCA_API_KEY_ID")
-    # Collect all analysis for LLM reasoning
-    analysis_data = {}
-    buffett_analysis = {}
 
-    for ticker in tickers:
+    def analyze_ticker(ticker: str) -> dict:
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
         # Fetch required data - request more periods for better trend analysis
         metrics = get_financial_metrics(ticker, end_date, period="ttm", limit=10, api_key=api_key)
@@ -105,7 +103,7 @@ def warren_buffett_agent(state: AgentState, agent_id: str = "warren_buffett_agen
             margin_of_safety = (intrinsic_value - market_cap) / market_cap
 
         # Combine all analysis results for LLM evaluation
-        analysis_data[ticker] = {
+        ticker_data = {
             "ticker": ticker,
             "score": total_score,
             "max_score": max_possible_score,
@@ -123,19 +121,21 @@ def warren_buffett_agent(state: AgentState, agent_id: str = "warren_buffett_agen
         progress.update_status(agent_id, ticker, "Generating Warren Buffett analysis")
         buffett_output = generate_buffett_output(
             ticker=ticker,
-            analysis_data=analysis_data,
+            analysis_data={ticker: ticker_data},
             state=state,
             agent_id=agent_id,
         )
 
+        progress.update_status(agent_id, ticker, "Done", analysis=buffett_output.reasoning)
+
         # Store analysis in consistent format with other agents
-        buffett_analysis[ticker] = {
+        return {
             "signal": buffett_output.signal,
             "confidence": buffett_output.confidence,
             "reasoning": buffett_output.reasoning,
         }
 
-        progress.update_status(agent_id, ticker, "Done", analysis=buffett_output.reasoning)
+    buffett_analysis = run_per_ticker(tickers, analyze_ticker)
 
     # Create the message
     message = HumanMessage(content=json.dumps(buffett_analysis), name=agent_id)
@@ -1,3 +1,4 @@
+import asyncio
 import sys
 
 from datetime import datetime, timedelta
@@ -14,12 +15,11 @@ from src.llm.models import LLM_ORDER, OLLAMA_LLM_ORDER, get_model_info, ModelPro
 from src.utils.analysts import ANALYST_ORDER
 from src.main import run_hedge_fund
 from src.tools.api import (
-    get_company_news,
     get_price_data,
-    get_prices,
-    get_financial_metrics,
-    get_insider_trades,
+    use_memory_cache,
 )
+from src.tools.api_async import prefetch_async
+from src.tools.http_client import use_archive
 from src.utils.display import print_backtest_results, format_backtest_row
 from typing_extensions import Callable
 from src.utils.ollama import ensure_ollama_and_model
@@ -272,18 +272,12 @@ class Backtester:
         start_date_dt = end_date_dt - relativedelta(years=1)
         start_date_str = start_date_dt.strftime("%Y-%m-%d")
 
-        for ticker in self.tickers:
-            # Fetch price data for the entire period, plus 1 year
-            get_prices(ticker, start_date_str, self.end_date)
-
-            # Fetch financial metrics
-            get_financial_metrics(ticker, self.end_date, limit=10)
-
-            # Fetch insider trades
-            get_insider_trades(ticker, self.end_date, start_date=self.start_date, limit=1000)
-
-            # Fetch company news
-            get_company_news(ticker, self.end_date, start_date=self.start_date, limit=1000)
+        # Fetch prices (plus 1 year of history), metrics, insider trades and news for all tickers concurrently
+        prefetched = asyncio.run(prefetch_async(self.tickers, self.start_date, self.end_date, price_start_date=start_date_str))
+        for ticker, datasets in prefetched.items():
+            for dataset, result in datasets.items():
+                if isinstance(result, Exception):
+                    print(f"{Fore.YELLOW}Warning: could not pre-fetch {dataset} for {ticker}: {result}{Style.RESET_ALL}")
 
         print("Data pre-fetch complete.")
 
@@ -652,6 +646,9 @@ if __name__ == "__main__":
         help="Use all available analysts (overrides --analysts)",
     )
     parser.add_argument("--ollama", action="store_true", help="Use Ollama for local LLM inference")
+    archive_group = parser.add_mutually_exclusive_group()
+    archive_group.add_argument("--record-http", metavar="PATH", help="Record every API request and response to an archive file")
+    archive_group.add_argument("--replay-http", metavar="PATH", help="Serve API responses from a recorded archive without network access")
 
     args = parser.parse_args()
 
@@ -772,5 +769,10 @@ if __name__ == "__main__":
         initial_margin_requirement=args.margin_requirement,
     )
 
-    performance_metrics = backtester.run_backtest()
+    if args.record_http or args.replay_http:
+        # Every request must reach the archive, so the persistent cache is bypassed
+        with use_archive(args.record_http or args.replay_http, "record" if args.record_http else "replay"), use_memory_cache():
+            performance_metrics = backtester.run_backtest()
+    else:
+        performance_metrics = backtester.run_backtest()
     performance_df = backtester.analyze_performance()
@@ -25,3 +25,114 @@ def get_alpaca_keys() -> Tuple[Optional[str], Optional[str]]:
     api_key = alpaca_cfg.get("api_key_id") or None
     api_secret = alpaca_cfg.get("api_secret_key") or None
     return api_key, api_secret
+
+
+_CACHE_DEFAULTS = {
+    "enabled": True,
+    "path": "data/cache.db",
+    # Directory of memory-mapped daily bars per ticker; null keeps prices in the SQLite tier
+    "history_path": "data/history",
+    "max_bytes": 512 * 1024 * 1024,
+    # Separate budget for the history directory, which max_bytes does not cover; null leaves it unbounded
+    "history_max_bytes": 2 * 1024 * 1024 * 1024,
+    "ttl": {
+        # Price and news history is append-only and refreshed through its covered ranges, so it never expires
+        "prices": None,
+        "financial_metrics": 7 * 24 * 3600,
+        "line_items": 7 * 24 * 3600,
+        "insider_trades": 24 * 3600,
+        "company_news": None,
+        # Requests that returned nothing are rechecked sooner than real data expires
+        "empty_results": 3600,
+        # Coverage of today is refetched after this long, since its bars and articles are still arriving
+        "unsettled_ranges": 900,
+    },
+    # In-process byte budget per dataset; "default" applies to datasets not listed
+    "memory_max_bytes": {
+        "prices": 256 * 1024 * 1024,
+        "company_news": 64 * 1024 * 1024,
+        "default": 32 * 1024 * 1024,
+    },
+}
+
+
+def get_cache_config() -> dict:
+    """Return the persistent cache settings, merged over the defaults.
+
+    The ``cache`` section of config.json may override any key; ``ttl`` and
+    ``memory_max_bytes`` are merged per dataset. Relative ``path`` and
+    ``history_path`` values are resolved against the project root so the CLI
+    and the backend share the same files.
+    """
+    config = _load_config()
+    cache_cfg = config.get("cache", {})
+    merged = {**_CACHE_DEFAULTS, **cache_cfg}
+    merged["ttl"] = {**_CACHE_DEFAULTS["ttl"], **cache_cfg.get("ttl", {})}
+    merged["memory_max_bytes"] = {**_CACHE_DEFAULTS["memory_max_bytes"], **cache_cfg.get("memory_max_bytes", {})}
+    for key in ("path", "history_path"):
+        if merged[key]:
+            path = Path(merged[key])
+            if not path.is_absolute():
+                path = Path(__file__).resolve().parent.parent / path
+            merged[key] = str(path)
+    return merged
+
+
+_HTTP_DEFAULTS = {
+    "pool_size": 32,
+    "connect_timeout": 5.0,
+    "read_timeout": 30.0,
+    "max_concurrent_requests": 8,
+    # "record" stores every request/response in archive_path, "replay" serves them with no network access
+    "archive_mode": None,
+    "archive_path": "data/http_archive.db",
+}
+
+
+def get_http_config() -> dict:
+    """Return connection pool, timeout, concurrency and record/replay settings for outbound HTTP requests.
+
+    A relative ``archive_path`` is resolved against the project root.
+    """
+    config = _load_config()
+    merged = {**_HTTP_DEFAULTS, **config.get("http", {})}
+    path = Path(merged["archive_path"])
+    if not path.is_absolute():
+        path = Path(__file__).resolve().parent.parent / path
+    merged["archive_path"] = str(path)
+    return merged
+
+
+_AGENT_DEFAULTS = {
+    # Tickers an analyst scores at once; each runs its own data fetches and LLM call
+    "ticker_concurrency": 16,
+}
+
+
+def get_agent_config() -> dict:
+    """Return how the analyst agents run their per-ticker work."""
+    config = _load_config()
+    return {**_AGENT_DEFAULTS, **config.get("agents", {})}
+
+
+_DATA_DEFAULTS = {
+    "provider": "alpaca",
+    "local_path": "data/local",
+    # Fundamentals queries request at least this many reports, so one download serves every smaller limit
+    "overfetch_limit": None,
+}
+
+
+def get_data_config() -> dict:
+    """Return which market data provider to use and where the local provider reads from.
+
+    ``provider`` is ``"alpaca"`` or ``"local"``. A relative ``local_path`` is
+    resolved against the project root.
+    """
+    config = _load_config()
+    merged = {**_DATA_DEFAULTS, **config.get("data", {})}
+    path = Path(merged["local_path"])
+    if not path.is_absolute():
+        path = Path(__file__).resolve().parent.parent / path
+    merged["local_path"] = str(path)
+    return merged
@@ -0,0 +1,170 @@
+"""Per-run bundles of prefetched fundamentals, insider trades and news.
+
+The analyst agents each ask the API layer for the same reports, trades and
+articles for every ticker. A graph's prefetch node instead downloads what
+the selected analysts declare they read (planned by
+:func:`src.data.requirements.plan_requests`) once, concurrently, and stores
+one immutable :class:`DataBundle` per ticker in ``state["data"]["bundles"]``.
+Graph nodes wrapped with :func:`~src.data.providers.bind_data_provider` make
+those bundles active, and ``get_financial_metrics``, ``search_line_items``,
+``get_market_cap``, ``get_insider_trades`` and ``get_company_news`` answer
+from them before touching the cache or the network. A query a bundle does
+not cover (another end date, a larger limit, a field it did not fetch) goes
+down the usual path.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+from src.data.models import CompanyNews, FinancialMetrics, InsiderTrade, LineItem
+from src.data.requirements import DataRequirements
+
+
+@dataclass(frozen=True)
+class Fetched:
+    """Items returned by one prefetched request, newest first, and the limit it was made with."""
+
+    items: tuple
+    limit: int
+    fields: frozenset = frozenset()
+
+    def covers(self, limit: int) -> bool:
+        # A request that came back short holds everything there is
+        return limit <= self.limit or len(self.items) < self.limit
+
+
+@dataclass(frozen=True)
+class DataBundle:
+    """Prefetched data for one ticker as of ``end_date``."""
+
+    ticker: str
+    end_date: str
+    financial_metrics: Mapping[str, Fetched] = field(default_factory=lambda: MappingProxyType({}))
+    line_items: Mapping[str, Fetched] = field(default_factory=lambda: MappingProxyType({}))
+    insider_trades: Optional[Fetched] = None
+    company_news: Optional[tuple] = None
+    # First day from which company_news holds every article; None when it holds the whole archive
+    company_news_from: Optional[str] = None
+
+    def get_financial_metrics(self, end_date: str, period: str, limit: int) -> Optional[List[FinancialMetrics]]:
+        fetched = self.financial_metrics.get(period)
+        if end_date != self.end_date or fetched is None or not fetched.covers(limit):
+            return None
+        return list(fetched.items[:limit])
+
+    def search_line_items(self, line_items: List[str], end_date: str, period: str, limit: int) -> Optional[List[LineItem]]:
+        fetched = self.line_items.get(period)
+        if end_date != self.end_date or fetched is None or not fetched.covers(limit) or not fetched.fields.issuperset(line_items):
+            return None
+        fields = [*LineItem.model_fields, *line_items]
+        # Line items are not frozen, so each caller gets its own copies holding only the fields it asked for
+        return [LineItem(**{k: item.get(k) for k in fields}) for item in fetched.items[:limit]]
+
+    def get_insider_trades(self, end_date: str, start_date: Optional[str], limit: int) -> Optional[List[InsiderTrade]]:
+        fetched = self.insider_trades
+        if end_date != self.end_date or fetched is None:
+            return None
+        if start_date is None:
+            return list(fetched.items[:limit]) if fetched.covers(limit) else None
+        trades = [trade for trade in fetched.items if trade.filing_date[:10] >= start_date]
+        if len(trades) == len(fetched.items) == fetched.limit:
+            # Trades older than the bundle holds might still fall in the window
+            return None
+        return trades[:limit]
+
+    def get_company_news(self, end_date: str, start_date: Optional[str]) -> Optional[List[CompanyNews]]:
+        held = self.held_company_news(end_date)
+        if held is None:
+            return None
+        news, held_from = held
+        if held_from is not None and (start_date is None or start_date < held_from):
+            return None
+        if start_date is None:
+            return list(news)
+        return [item for item in news if item.date[:10] >= start_date]
+
+    def held_company_news(self, end_date: str) -> Optional[tuple[tuple, Optional[str]]]:
+        """Return the prefetched articles, newest first, and the first day they fully cover."""
+        if end_date != self.end_date or self.company_news is None:
+            return None
+        return self.company_news, self.company_news_from
+
+
+# Bundles of the run the current context belongs to, by ticker
+_active_bundles: contextvars.ContextVar[Mapping[str, DataBundle]] = contextvars.ContextVar("data_bundles", default=MappingProxyType({}))
+
+
+def get_data_bundle(ticker: str) -> Optional[DataBundle]:
+    """Return the active run's bundle for ``ticker``, if one was prefetched."""
+    return _active_bundles.get().get(ticker)
+
+
+@contextmanager
+def use_data_bundles(bundles: Optional[Mapping[str, DataBundle]]) -> Iterator[None]:
+    """Make ``bundles`` answer data queries in the calling context."""
+    token = _active_bundles.set(MappingProxyType(dict(bundles or {})))
+    try:
+        yield
+    finally:
+        _active_bundles.reset(token)
+
+
+async def _build_bundle(ticker: str, end_date: str, plan: DataRequirements, api_key: str | None, api_secret: str | None) -> DataBundle:
+    # The API layer imports this module to look bundles up, so it is imported on use
+    from src.tools import api_async
+
+    keys = dict(api_key=api_key, api_secret=api_secret)
+    requests = {
+        **{("financial_metrics", period): api_async.get_financial_metrics_async(ticker, end_date, period=period, limit=limit, **keys) for period, limit in plan.financial_metrics.items()},
+        **{("line_items", request.period): api_async.search_line_items_async(ticker, list(request.fields), end_date, period=request.period, limit=request.limit, **keys) for request in plan.line_items},
+    }
+    if plan.insider_trades:
+        requests[("insider_trades", None)] = api_async.get_insider_trades_async(ticker, end_date, limit=plan.insider_trades, **keys)
+    if plan.reads_news:
+        requests[("company_news", None)] = api_async.get_recent_company_news_async(ticker, end_date, lookback_days=plan.news_lookback_days, articles=plan.news_articles, **keys)
+    results: Dict[tuple, Any] = dict(zip(requests, await asyncio.gather(*requests.values(), return_exceptions=True)))
+    # A request that failed is left out, so agents fetch it themselves and see the error as before
+    ok = {key: value for key, value in results.items() if not isinstance(value, Exception)}
+    news, news_from = ok.get(("company_news", None), (None, None))
+    return DataBundle(
+        ticker=ticker,
+        end_date=end_date,
+        financial_metrics=MappingProxyType({period: Fetched(tuple(ok[("financial_metrics", period)]), limit) for period, limit in plan.financial_metrics.items() if ("financial_metrics", period) in ok}),
+        line_items=MappingProxyType(
+            {
+                request.period: Fetched(tuple(item.model_dump() for item in ok[("line_items", request.period)]), request.limit, frozenset(request.fields))
+                for request in plan.line_items
+                if ("line_items", request.period) in ok
+            }
+        ),
+        insider_trades=Fetched(tuple(ok[("insider_trades", None)]), plan.insider_trades) if ("insider_trades", None) in ok else None,
+        company_news=tuple(news) if news is not None else None,
+        company_news_from=news_from,
+    )
+
+
+async def build_data_bundles_async(tickers: List[str], end_date: str, plan: DataRequirements, api_key: str | None = None, api_secret: str | None = None) -> Dict[str, DataBundle]:
+    """Fetch the bundles of all tickers concurrently."""
+    bundles = await asyncio.gather(*(_build_bundle(ticker, end_date, plan, api_key, api_secret) for ticker in tickers))
+    return dict(zip(tickers, bundles))
+
+
+def build_data_bundles(tickers: List[str], end_date: str, plan: DataRequirements, api_key: str | None = None, api_secret: str | None = None) -> Dict[str, DataBundle]:
+    """Fetch the bundles of all tickers concurrently and wait for them."""
+    return asyncio.run(build_data_bundles_async(tickers, end_date, plan, api_key, api_secret))
+
+
+__all__ = [
+    "DataBundle",
+    "Fetched",
+    "build_data_bundles",
+    "build_data_bundles_async",
+    "get_data_bundle",
+    "use_data_bundles",
+]
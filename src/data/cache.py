@@ -1,71 +1,442 @@
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterator
+
+from pydantic import BaseModel
+
+from src.config import get_cache_config, get_http_config
+from src.data.disk_cache import DiskCache
+from src.data.history_store import HistoryStore
+from src.data.memory_store import MemoryStore
+from src.data.price_series import PriceSeries
+from src.data.sorted_rows import SortedRows
+
+# Several trades are often filed on one day, so a trade is identified by who traded what, when and how much
+INSIDER_TRADE_KEY = ("filing_date", "name", "transaction_date", "transaction_shares", "security_title")
+
+
 class Cache:
-    """In-memory cache for API responses."""
+    """In-memory cache for API responses, optionally backed by a persistent tier."""
+
+    def __init__(
+        self,
+        disk: DiskCache | None = None,
+        empty_ttl: float | None = None,
+        memory_max_bytes: dict[str, int] | None = None,
+        history: HistoryStore | None = None,
+        unsettled_ttl: float | None = None,
+    ):
+        self._disk = disk
+        # Price bars live in the memory-mapped history store when one is configured
+        self._history = history
+        self._empty_ttl = empty_ttl
+        # Coverage reaching into today is only trusted in memory for this long, as bars and articles are still arriving
+        self._unsettled_ttl = unsettled_ttl
+        # Guards read-merge-write updates when data is fetched from several threads
+        self._lock = threading.RLock()
+        self._memory_max_bytes = memory_max_bytes or {}
+        self._stores: dict[str, MemoryStore] = {}
+        self._prices_cache: MemoryStore = self._store("prices")
+        self._price_ranges: MemoryStore = self._store("price_ranges")
+        self._financial_metrics_cache: MemoryStore = self._store("financial_metrics")
+        # Every report per (ticker, period) for point-in-time lookups, and the date each download was made as of
+        self._metrics_history: MemoryStore = self._store("metrics_history")
+        self._metrics_coverage: MemoryStore = self._store("metrics_coverage")
+        self._line_items_cache: MemoryStore = self._store("line_items")
+        self._line_item_queries: MemoryStore = self._store("line_item_queries")
+        # "limits:dataset:ticker_period_end_date" -> limits already fetched for that query, so larger ones can serve smaller
+        self._query_limits: MemoryStore = self._store("query_limits")
+        self._insider_trades_cache: MemoryStore = self._store("insider_trades")
+        self._company_news_cache: MemoryStore = self._store("company_news")
+        self._news_ranges: MemoryStore = self._store("news_ranges")
+        # "dataset:ticker" -> time coverage past the last settled day was recorded
+        self._unsettled_at: MemoryStore = self._store("unsettled_at")
+        # Negative entries: "dataset:key" -> time the API returned nothing for it
+        self._empty_results: MemoryStore = self._store("empty_results")
+        self.empty_hits = 0
 
-    def __init__(self):
-        self._prices_cache: dict[str, list[dict[str, any]]] = {}
-        self._financial_metrics_cache: dict[str, list[dict[str, any]]] = {}
-        self._line_items_cache: dict[str, list[dict[str, any]]] = {}
-        self._insider_trades_cache: dict[str, list[dict[str, any]]] = {}
-        self._company_news_cache: dict[str, list[dict[str, any]]] = {}
+    def _store(self, dataset: str) -> MemoryStore:
+        """Create the in-memory tier for a dataset with its configured byte budget."""
+        store = MemoryStore(self._memory_max_bytes.get(dataset, self._memory_max_bytes.get("default")))
+        self._stores[dataset] = store
+        return store
 
-    def _merge_data(self, existing: list[dict] | None, new_data: list[dict], key_field: str) -> list[dict]:
-        """Merge existing and new data, avoiding duplicates based on a key field."""
-        if not existing:
-            return new_data
+    def memory_stats(self) -> dict[str, dict[str, int | None]]:
+        """Return entry counts, estimated bytes, budgets and evictions per in-memory dataset."""
+        return {dataset: store.stats() for dataset, store in self._stores.items()}
 
-        # Create a set of existing keys for O(1) lookup
-        existing_keys = {item[key_field] for item in existing}
+    def _get(self, dataset: str, store: MemoryStore, key: str) -> list[dict[str, any]] | None:
+        """Look up a key in memory first, then in the persistent tier."""
+        # One lookup, since another thread may evict the entry between a membership test and a read
+        data = store.get(key)
+        if data is not None:
+            return data
+        if self._disk is None:
+            return None
+        with self._lock:
+            data = self._disk.get(dataset, key)
+            if data is not None:
+                store[key] = data
+            return data
 
-        # Only add items that don't exist yet
-        merged = existing.copy()
-        merged.extend([item for item in new_data if item[key_field] not in existing_keys])
-        return merged
+    def _get_rows(self, dataset: str, store: MemoryStore, key: str, key_field: str, sort_field: str | None = None, model: type[BaseModel] | None = None) -> list | None:
+        """Look up a keyed row entry, loading it from the persistent tier into sorted storage.
 
-    def get_prices(self, ticker: str) -> list[dict[str, any]] | None:
+        With ``model`` the rows come back as validated instances of it, which
+        are built on the first such lookup and shared by later ones.
+        """
+        entry = store.get(key)
+        if entry is None:
+            if self._disk is None:
+                return None
+            with self._lock:
+                data = self._disk.get(dataset, key)
+                if data is None:
+                    return None
+                entry = store[key] = SortedRows(key_field, sort_field, data)
+        if model is None:
+            return entry.rows
+        if not entry.has_models:
+            with self._lock:
+                entry.models(model)
+                # Re-store so the memory tier accounts for the models
+                store[key] = entry
+        return entry.models(model)
+
+    def _set(self, dataset: str, store: MemoryStore, key: str, data: list[dict[str, any]], key_field: str, sort_field: str | None = None):
+        """Insert new rows into memory and write the merged entry through to disk."""
+        with self._lock:
+            self._get_rows(dataset, store, key, key_field, sort_field)
+            rows = store.get(key)
+            if rows is None:
+                rows = SortedRows(key_field, sort_field)
+            rows.add(data)
+            # Re-store so the memory tier accounts for the new size
+            store[key] = rows
+            if self._disk is not None:
+                self._disk.set(dataset, key, rows.rows)
+
+    def get_prices(self, ticker: str) -> PriceSeries | None:
         """Get cached price data if available."""
-        return self._prices_cache.get(ticker)
+        series = self._prices_cache.get(ticker)
+        if series is not None:
+            return series
+        with self._lock:
+            if self._history is not None:
+                series = self._history.read(ticker)
+            elif self._disk is not None:
+                data = self._disk.get("prices", ticker)
+                series = PriceSeries.from_bytes(data) if data is not None else None
+            else:
+                return None
+            if series is not None:
+                self._prices_cache[ticker] = series
+            return series
+
+    def set_prices(self, ticker: str, data: PriceSeries | list[dict[str, any]]):
+        """Merge new price data into the cached series for a ticker."""
+        if not isinstance(data, PriceSeries):
+            data = PriceSeries.from_rows(data)
+        with self._lock:
+            existing = self.get_prices(ticker)
+            if existing is not None and not len(data):
+                return
+            series = existing.merge(data) if existing is not None else data
+            if self._history is not None:
+                # Keep the mapped copy so the merged arrays are not also held on the heap
+                series = self._history.write(ticker, series)
+            elif self._disk is not None:
+                self._disk.set("prices", ticker, series.to_bytes())
+            self._prices_cache[ticker] = series
+
+    def get_price_ranges(self, ticker: str) -> list[list[str]]:
+        """Get the merged [start, end] date ranges already fetched for a ticker."""
+        if self.get_prices(ticker) is None:
+            # Bars expired or were evicted, so the recorded coverage is stale
+            return []
+        if self._history is not None:
+            ranges = self._price_ranges.get(ticker)
+            if ranges is None:
+                ranges = self._price_ranges[ticker] = self._history.read_ranges(ticker)
+            return self._expire_unsettled("price_ranges", self._price_ranges, ticker, ranges)
+        return self._expire_unsettled("price_ranges", self._price_ranges, ticker, self._get("price_ranges", self._price_ranges, ticker) or [])
+
+    def add_price_range(self, ticker: str, start_date: str, end_date: str):
+        """Record that all bars between start_date and end_date are cached."""
+        with self._lock:
+            self._add_range("price_ranges", self._price_ranges, ticker, self.get_price_ranges(ticker), start_date, end_date)
 
-    def set_prices(self, ticker: str, data: list[dict[str, any]]):
-        """Append new price data to cache."""
-        self._prices_cache[ticker] = self._merge_data(self._prices_cache.get(ticker), data, key_field="time")
+    def get_missing_price_ranges(self, ticker: str, start_date: str, end_date: str) -> list[tuple[str, str]]:
+        """Return the sub-ranges of [start_date, end_date] not yet covered by the cache."""
+        return _missing_ranges(self.get_price_ranges(ticker), start_date, end_date)
 
-    def get_financial_metrics(self, ticker: str) -> list[dict[str, any]]:
-        """Get cached financial metrics if available."""
-        return self._financial_metrics_cache.get(ticker)
+    def _add_range(self, dataset: str, store: MemoryStore, ticker: str, ranges: list[list[str]], start_date: str, end_date: str):
+        merged = store[ticker] = _merge_ranges(ranges + [[start_date, end_date]])
+        if end_date > _last_settled_day():
+            self._unsettled_at[f"{dataset}:{ticker}"] = time.time()
+        if dataset == "price_ranges" and self._history is not None:
+            self._history.write_ranges(ticker, _settled_ranges(merged))
+        elif self._disk is not None:
+            # Today's bars and articles are still arriving, so only settled days are persisted;
+            # the next run then refetches from the last settled day instead of the whole window
+            self._disk.set(dataset, ticker, _settled_ranges(merged))
+
+    def _expire_unsettled(self, dataset: str, store: MemoryStore, ticker: str, ranges: list[list[str]]) -> list[list[str]]:
+        """Clip coverage back to settled days once its unsettled tail is older than the unsettled TTL."""
+        entry = f"{dataset}:{ticker}"
+        recorded_at = self._unsettled_at.get(entry)
+        if recorded_at is None or self._unsettled_ttl is None or time.time() - recorded_at <= self._unsettled_ttl:
+            return ranges
+        with self._lock:
+            self._unsettled_at.pop(entry, None)
+            ranges = store[ticker] = _settled_ranges(ranges)
+        return ranges
+
+    def get_financial_metrics(self, ticker: str, model: type[BaseModel] | None = None) -> list | None:
+        """Get cached financial metrics, oldest report first, as dicts or shared ``model`` instances."""
+        return self._get_rows("financial_metrics", self._financial_metrics_cache, ticker, key_field="report_period", model=model)
 
     def set_financial_metrics(self, ticker: str, data: list[dict[str, any]]):
         """Append new financial metrics to cache."""
-        self._financial_metrics_cache[ticker] = self._merge_data(self._financial_metrics_cache.get(ticker), data, key_field="report_period")
+        self._set("financial_metrics", self._financial_metrics_cache, ticker, data, key_field="report_period")
+
+    def get_metrics_history(self, ticker: str, period: str, model: type[BaseModel] | None = None) -> tuple[list, dict[str, any]] | None:
+        """Get every cached report for a ticker and period, oldest first, with its coverage.
+
+        The coverage holds ``as_of``, the date the reports were downloaded as
+        of, and ``complete``, which is True when the download held the
+        ticker's whole reporting history rather than only the newest reports.
+        Rows come back as dicts, or as shared ``model`` instances.
+        """
+        key = f"{ticker}_{period}"
+        coverage = self._get("financial_metrics", self._metrics_coverage, f"coverage:{key}")
+        if coverage is None:
+            return None
+        rows = self._get_rows("financial_metrics", self._metrics_history, f"history:{key}", key_field="report_period", model=model)
+        if rows is None:
+            return None
+        return rows, coverage
+
+    def set_metrics_history(self, ticker: str, period: str, data: list[dict[str, any]], as_of: str, complete: bool):
+        """Merge a bulk download of reports into a ticker's history and record its coverage."""
+        key = f"{ticker}_{period}"
+        with self._lock:
+            self._set("financial_metrics", self._metrics_history, f"history:{key}", data, key_field="report_period")
+            coverage = self._metrics_coverage[f"coverage:{key}"] = {"as_of": as_of, "complete": complete}
+            if self._disk is not None:
+                self._disk.set("financial_metrics", f"coverage:{key}", coverage)
 
     def get_line_items(self, ticker: str) -> list[dict[str, any]] | None:
         """Get cached line items if available."""
-        return self._line_items_cache.get(ticker)
+        return self._get("line_items", self._line_items_cache, ticker)
 
     def set_line_items(self, ticker: str, data: list[dict[str, any]]):
-        """Append new line items to cache."""
-        self._line_items_cache[ticker] = self._merge_data(self._line_items_cache.get(ticker), data, key_field="report_period")
+        """Merge line items into cache, combining fields reported for the same (period, report_period)."""
+        with self._lock:
+            rows = {(item["period"], item["report_period"]): item for item in self.get_line_items(ticker) or []}
+            for item in data:
+                key = (item["period"], item["report_period"])
+                rows[key] = {**rows.get(key, {}), **item}
+            merged = self._line_items_cache[ticker] = list(rows.values())
+            if self._disk is not None:
+                self._disk.set("line_items", ticker, merged)
+
+    def get_line_item_query(self, ticker: str, period: str, end_date: str, limit: int) -> dict[str, list[str]] | None:
+        """Get the report periods and fields already fetched for a line item query."""
+        key = f"{ticker}_{period}_{end_date}_{limit}"
+        query = self._line_item_queries.get(key)
+        if query is not None:
+            return query
+        if self._disk is None:
+            return None
+        with self._lock:
+            query = self._disk.get("line_items", f"query:{key}")
+            if query is not None:
+                self._line_item_queries[key] = query
+            return query
 
-    def get_insider_trades(self, ticker: str) -> list[dict[str, any]] | None:
-        """Get cached insider trades if available."""
-        return self._insider_trades_cache.get(ticker)
+    def set_line_item_query(self, ticker: str, period: str, end_date: str, limit: int, report_periods: list[str], fields: list[str]):
+        """Record which report periods a line item query returned and which fields are cached for them."""
+        key = f"{ticker}_{period}_{end_date}_{limit}"
+        with self._lock:
+            query = self._line_item_queries[key] = {"report_periods": report_periods, "fields": fields}
+            if self._disk is not None:
+                self._disk.set("line_items", f"query:{key}", query)
+
+    def get_query_limits(self, dataset: str, key: str) -> list[int]:
+        """Get the limits already fetched for a ``ticker_period_end_date`` query, smallest first."""
+        return self._get(dataset, self._query_limits, f"limits:{dataset}:{key}") or []
+
+    def add_query_limit(self, dataset: str, key: str, limit: int):
+        """Record that a query was fetched with ``limit``."""
+        with self._lock:
+            limits = sorted({*self.get_query_limits(dataset, key), limit})
+            self._query_limits[f"limits:{dataset}:{key}"] = limits
+            if self._disk is not None:
+                self._disk.set(dataset, f"limits:{dataset}:{key}", limits)
+
+    def get_insider_trades(self, ticker: str, model: type[BaseModel] | None = None) -> list | None:
+        """Get cached insider trades, oldest filing first, as dicts or shared ``model`` instances."""
+        return self._get_rows("insider_trades", self._insider_trades_cache, ticker, key_field=INSIDER_TRADE_KEY, sort_field="filing_date", model=model)
 
     def set_insider_trades(self, ticker: str, data: list[dict[str, any]]):
         """Append new insider trades to cache."""
-        self._insider_trades_cache[ticker] = self._merge_data(self._insider_trades_cache.get(ticker), data, key_field="filing_date")  # Could also use transaction_date if preferred
+        self._set("insider_trades", self._insider_trades_cache, ticker, data, key_field=INSIDER_TRADE_KEY, sort_field="filing_date")
 
-    def get_company_news(self, ticker: str) -> list[dict[str, any]] | None:
-        """Get cached company news if available."""
-        return self._company_news_cache.get(ticker)
+    def get_company_news(self, ticker: str, model: type[BaseModel] | None = None) -> list | None:
+        """Get the cached news history for a ticker, oldest article first, as dicts or shared ``model`` instances."""
+        return self._get_rows("company_news", self._company_news_cache, ticker, key_field="url", sort_field="date", model=model)
 
     def set_company_news(self, ticker: str, data: list[dict[str, any]]):
-        """Append new company news to cache."""
-        self._company_news_cache[ticker] = self._merge_data(self._company_news_cache.get(ticker), data, key_field="date")
+        """Append new articles to a ticker's cached news history."""
+        self._set("company_news", self._company_news_cache, ticker, data, key_field="url", sort_field="date")
+
+    def get_news_ranges(self, ticker: str) -> list[list[str]]:
+        """Get the merged [start, end] date ranges of news already fetched for a ticker."""
+        if self.get_company_news(ticker) is None:
+            # Articles expired or were evicted, so the recorded coverage is stale
+            return []
+        return self._expire_unsettled("news_ranges", self._news_ranges, ticker, self._get("news_ranges", self._news_ranges, ticker) or [])
+
+    def add_news_range(self, ticker: str, start_date: str, end_date: str):
+        """Record that all articles between start_date and end_date are cached."""
+        with self._lock:
+            self._add_range("news_ranges", self._news_ranges, ticker, self.get_news_ranges(ticker), start_date, end_date)
+
+    def get_missing_news_ranges(self, ticker: str, start_date: str, end_date: str) -> list[tuple[str, str]]:
+        """Return the sub-ranges of [start_date, end_date] with no cached news coverage."""
+        return _missing_ranges(self.get_news_ranges(ticker), start_date, end_date)
+
+    def is_empty(self, dataset: str, key: str) -> bool:
+        """Return True if the API recently returned nothing for this key."""
+        entry = f"{dataset}:{key}"
+        recorded_at = self._empty_results.get(entry)
+        if recorded_at is None and self._disk is not None:
+            recorded_at = self._disk.get("empty_results", entry)
+        if recorded_at is None or (self._empty_ttl is not None and time.time() - recorded_at > self._empty_ttl):
+            self._empty_results.pop(entry, None)
+            return False
+        with self._lock:
+            self._empty_results[entry] = recorded_at
+            self.empty_hits += 1
+        return True
+
+    def set_empty(self, dataset: str, key: str):
+        """Record that the API returned nothing for this key."""
+        entry = f"{dataset}:{key}"
+        now = time.time()
+        with self._lock:
+            self._empty_results[entry] = now
+            if self._disk is not None:
+                self._disk.set("empty_results", entry, now)
+
+    @contextmanager
+    def lease(self, name: str, *entries: tuple[str, str]) -> Iterator[None]:
+        """Serialize fetching an entry across the processes sharing the persistent tier.
+
+        ``entries`` are the ``(dataset, key)`` pairs the fetch fills, where the
+        dataset names an in-memory store (see :meth:`memory_stats`). Once the
+        lease is held their in-memory copies are dropped so the caller's
+        re-check reads whatever another process stored meanwhile; entries of
+        other datasets sharing a key are kept. Without a persistent tier this
+        is a no-op.
+        """
+        if self._disk is None:
+            yield
+            return
+        with self._disk.lease(name):
+            with self._lock:
+                for dataset, key in entries:
+                    self._stores[dataset].pop(key, None)
+            yield
+
+    def empty_stats(self) -> dict[str, int]:
+        """Return how many negative entries are held and how many lookups they answered."""
+        with self._lock:
+            return {"entries": len(self._empty_results), "hits": self.empty_hits}
+
+
+def _merge_ranges(ranges: list[list[str]]) -> list[list[str]]:
+    """Sort date ranges and merge those that overlap or touch."""
+    merged: list[list[str]] = []
+    for start, end in sorted(ranges):
+        if merged and date.fromisoformat(start) <= date.fromisoformat(merged[-1][1]) + timedelta(days=1):
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def _last_settled_day() -> str:
+    """Return yesterday (UTC), the last day whose bars and articles are complete."""
+    return (datetime.now(timezone.utc).date() - timedelta(days=1)).isoformat()
+
+
+def _settled_ranges(ranges: list[list[str]]) -> list[list[str]]:
+    """Clip ranges so none extends past yesterday (UTC)."""
+    last_settled = _last_settled_day()
+    return [[start, min(end, last_settled)] for start, end in ranges if start <= last_settled]
+
+
+def _missing_ranges(ranges: list[list[str]], start_date: str, end_date: str) -> list[tuple[str, str]]:
+    """Return the sub-ranges of [start_date, end_date] not covered by sorted, merged ranges."""
+    missing = []
+    cursor = date.fromisoformat(start_date)
+    last = date.fromisoformat(end_date)
+    for range_start, range_end in ranges:
+        covered_start, covered_end = date.fromisoformat(range_start), date.fromisoformat(range_end)
+        if covered_end < cursor:
+            continue
+        if covered_start > last:
+            break
+        if covered_start > cursor:
+            missing.append((cursor.isoformat(), (covered_start - timedelta(days=1)).isoformat()))
+        cursor = covered_end + timedelta(days=1)
+        if cursor > last:
+            return missing
+    missing.append((cursor.isoformat(), last.isoformat()))
+    return missing
+
+
+def _archiving() -> bool:
+    # Recording or replaying an HTTP archive needs every request to reach the archive, so nothing may be answered from disk
+    return bool(get_http_config()["archive_mode"])
+
+
+def _create_disk_cache() -> DiskCache | None:
+    """Build the persistent tier from config, or None if it is disabled."""
+    cache_cfg = get_cache_config()
+    if not cache_cfg["enabled"] or _archiving():
+        return None
+    return DiskCache(cache_cfg["path"], max_bytes=cache_cfg["max_bytes"], ttls=cache_cfg["ttl"])
+
+
+def _create_history_store() -> HistoryStore | None:
+    """Build the memory-mapped price history store from config, or None if it is disabled."""
+    cache_cfg = get_cache_config()
+    if not cache_cfg["enabled"] or not cache_cfg["history_path"] or _archiving():
+        return None
+    return HistoryStore(cache_cfg["history_path"], max_bytes=cache_cfg["history_max_bytes"])
 
 
 # Global cache instance
-_cache = Cache()
+_cache = Cache(
+    disk=_create_disk_cache(),
+    empty_ttl=get_cache_config()["ttl"].get("empty_results"),
+    memory_max_bytes=get_cache_config()["memory_max_bytes"],
+    history=_create_history_store(),
+    unsettled_ttl=get_cache_config()["ttl"].get("unsettled_ranges"),
+)
 
 
 def get_cache() -> Cache:
     """Get the global cache instance."""
     return _cache
+
+
+def create_memory_cache() -> Cache:
+    """Build a cache with the configured memory budgets and no persistent tier."""
+    cache_cfg = get_cache_config()
+    return Cache(empty_ttl=cache_cfg["ttl"].get("empty_results"), memory_max_bytes=cache_cfg["memory_max_bytes"], unsettled_ttl=cache_cfg["ttl"].get("unsettled_ranges"))
@@ -0,0 +1,211 @@
+"""Persistent SQLite tier for the API response cache.
+
+Entries are stored per ``(dataset, key)`` together with their size and
+timestamps, either as zlib-compressed JSON or, for values that are already
+serialized (such as columnar price arrays), as raw bytes. Each dataset has
+its own TTL, and the total size of the database is kept under a byte budget
+by evicting the least recently used entries first.
+
+The database runs in WAL mode with one connection per thread (closed when
+the thread exits, so short-lived worker pools do not leak them), so several
+processes on one host (uvicorn workers, parallel backtests) can share it:
+readers never block each other or the writer, and writers wait on
+``busy_timeout`` instead of failing. Leases stored in the same database let
+those processes agree on who downloads a missing entry.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+import weakref
+import zlib
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+# Reads refresh an entry's LRU timestamp at most this often, so hot keys do not turn every read into a write
+_TOUCH_INTERVAL = 1.0
+
+
+class DiskCache:
+    """SQLite-backed cache tier with per-dataset TTLs and LRU eviction."""
+
+    def __init__(self, db_path: str, max_bytes: int, ttls: Optional[Dict[str, float]] = None, busy_timeout: float = 30.0) -> None:
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.ttls = ttls or {}
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._conns: set[sqlite3.Connection] = set()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        # Opened lazily, one per thread, so importing the cache never touches the filesystem
+        holder = getattr(self._local, "holder", None)
+        if holder is not None:
+            return holder.conn
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                dataset TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (dataset, key)
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed ON cache_entries (accessed_at)")
+        conn.execute("CREATE TABLE IF NOT EXISTS cache_leases (name TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)")
+        conn.commit()
+        holder = self._local.holder = _ThreadConnection(conn)
+        with self._lock:
+            self._conns.add(conn)
+        # Thread-local values are dropped when their thread exits, which closes the connection
+        weakref.finalize(holder, _close_conn, self._conns, self._lock, conn)
+        return conn
+
+    def get(self, dataset: str, key: str) -> Any | None:
+        """Return the stored value, or None if it is missing or expired."""
+        now = time.time()
+        conn = self._get_conn()
+        row = conn.execute(
+            "SELECT value, created_at, accessed_at FROM cache_entries WHERE dataset = ? AND key = ?",
+            (dataset, key),
+        ).fetchone()
+        if row is None:
+            return None
+        value, created_at, accessed_at = row
+        ttl = self.ttls.get(dataset)
+        if ttl is not None and now - created_at > ttl:
+            conn.execute("DELETE FROM cache_entries WHERE dataset = ? AND key = ? AND created_at = ?", (dataset, key, created_at))
+            conn.commit()
+            return None
+        if now - accessed_at > _TOUCH_INTERVAL:
+            conn.execute(
+                "UPDATE cache_entries SET accessed_at = ? WHERE dataset = ? AND key = ?",
+                (now, dataset, key),
+            )
+            conn.commit()
+        return _decode(value)
+
+    def set(self, dataset: str, key: str, value: Any) -> None:
+        """Store a JSON-serializable value or raw bytes and evict old entries if over budget."""
+        blob = _encode(value)
+        now = time.time()
+        conn = self._get_conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (dataset, key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (dataset, key, blob, len(blob), now, now),
+            )
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least recently used entries until the byte budget is met."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = conn.execute("SELECT dataset, key, size FROM cache_entries ORDER BY accessed_at").fetchall()
+        for dataset, key, size in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM cache_entries WHERE dataset = ? AND key = ?", (dataset, key))
+            total -= size
+
+    def clear(self) -> None:
+        """Remove every entry from the persistent tier."""
+        conn = self._get_conn()
+        with conn:
+            conn.execute("DELETE FROM cache_entries")
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return entry counts and stored bytes per dataset."""
+        rows = self._get_conn().execute("SELECT dataset, COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries GROUP BY dataset").fetchall()
+        return {dataset: {"entries": count, "bytes": size} for dataset, count, size in rows}
+
+    def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        """Try to take a named lease; an expired lease left by a crashed holder is taken over."""
+        now = time.time()
+        conn = self._get_conn()
+        with conn:
+            conn.execute("DELETE FROM cache_leases WHERE name = ? AND expires_at < ?", (name, now))
+            cursor = conn.execute("INSERT OR IGNORE INTO cache_leases (name, owner, expires_at) VALUES (?, ?, ?)", (name, owner, now + ttl))
+        return cursor.rowcount == 1
+
+    def release_lease(self, name: str, owner: str) -> None:
+        conn = self._get_conn()
+        with conn:
+            conn.execute("DELETE FROM cache_leases WHERE name = ? AND owner = ?", (name, owner))
+
+    @contextmanager
+    def lease(self, name: str, ttl: float = 300.0, poll_interval: float = 0.05) -> Iterator[None]:
+        """Hold a named lease shared by every process using this database.
+
+        Blocks while another holder has it, so of several processes missing
+        the same entry only one downloads it and the others find it stored
+        when they get their turn. The lease expires after ``ttl`` seconds in
+        case its holder dies.
+        """
+        owner = uuid.uuid4().hex
+        while not self.acquire_lease(name, owner, ttl):
+            time.sleep(poll_interval)
+        try:
+            yield
+        finally:
+            self.release_lease(name, owner)
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._conns:
+                conn.close()
+            self._conns.clear()
+        self._local = threading.local()
+
+
+class _ThreadConnection:
+    """Holds one thread's connection, so its lifetime can be tied to the thread's."""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+
+def _close_conn(conns: set, lock: threading.Lock, conn: sqlite3.Connection) -> None:
+    with lock:
+        conns.discard(conn)
+    conn.close()
+
+
+# Blobs carry a one-byte tag so raw and JSON values can share the table
+_RAW_TAG = b"R"
+_JSON_TAG = b"J"
+
+
+def _encode(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return _RAW_TAG + value
+    return _JSON_TAG + zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+
+def _decode(blob: bytes) -> Any:
+    tag, payload = blob[:1], blob[1:]
+    if tag == _RAW_TAG:
+        return payload
+    if tag == _JSON_TAG:
+        return json.loads(zlib.decompress(payload))
+    # Entries written before values were tagged
+    return json.loads(zlib.decompress(blob))
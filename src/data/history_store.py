@@ -0,0 +1,165 @@
+"""Memory-mapped on-disk store for daily price history.
+
+Each ticker gets a directory holding one ``.npy`` file per column of its
+:class:`~src.data.price_series.PriceSeries`. Reads map those files with
+``mmap_mode="r"``, so opening a ticker costs a few syscalls instead of a
+decode, the bars stay in the OS page cache shared by every process, and
+date slices handed to indicator code are views into the mapping.
+
+Writes go to a fresh version directory and then atomically repoint the
+ticker's ``current`` file at it, so readers in other processes always see a
+complete set of columns. The covered date ranges are kept next to the data
+in ``ranges.json``.
+
+The store is not counted against the SQLite cache's ``max_bytes``; it has its
+own byte budget, and once a write takes it over budget the least recently
+read or written tickers are removed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from typing import Optional
+
+import numpy as np
+
+from src.data.price_series import PriceSeries
+
+
+class HistoryStore:
+    """Directory of per-ticker, per-column ``.npy`` files read through memory maps."""
+
+    def __init__(self, root: str, max_bytes: Optional[int] = None) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        # Bytes this process believes are stored; scanned on the first write and corrected on eviction
+        self._bytes: Optional[int] = None
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def _ticker_dir(self, ticker: str) -> str:
+        return os.path.join(self.root, ticker.upper())
+
+    def read(self, ticker: str) -> Optional[PriceSeries]:
+        """Map a ticker's stored bars, or return None if it has none."""
+        ticker_dir = self._ticker_dir(ticker)
+        try:
+            with open(os.path.join(ticker_dir, "current")) as f:
+                series = self._map(os.path.join(ticker_dir, f.read().strip()))
+            # The directory's mtime records when the ticker was last used, for eviction
+            os.utime(ticker_dir)
+            return series
+        except FileNotFoundError:
+            pass
+        # A concurrent writer may have removed the version "current" pointed at; fall back to the newest one
+        versions = sorted(os.listdir(ticker_dir)) if os.path.isdir(ticker_dir) else []
+        for version in reversed(versions):
+            try:
+                return self._map(os.path.join(ticker_dir, version))
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+        return None
+
+    def _map(self, version_dir: str) -> PriceSeries:
+        return PriceSeries(*(np.load(os.path.join(version_dir, f"{name}.npy"), mmap_mode="r") for name in PriceSeries.__slots__))
+
+    def write(self, ticker: str, series: PriceSeries) -> PriceSeries:
+        """Store a ticker's full series and return it re-mapped from disk."""
+        ticker_dir = self._ticker_dir(ticker)
+        version = f"{time.time_ns()}-{uuid.uuid4().hex[:8]}"
+        version_dir = os.path.join(ticker_dir, version)
+        os.makedirs(version_dir)
+        for name in PriceSeries.__slots__:
+            np.save(os.path.join(version_dir, f"{name}.npy"), np.ascontiguousarray(getattr(series, name)))
+        _replace_text(os.path.join(ticker_dir, "current"), version)
+        removed = self._remove_old_versions(ticker_dir, keep=version)
+        self._account(_dir_bytes(version_dir) - removed, keep=ticker_dir)
+        return self.read(ticker)
+
+    def _remove_old_versions(self, ticker_dir: str, keep: str) -> int:
+        # Only older versions are removed, so a concurrent writer's newer version survives.
+        # Processes that still map an old version keep reading it; the files vanish once they are unmapped
+        removed = 0
+        for entry in os.listdir(ticker_dir):
+            path = os.path.join(ticker_dir, entry)
+            if entry < keep and os.path.isdir(path):
+                removed += _dir_bytes(path)
+                shutil.rmtree(path, ignore_errors=True)
+        return removed
+
+    def _account(self, added: int, keep: str) -> None:
+        """Add a write's bytes to the running total and evict once it exceeds the budget."""
+        if self.max_bytes is None:
+            return
+        with self._lock:
+            if self._bytes is None:
+                self._bytes = sum(_dir_bytes(entry.path) for entry in os.scandir(self.root) if entry.is_dir())
+            else:
+                self._bytes += added
+            if self._bytes > self.max_bytes:
+                self._evict(keep)
+
+    def _evict(self, keep: str) -> None:
+        # Rescan, since other processes write to the same directory, then drop least recently used tickers
+        usage = [(entry.stat().st_mtime, entry.path, _dir_bytes(entry.path)) for entry in os.scandir(self.root) if entry.is_dir()]
+        total = sum(size for _, _, size in usage)
+        for _, path, size in sorted(usage):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            self.evictions += 1
+        self._bytes = total
+
+    def stats(self) -> dict[str, Optional[int]]:
+        """Return the bytes stored as last counted by this process, the budget and evictions."""
+        with self._lock:
+            return {"bytes": self._bytes, "max_bytes": self.max_bytes, "evictions": self.evictions}
+
+    def read_ranges(self, ticker: str) -> list[list[str]]:
+        """Return the [start, end] date ranges recorded as fully stored for a ticker."""
+        try:
+            with open(os.path.join(self._ticker_dir(ticker), "ranges.json")) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+
+    def write_ranges(self, ticker: str, ranges: list[list[str]]) -> None:
+        _replace_text(os.path.join(self._ticker_dir(ticker), "ranges.json"), json.dumps(ranges))
+
+    def tickers(self) -> list[str]:
+        """Return every ticker with stored bars."""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(entry for entry in os.listdir(self.root) if os.path.exists(os.path.join(self.root, entry, "current")))
+
+
+def _dir_bytes(path: str) -> int:
+    """Return the total size of the files under a directory, skipping any removed meanwhile."""
+    total = 0
+    for dirpath, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, name))
+            except FileNotFoundError:
+                pass
+    return total
+
+
+def _replace_text(path: str, text: str) -> None:
+    """Atomically replace a small text file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+__all__ = ["HistoryStore"]
@@ -0,0 +1,106 @@
+"""Byte-budgeted in-memory tier for the API response cache.
+
+:class:`MemoryStore` is a dict-like LRU map that estimates the size of every
+value it holds and evicts the least recently used keys once the total goes
+over its byte budget. :class:`~src.data.cache.Cache` keeps one store per
+dataset, so a burst of news cannot push price history out of memory.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterator, Optional
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the memory held by a cached value.
+
+    Objects exposing ``nbytes`` (such as price series) report their own size;
+    lists and dicts are walked so nested rows are counted.
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes + sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sys.getsizeof(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class MemoryStore:
+    """LRU mapping that evicts entries to stay under a byte budget."""
+
+    def __init__(self, max_bytes: Optional[int] = None) -> None:
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self.bytes = 0
+        self.evictions = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._entries))
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._entries[key]
+            self._entries.move_to_end(key)
+            return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        size = estimate_size(value)
+        with self._lock:
+            self.bytes += size - self._sizes.get(key, 0)
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._sizes[key] = size
+            self._evict()
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self.bytes -= self._sizes.pop(key)
+            return self._entries.pop(key)
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the byte budget is met.
+
+        The newest entry is always kept, even if it alone exceeds the budget,
+        so the caller that just stored it can still read it back.
+        """
+        if self.max_bytes is None:
+            return
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            key, _ = self._entries.popitem(last=False)
+            self.bytes -= self._sizes.pop(key)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, Optional[int]]:
+        """Return the entry count, estimated bytes, budget and eviction count."""
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self.bytes, "max_bytes": self.max_bytes, "evictions": self.evictions}
+
+
+__all__ = ["MemoryStore", "estimate_size"]
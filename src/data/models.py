@@ -16,6 +16,9 @@ class PriceResponse(BaseModel):
 
 
 class FinancialMetrics(BaseModel):
+    # Cache hits hand out shared instances, so they must not be modified
+    model_config = {"frozen": True}
+
     ticker: str
     report_period: str
     period: str
@@ -80,6 +83,8 @@ class LineItemResponse(BaseModel):
 
 
 class InsiderTrade(BaseModel):
+    model_config = {"frozen": True}
+
     ticker: str
     issuer: str | None
     name: str | None
@@ -100,6 +105,8 @@ class InsiderTradeResponse(BaseModel):
 
 
 class CompanyNews(BaseModel):
+    model_config = {"frozen": True}
+
     ticker: str
     title: str
     author: str
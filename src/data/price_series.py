@@ -0,0 +1,133 @@
+"""Columnar, array-backed daily price history.
+
+:class:`PriceSeries` holds bars as parallel NumPy arrays sorted by time:
+int64 UTC epoch nanoseconds, float64 open/high/low/close and int64 volume.
+It is the cache's native representation for prices, so date-window reads
+are binary-search slices (views, not copies) and DataFrames are built
+directly from the arrays without round-tripping through dicts.
+"""
+
+from __future__ import annotations
+
+import io
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+from pydantic import TypeAdapter
+
+from src.data.models import Price
+
+_NS_PER_DAY = 86_400 * 1_000_000_000
+_FLOAT_COLUMNS = ("open", "close", "high", "low")
+_PRICE_LIST = TypeAdapter(list[Price])
+
+
+class PriceSeries:
+    """Time-sorted OHLCV bars stored column by column."""
+
+    __slots__ = ("time", "open", "close", "high", "low", "volume")
+
+    def __init__(self, time: np.ndarray, open: np.ndarray, close: np.ndarray, high: np.ndarray, low: np.ndarray, volume: np.ndarray):
+        self.time = time
+        self.open = open
+        self.close = close
+        self.high = high
+        self.low = low
+        self.volume = volume
+
+    @classmethod
+    def empty(cls) -> "PriceSeries":
+        floats = np.empty(0, dtype=np.float64)
+        return cls(np.empty(0, dtype=np.int64), floats, floats, floats, floats, np.empty(0, dtype=np.int64))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> "PriceSeries":
+        """Build a series from ``Price``-shaped dicts, sorting and de-duplicating by time."""
+        rows = list(rows)
+        if not rows:
+            return cls.empty()
+        series = cls(
+            pd.to_datetime([row["time"] for row in rows], utc=True, format="ISO8601").asi8.astype(np.int64),
+            *(np.fromiter((row[col] for row in rows), dtype=np.float64, count=len(rows)) for col in _FLOAT_COLUMNS),
+            np.fromiter((row["volume"] for row in rows), dtype=np.int64, count=len(rows)),
+        )
+        return series._normalized()
+
+    @classmethod
+    def from_prices(cls, prices: Iterable[Price]) -> "PriceSeries":
+        return cls.from_rows(p.model_dump() for p in prices)
+
+    def _columns(self) -> tuple[np.ndarray, ...]:
+        return self.time, self.open, self.close, self.high, self.low, self.volume
+
+    def _normalized(self) -> "PriceSeries":
+        """Sort by time and keep the last occurrence of each timestamp."""
+        if len(self.time) < 2 or (np.diff(self.time) > 0).all():
+            return self
+        order = np.argsort(self.time, kind="stable")
+        sorted_time = self.time[order]
+        keep = np.append(sorted_time[1:] != sorted_time[:-1], True)
+        index = order[keep]
+        return PriceSeries(*(column[index] for column in self._columns()))
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held on the heap; columns memory-mapped from a file are not counted."""
+        return sum(column.nbytes for column in self._columns() if not isinstance(column, np.memmap))
+
+    def merge(self, other: "PriceSeries") -> "PriceSeries":
+        """Return the union of two series; bars in ``other`` win on equal timestamps."""
+        if not len(other):
+            return self
+        if not len(self):
+            return other
+        if self.time[-1] < other.time[0]:
+            # Appending newer bars needs no re-sort
+            return PriceSeries(*(np.concatenate(pair) for pair in zip(self._columns(), other._columns())))
+        return PriceSeries(*(np.concatenate(pair) for pair in zip(self._columns(), other._columns())))._normalized()
+
+    def slice_dates(self, start_date: str, end_date: str) -> "PriceSeries":
+        """Return the bars whose UTC date falls in [start_date, end_date] as array views."""
+        start = np.datetime64(start_date, "D").astype("datetime64[ns]").astype(np.int64)
+        stop = np.datetime64(end_date, "D").astype("datetime64[ns]").astype(np.int64) + _NS_PER_DAY
+        lo, hi = np.searchsorted(self.time, [start, stop], side="left")
+        return PriceSeries(*(column[lo:hi] for column in self._columns()))
+
+    def time_strings(self) -> list[str]:
+        return np.datetime_as_string(self.time.view("datetime64[ns]"), unit="s", timezone="UTC").tolist()
+
+    def to_rows(self) -> list[dict]:
+        return [
+            {"open": o, "close": c, "high": h, "low": l, "volume": v, "time": t}
+            for o, c, h, l, v, t in zip(self.open.tolist(), self.close.tolist(), self.high.tolist(), self.low.tolist(), self.volume.tolist(), self.time_strings())
+        ]
+
+    def to_prices(self) -> list[Price]:
+        # One list validation is cheaper than constructing each bar's model separately
+        return _PRICE_LIST.validate_python(self.to_rows())
+
+    def to_df(self) -> pd.DataFrame:
+        """Build a DataFrame indexed by UTC timestamp directly over the column arrays."""
+        index = pd.DatetimeIndex(self.time.view("datetime64[ns]"), name="Date").tz_localize("UTC")
+        return pd.DataFrame(
+            {"open": self.open, "close": self.close, "high": self.high, "low": self.low, "volume": self.volume},
+            index=index,
+            copy=False,
+        )
+
+    def to_bytes(self) -> bytes:
+        buffer = io.BytesIO()
+        np.savez(buffer, **dict(zip(self.__slots__, self._columns())))
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PriceSeries":
+        with np.load(io.BytesIO(data), allow_pickle=False) as arrays:
+            return cls(*(arrays[name] for name in cls.__slots__))
+
+
+__all__ = ["PriceSeries"]
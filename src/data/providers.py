@@ -0,0 +1,286 @@
+"""Market data providers behind the cached functions in ``src.tools.api``.
+
+A :class:`DataProvider` answers the raw requests (prices, financial metrics,
+line items, insider trades and news) that the API layer makes on a cache
+miss. :class:`AlpacaDataProvider` calls Alpaca's HTTP endpoints and
+:class:`LocalDataProvider` reads CSV, Parquet or JSON files from a directory,
+so agents and backtests can run offline against a fixed snapshot.
+
+The provider is selected by the ``data.provider`` setting and can be switched
+for one run by putting ``"data_provider"`` in the graph state's ``metadata``;
+graph nodes wrapped with :func:`bind_data_provider` make it active, together
+with the run's prefetched data bundles (see :mod:`src.data.bundle`), while
+they run.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+from src.config import get_data_config
+from src.data.bundle import use_data_bundles
+from src.data.cache import Cache, create_memory_cache
+from src.data.models import CompanyNews, FinancialMetrics, InsiderTrade, LineItem
+from src.data.price_series import PriceSeries
+
+
+class DataProvider(ABC):
+    """Source of market and fundamentals data for the API layer.
+
+    ``cache`` is the response cache the API layer uses for this provider; a
+    provider returning None shares the process-wide cache.
+    """
+
+    name: str = ""
+    cache: Optional[Cache] = None
+
+    @abstractmethod
+    def fetch_prices(self, ticker: str, start_date: str, end_date: str, api_key: str | None = None, api_secret: str | None = None) -> PriceSeries:
+        """Return daily bars for one ticker between two dates, inclusive."""
+
+    def fetch_prices_batch(self, tickers: List[str], start_date: str, end_date: str, api_key: str | None = None, api_secret: str | None = None) -> Dict[str, PriceSeries]:
+        """Return daily bars for several tickers; providers with a bulk endpoint override this."""
+        return {ticker: self.fetch_prices(ticker, start_date, end_date, api_key, api_secret) for ticker in tickers}
+
+    @abstractmethod
+    def fetch_financial_metrics(self, ticker: str, end_date: str | None, period: str, limit: int, api_key: str | None = None, api_secret: str | None = None) -> List[FinancialMetrics]:
+        """Return up to ``limit`` reports for ``period`` ending on or before ``end_date`` (the newest ones when it is None)."""
+
+    @abstractmethod
+    def fetch_line_items(self, ticker: str, line_items: List[str], end_date: str, period: str, limit: int, api_key: str | None = None, api_secret: str | None = None) -> List[Dict[str, Any]]:
+        """Return report rows holding the base line item fields plus ``line_items``."""
+
+    @abstractmethod
+    def fetch_insider_trades(self, ticker: str, end_date: str, start_date: str | None, limit: int, api_key: str | None = None, api_secret: str | None = None) -> List[InsiderTrade]:
+        """Return insider trades filed between the two dates."""
+
+    @abstractmethod
+    def fetch_company_news(self, ticker: str, start_date: str, end_date: str, limit: int, api_key: str | None = None, api_secret: str | None = None) -> List[CompanyNews]:
+        """Return every article published between the two dates."""
+
+    def iter_insider_trades(self, ticker: str, end_date: str, start_date: str | None, limit: int, api_key: str | None = None, api_secret: str | None = None) -> Iterator[List[InsiderTrade]]:
+        """Yield insider trades page by page; providers with paginated endpoints override this."""
+        yield self.fetch_insider_trades(ticker, end_date, start_date, limit, api_key, api_secret)
+
+    def fetch_company_news_page(self, ticker: str, start_date: str, end_date: str, page_size: int, page_token: str | None, api_key: str | None = None, api_secret: str | None = None) -> tuple[List[CompanyNews], str | None]:
+        """Return one page of articles, newest first, and the token of the next page (None after the last).
+
+        Providers with paginated endpoints override this; by default every article comes on one page.
+        """
+        return self.fetch_company_news(ticker, start_date, end_date, page_size, api_key, api_secret), None
+
+
+class AlpacaDataProvider(DataProvider):
+    """Provider backed by Alpaca's market data and fundamentals endpoints."""
+
+    name = "alpaca"
+
+    # The HTTP helpers live in src.tools.api, which imports this module, so they are looked up on use
+    def fetch_prices(self, ticker, start_date, end_date, api_key=None, api_secret=None):
+        from src.tools import api
+
+        return api._fetch_prices(ticker, start_date, end_date, api_key, api_secret)
+
+    def fetch_prices_batch(self, tickers, start_date, end_date, api_key=None, api_secret=None):
+        from src.tools import api
+
+        return api._fetch_prices_batch(tickers, start_date, end_date, api_key, api_secret)
+
+    def fetch_financial_metrics(self, ticker, end_date, period, limit, api_key=None, api_secret=None):
+        from src.tools import api
+
+        return api._fetch_financial_metrics(ticker, end_date, period, limit, api_key, api_secret)
+
+    def fetch_line_items(self, ticker, line_items, end_date, period, limit, api_key=None, api_secret=None):
+        from src.tools import api
+
+        return api._fetch_line_items(ticker, line_items, end_date, period, limit, api_key, api_secret)
+
+    def fetch_insider_trades(self, ticker, end_date, start_date, limit, api_key=None, api_secret=None):
+        from src.tools import api
+
+        return api._fetch_insider_trades(ticker, end_date, start_date, limit, api_key, api_secret)
+
+    def fetch_company_news(self, ticker, start_date, end_date, limit, api_key=None, api_secret=None):
+        from src.tools import api
+
+        return api._fetch_company_news(ticker, start_date, end_date, limit, api_key, api_secret)
+
+    def iter_insider_trades(self, ticker, end_date, start_date, limit, api_key=None, api_secret=None):
+        from src.tools import api
+
+        return api._iter_insider_trades(ticker, end_date, start_date, limit, api_key, api_secret)
+
+    def fetch_company_news_page(self, ticker, start_date, end_date, page_size, page_token, api_key=None, api_secret=None):
+        from src.tools import api
+
+        return api._fetch_company_news_page(ticker, start_date, end_date, page_size, page_token, api_key, api_secret)
+
+
+class LocalDataProvider(DataProvider):
+    """Provider reading per-ticker files from a directory tree.
+
+    Files are looked up as ``<root>/<dataset>/<TICKER>.<ext>`` where dataset
+    is one of ``prices``, ``financial_metrics``, ``line_items``,
+    ``insider_trades`` or ``company_news`` and the extension is ``csv``,
+    ``parquet`` or ``json`` (records orient). Columns use the field names of
+    the models in ``src.data.models``; price files need ``time``, ``open``,
+    ``close``, ``high``, ``low`` and ``volume``. Missing files read as no
+    data. Results go to a memory-only cache so a snapshot never mixes with
+    data downloaded from Alpaca.
+    """
+
+    name = "local"
+    _EXTENSIONS = ("parquet", "csv", "json")
+    # Tickers become file names, so separators and leading dots are refused to keep lookups inside the root
+    _TICKER_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9.\-]*")
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self.cache = create_memory_cache()
+        self._tables: Dict[tuple, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _rows(self, dataset: str, ticker: str) -> List[Dict[str, Any]]:
+        """Load and memoize a ticker's file for a dataset as a list of dicts."""
+        if not self._TICKER_PATTERN.fullmatch(ticker):
+            raise ValueError(f"Invalid ticker: {ticker!r}")
+        key = (dataset, ticker.upper())
+        with self._lock:
+            if key in self._tables:
+                return self._tables[key]
+        rows: List[Dict[str, Any]] = []
+        for ext in self._EXTENSIONS:
+            path = os.path.join(self.root, dataset, f"{ticker.upper()}.{ext}")
+            if os.path.exists(path):
+                df = {"parquet": pd.read_parquet, "csv": pd.read_csv, "json": lambda p: pd.read_json(p, orient="records", convert_dates=False)}[ext](path)
+                rows = df.astype(object).where(df.notna(), None).to_dict("records")
+                break
+        with self._lock:
+            self._tables[key] = rows
+        return rows
+
+    def _reports(self, ticker: str, dataset: str, end_date: str | None, period: str, limit: int) -> List[Dict[str, Any]]:
+        """Return a ticker's reports for a period up to end_date (or all of them), newest first."""
+        rows = [
+            {**row, "ticker": ticker}
+            for row in self._rows(dataset, ticker)
+            if (end_date is None or str(row.get("report_period"))[:10] <= end_date) and row.get("period", period) == period
+        ]
+        rows.sort(key=lambda row: str(row["report_period"]), reverse=True)
+        return rows[:limit]
+
+    def fetch_prices(self, ticker, start_date, end_date, api_key=None, api_secret=None):
+        rows = self._rows("prices", ticker)
+        return PriceSeries.from_rows({**row, "time": str(row["time"])} for row in rows if start_date <= str(row["time"])[:10] <= end_date)
+
+    def fetch_financial_metrics(self, ticker, end_date, period, limit, api_key=None, api_secret=None):
+        return [
+            FinancialMetrics(**{k: row.get(k) for k in FinancialMetrics.model_fields})
+            for row in self._reports(ticker, "financial_metrics", end_date, period, limit)
+        ]
+
+    def fetch_line_items(self, ticker, line_items, end_date, period, limit, api_key=None, api_secret=None):
+        fields = [*LineItem.model_fields, *line_items]
+        return [{k: row.get(k) for k in fields} for row in self._reports(ticker, "line_items", end_date, period, limit)]
+
+    def fetch_insider_trades(self, ticker, end_date, start_date, limit, api_key=None, api_secret=None):
+        trades = [
+            InsiderTrade(**{**{k: row.get(k) for k in InsiderTrade.model_fields}, "ticker": ticker})
+            for row in self._rows("insider_trades", ticker)
+            if (start_date or "") <= str(row.get("filing_date"))[:10] <= end_date
+        ]
+        trades.sort(key=lambda trade: trade.filing_date, reverse=True)
+        return trades[:limit]
+
+    def fetch_company_news(self, ticker, start_date, end_date, limit, api_key=None, api_secret=None):
+        news = [
+            CompanyNews(**{**{k: row.get(k) for k in CompanyNews.model_fields}, "ticker": ticker})
+            for row in self._rows("company_news", ticker)
+            if start_date <= str(row.get("date"))[:10] <= end_date
+        ]
+        news.sort(key=lambda item: item.date, reverse=True)
+        return news
+
+
+# Most recently used providers by spec; each local one holds its own cache, so only a few are kept
+_providers: OrderedDict[str, DataProvider] = OrderedDict()
+_providers_lock = threading.Lock()
+_MAX_PROVIDERS = 8
+
+# Provider spec chosen for the current run; None falls back to the configured default
+_active_provider: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("data_provider", default=None)
+
+
+def get_data_provider(spec: Optional[str] = None) -> DataProvider:
+    """Return the provider for ``spec``, the active run's provider, or the configured one.
+
+    ``spec`` is ``"alpaca"``, ``"local"`` (reading from ``data.local_path``)
+    or ``"local:<path>"``. Providers are created once per spec and the least
+    recently used is dropped when more than ``_MAX_PROVIDERS`` are open.
+    Specs are trusted: clients of the backend may only pick ``"alpaca"`` or
+    ``"local"``.
+    """
+    spec = spec or _active_provider.get() or get_data_config()["provider"]
+    with _providers_lock:
+        provider = _providers.get(spec)
+        if provider is None:
+            name, _, path = spec.partition(":")
+            if name == "alpaca":
+                provider = AlpacaDataProvider()
+            elif name == "local":
+                provider = LocalDataProvider(path or get_data_config()["local_path"])
+            else:
+                raise ValueError(f"Unknown data provider: {spec}")
+            _providers[spec] = provider
+            if len(_providers) > _MAX_PROVIDERS:
+                _providers.popitem(last=False)
+        else:
+            _providers.move_to_end(spec)
+    return provider
+
+
+@contextmanager
+def use_data_provider(spec: Optional[str]) -> Iterator[DataProvider]:
+    """Make ``spec`` the active provider for the calling context."""
+    token = _active_provider.set(spec)
+    try:
+        yield get_data_provider()
+    finally:
+        _active_provider.reset(token)
+
+
+def bind_data_provider(node: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a graph node so it runs with its run's data provider and prefetched bundles.
+
+    The provider is named in ``state["metadata"]`` and the bundles are kept in
+    ``state["data"]["bundles"]``.
+    """
+
+    @functools.wraps(node)
+    def wrapper(state, *args, **kwargs):
+        spec = (state.get("metadata") or {}).get("data_provider")
+        with use_data_provider(spec), use_data_bundles((state.get("data") or {}).get("bundles")):
+            return node(state, *args, **kwargs)
+
+    return wrapper
+
+
+__all__ = [
+    "AlpacaDataProvider",
+    "DataProvider",
+    "LocalDataProvider",
+    "bind_data_provider",
+    "get_data_provider",
+    "use_data_provider",
+]
@@ -0,0 +1,93 @@
+"""Declared per-ticker data needs of the analysts and the planner that merges them.
+
+Each analyst in ``ANALYST_CONFIG`` declares, as :class:`DataRequirements`,
+the financial metrics, line items, market cap, insider trades and news it
+reads for every ticker. :func:`plan_requests` merges the declarations of the
+selected analysts into the fewest API requests per ticker:
+
+- one financial metrics request per period, for the largest limit;
+- one line item request per period, for the largest limit and the union of
+  the fields;
+- one request for the newest insider trades;
+- one news request, reading back far enough for the longest lookback and
+  the largest article count.
+
+The graph's prefetch node and the cache warm-up fetch exactly that plan.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, Mapping, Tuple
+
+
+@dataclass(frozen=True)
+class LineItemRequest:
+    """Line item fields read for the newest ``limit`` reports of a period."""
+
+    period: str
+    limit: int
+    fields: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class DataRequirements:
+    """Data an analyst reads for each ticker.
+
+    ``financial_metrics`` maps a period to the number of reports read.
+    ``market_cap`` stands for the newest ttm report, which holds it.
+    ``insider_trades`` is how many of the newest trades are read (0 for
+    none). News is read for the ``news_lookback_days`` days up to the end
+    date and for at least the newest ``news_articles`` articles (0 for
+    neither).
+    """
+
+    financial_metrics: Mapping[str, int] = field(default_factory=dict)
+    line_items: Tuple[LineItemRequest, ...] = ()
+    market_cap: bool = False
+    insider_trades: int = 0
+    news_lookback_days: int = 0
+    news_articles: int = 0
+
+    @property
+    def reads_news(self) -> bool:
+        return self.news_lookback_days > 0 or self.news_articles > 0
+
+    @property
+    def request_count(self) -> int:
+        """Number of API requests per ticker needed to fetch everything declared."""
+        metric_periods = {*self.financial_metrics, *(["ttm"] if self.market_cap else [])}
+        return len(metric_periods) + len(self.line_items) + (self.insider_trades > 0) + self.reads_news
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def plan_requests(requirements: Iterable[DataRequirements]) -> DataRequirements:
+    """Merge several analysts' requirements into one request per dataset and period."""
+    metrics: Dict[str, int] = {}
+    line_items: Dict[str, Tuple[int, Dict[str, None]]] = {}
+    insider_trades = 0
+    news_lookback_days = news_articles = 0
+    for requirement in requirements:
+        for period, limit in requirement.financial_metrics.items():
+            metrics[period] = max(metrics.get(period, 0), limit)
+        if requirement.market_cap:
+            metrics["ttm"] = max(metrics.get("ttm", 0), 1)
+        for request in requirement.line_items:
+            limit, fields = line_items.get(request.period, (0, {}))
+            # Fields keep their first-seen order so equal plans compare and serialize alike
+            line_items[request.period] = (max(limit, request.limit), {**fields, **dict.fromkeys(request.fields)})
+        insider_trades = max(insider_trades, requirement.insider_trades)
+        news_lookback_days = max(news_lookback_days, requirement.news_lookback_days)
+        news_articles = max(news_articles, requirement.news_articles)
+    return DataRequirements(
+        financial_metrics=metrics,
+        line_items=tuple(LineItemRequest(period, limit, tuple(fields)) for period, (limit, fields) in line_items.items()),
+        insider_trades=insider_trades,
+        news_lookback_days=news_lookback_days,
+        news_articles=news_articles,
+    )
+
+
+__all__ = ["DataRequirements", "LineItemRequest", "plan_requests"]
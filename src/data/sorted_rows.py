@@ -0,0 +1,124 @@
+"""Keyed, time-ordered row storage for cache entries.
+
+:class:`SortedRows` keeps rows unique by a key field (or a tuple of fields)
+and ordered by a sort field (a date or timestamp string). A batch of new rows is sorted and placed
+at its binary-search position, so appending ``k`` rows costs ``O(k log k)``
+comparisons instead of a full re-sort, and readers get the ordered list
+directly without sorting it again.
+
+Inserts build new lists and swap them in rather than editing the old ones,
+so readers, which do not take the cache lock, keep a consistent snapshot of
+whichever lists they were handed while another thread adds rows.
+
+Cache hits usually want pydantic models rather than dicts, so an entry can
+also hold its rows as validated models (see :meth:`SortedRows.models`). They
+are validated once, kept in step with later inserts, and shared by every
+reader, which is why the cached model classes are frozen.
+"""
+
+from __future__ import annotations
+
+import sys
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Any, Iterable
+
+from pydantic import BaseModel, TypeAdapter
+
+from src.data.memory_store import estimate_size
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    # Validating a whole list in one call is faster than constructing the models one by one
+    return TypeAdapter(list[model])
+
+
+class SortedRows:
+    """Rows de-duplicated on ``key_field`` and kept in ascending ``sort_field`` order.
+
+    ``key_field`` may be a tuple of field names for rows that no single field
+    identifies, such as several insider trades filed on one day.
+    """
+
+    __slots__ = ("key_field", "sort_field", "rows", "_keys", "_order", "_nbytes", "_model", "_models")
+
+    def __init__(self, key_field: str | tuple[str, ...], sort_field: str | None = None, rows: Iterable[dict[str, Any]] = ()) -> None:
+        if sort_field is None and isinstance(key_field, tuple):
+            raise ValueError("A composite key_field needs a sort_field")
+        self.key_field = key_field
+        self.sort_field = sort_field or key_field
+        self.rows: list[dict[str, Any]] = []
+        self._keys: set = set()
+        self._order: list[str] = []
+        self._nbytes = 0
+        self._model: type[BaseModel] | None = None
+        self._models: list[BaseModel] | None = None
+        self.add(rows)
+
+    def add(self, rows: Iterable[dict[str, Any]]) -> int:
+        """Insert rows whose key is not present yet and return how many were added."""
+        new_rows = []
+        for row in rows:
+            key = self._key_of(row)
+            if key not in self._keys:
+                self._keys.add(key)
+                new_rows.append(row)
+        if not new_rows:
+            return 0
+
+        new_rows.sort(key=self._order_of)
+        new_order = [self._order_of(row) for row in new_rows]
+        position = bisect_right(self._order, new_order[0])
+        if position == len(self._order) or bisect_right(self._order, new_order[-1]) == position:
+            # The batch fits between two existing rows (usually at the end), so it is placed there as one block
+            self._order = self._order[:position] + new_order + self._order[position:]
+            self.rows = self.rows[:position] + new_rows + self.rows[position:]
+            if self._models is not None:
+                self._models = self._models[:position] + _list_adapter(self._model).validate_python(new_rows) + self._models[position:]
+        else:
+            # Interleaved batch: both sides are sorted runs, which a stable sort merges in linear time
+            merged = sorted(zip(self._order + new_order, range(len(self._order) + len(new_order))), key=lambda pair: pair[0])
+            all_rows = self.rows + new_rows
+            self._order = [order for order, _ in merged]
+            self.rows = [all_rows[index] for _, index in merged]
+            if self._models is not None:
+                all_models = self._models + _list_adapter(self._model).validate_python(new_rows)
+                self._models = [all_models[index] for _, index in merged]
+        # Rows of one dataset share a shape, so one row's size stands in for the batch
+        self._nbytes += estimate_size(new_rows[0]) * len(new_rows)
+        return len(new_rows)
+
+    def models(self, model: type[BaseModel]) -> list[BaseModel]:
+        """Return the rows as validated ``model`` instances, building them on first use only."""
+        if self._model is not model:
+            self._models = _list_adapter(model).validate_python(self.rows)
+            self._model = model
+        return self._models
+
+    @property
+    def has_models(self) -> bool:
+        return self._models is not None
+
+    def _key_of(self, row: dict[str, Any]) -> Any:
+        if isinstance(self.key_field, tuple):
+            return tuple(row.get(field) for field in self.key_field)
+        return row[self.key_field]
+
+    def _order_of(self, row: dict[str, Any]) -> str:
+        return row.get(self.sort_field) or ""
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated size of the stored rows, maintained incrementally."""
+        size = self._nbytes + sys.getsizeof(self.rows) + sys.getsizeof(self._keys) + sys.getsizeof(self._order)
+        if self._models is not None:
+            # Each model holds a dict shaped like its row
+            size += self._nbytes + sys.getsizeof(self._models)
+        return size
+
+
+__all__ = ["SortedRows"]
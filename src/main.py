@@ -8,13 +8,19 @@ import questionary
 from src.agents.portfolio_manager import portfolio_management_agent
 from src.agents.risk_manager import risk_management_agent
 from src.graph.state import AgentState
+from src.config import get_data_config
+from src.data.bundle import build_data_bundles
+from src.data.providers import bind_data_provider
+from src.data.requirements import DataRequirements
 from src.utils.display import print_trading_output
-from src.utils.analysts import ANALYST_ORDER, get_analyst_nodes
+from src.utils.analysts import ANALYST_ORDER, get_analyst_nodes, get_data_requirements
 from src.utils.progress import progress
+from src.utils.api_key import get_api_key_from_state
 from src.llm.models import LLM_ORDER, OLLAMA_LLM_ORDER, get_model_info, ModelProvider
 from src.utils.ollama import ensure_ollama_and_model
 
 import argparse
+from functools import partial
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from src.utils.visualize import save_graph_as_png
@@ -87,6 +93,7 @@ def run_hedge_fund(
                     "live_trading": live_trading,
                     "alpaca_api_key": alpaca_api_key,
                     "alpaca_api_secret": alpaca_api_secret,
+                    "data_provider": get_data_config()["provider"],
                 },
             },
         )
@@ -105,6 +112,19 @@ def start(state: AgentState):
     return state
 
 
+def prefetch(state: AgentState, requirements: DataRequirements):
+    """Fetch the planned data for every ticker once, concurrently, into per-ticker bundles."""
+    data = state["data"]
+    bundles = build_data_bundles(
+        data["tickers"],
+        data["end_date"],
+        requirements,
+        api_key=get_api_key_from_state(state, "APCA_API_KEY_ID"),
+        api_secret=get_api_key_from_state(state, "APCA_API_SECRET_KEY"),
+    )
+    return {"data": {"bundles": bundles}}
+
+
 def create_workflow(selected_analysts=None):
     """Create the workflow with selected analysts."""
     workflow = StateGraph(AgentState)
@@ -121,20 +141,25 @@ def create_workflow(selected_analysts=None):
     entry_node = "start_node"
     if research_key in selected_analysts:
         research_node_name, research_func = analyst_nodes[research_key]
-        workflow.add_node(research_node_name, research_func)
+        workflow.add_node(research_node_name, bind_data_provider(research_func))
         workflow.add_edge("start_node", research_node_name)
         entry_node = research_node_name
         selected_analysts = [k for k in selected_analysts if k != research_key]
 
+    # Fetch shared data after research has settled the tickers and before the analysts fan out
+    workflow.add_node("prefetch_node", bind_data_provider(partial(prefetch, requirements=get_data_requirements(selected_analysts))))
+    workflow.add_edge(entry_node, "prefetch_node")
+    entry_node = "prefetch_node"
+
     # Add selected analyst nodes
     for analyst_key in selected_analysts:
         node_name, node_func = analyst_nodes[analyst_key]
-        workflow.add_node(node_name, node_func)
+        workflow.add_node(node_name, bind_data_provider(node_func))
         workflow.add_edge(entry_node, node_name)
 
     # Always add risk and portfolio management
-    workflow.add_node("risk_management_agent", risk_management_agent)
-    workflow.add_node("portfolio_manager", portfolio_management_agent)
+    workflow.add_node("risk_management_agent", bind_data_provider(risk_management_agent))
+    workflow.add_node("portfolio_manager", bind_data_provider(portfolio_management_agent))
 
     # Connect selected analysts to risk management
     for analyst_key in selected_analysts:
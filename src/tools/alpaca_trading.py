@@ -1,9 +1,8 @@
 import os
 from typing import Optional, List, Dict
 
-import requests
-
 from src.config import get_alpaca_keys
+from src.tools import http_client
 
 ALPACA_BASE_URL = os.environ.get("ALPACA_BASE_URL", "https://paper-api.alpaca.markets")
 
@@ -24,7 +23,7 @@ def _auth_headers(api_key: Optional[str] = None, api_secret: Optional[str] = Non
 def get_account(api_key: Optional[str] = None, api_secret: Optional[str] = None, base_url: Optional[str] = None) -> Dict:
     """Retrieve account information from Alpaca."""
     url = f"{base_url or ALPACA_BASE_URL}/v2/account"
-    response = requests.get(url, headers=_auth_headers(api_key, api_secret))
+    response = http_client.get(url, headers=_auth_headers(api_key, api_secret))
     if response.status_code >= 400:
         raise Exception(f"Error fetching account: {response.status_code} - {response.text}")
     return response.json()
@@ -51,7 +50,7 @@ def submit_order(
         "time_in_force": time_in_force,
         **kwargs,
     }
-    response = requests.post(url, json=payload, headers=_auth_headers(api_key, api_secret))
+    response = http_client.post(url, json=payload, headers=_auth_headers(api_key, api_secret))
     if response.status_code >= 400:
         raise Exception(f"Error submitting order: {response.status_code} - {response.text}")
     return response.json()
@@ -60,7 +59,7 @@ def submit_order(
 def get_order(order_id: str, api_key: Optional[str] = None, api_secret: Optional[str] = None, base_url: Optional[str] = None) -> Dict:
     """Get information about a specific order."""
     url = f"{base_url or ALPACA_BASE_URL}/v2/orders/{order_id}"
-    response = requests.get(url, headers=_auth_headers(api_key, api_secret))
+    response = http_client.get(url, headers=_auth_headers(api_key, api_secret))
     if response.status_code >= 400:
         raise Exception(f"Error fetching order: {response.status_code} - {response.text}")
     return response.json()
@@ -75,7 +74,7 @@ def list_orders(
     """List orders from Alpaca."""
     url = f"{base_url or ALPACA_BASE_URL}/v2/orders"
     params = {"status": status}
-    response = requests.get(url, params=params, headers=_auth_headers(api_key, api_secret))
+    response = http_client.get(url, params=params, headers=_auth_headers(api_key, api_secret))
     if response.status_code >= 400:
         raise Exception(f"Error listing orders: {response.status_code} - {response.text}")
     return response.json()
@@ -1,10 +1,16 @@
 import datetime
 import os
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from itertools import chain, islice
+from typing import Iterator
 import pandas as pd
 import requests
-import time
 
-from src.data.cache import get_cache
+from src.data.bundle import get_data_bundle
+from src.data.cache import Cache, create_memory_cache, get_cache
+from src.data.price_series import PriceSeries
+from src.data.providers import get_data_provider
 from src.data.models import (
     CompanyNews,
     FinancialMetrics,
@@ -12,11 +18,29 @@ from src.data.models import (
     LineItem,
     InsiderTrade,
 )
-from src.config import get_alpaca_keys
+from src.config import get_alpaca_keys, get_data_config
+from src.tools import http_client
+from src.tools.rate_limiter import get_rate_limiter
+from src.tools.singleflight import SingleFlight
 
 # Global cache instance
 _cache = get_cache()
 
+# Shared token bucket that paces requests using Alpaca's rate-limit headers
+_rate_limiter = get_rate_limiter()
+
+# Coalesces concurrent cache misses for the same data into a single fetch
+_singleflight = SingleFlight()
+
+# Maximum number of symbols per multi-symbol bars request
+PRICE_BATCH_SIZE = 100
+
+# Reports fetched per ticker and period for the point-in-time metrics history (ten years of quarters)
+METRICS_HISTORY_LIMIT = 40
+
+# Alpaca's news archive starts in 2015; used as the start of "all history" requests
+NEWS_HISTORY_START = "2015-01-01"
+
 
 def _alpaca_headers(api_key: str | None = None, secret_key: str | None = None) -> dict:
     """Build headers for Alpaca API requests."""
@@ -33,7 +57,12 @@ def _alpaca_headers(api_key: str | None = None, secret_key: str | None = None) -
 
 def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: dict = None, max_retries: int = 3) -> requests.Response:
     """
-    Make an API request with rate limiting handling and moderate backoff.
+    Make an API request paced by the shared rate limiter.
+
+    Each attempt first waits for a token from the process-wide limiter, whose
+    bucket is resynchronized from the response's rate-limit headers. On a 429
+    all callers are paused until the server's reset time (or a 60s, 90s, ...
+    backoff when no reset header is sent) before the request is retried.
     
     Args:
         url: The URL to request
@@ -48,23 +77,72 @@ def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: d
     Raises:
         Exception: If the request fails with a non-429 error
     """
+    # Replayed responses come from disk, so they are not paced against the live rate limit
+    paced = not http_client.get_http_client().replaying
     for attempt in range(max_retries + 1):  # +1 for initial attempt
+        if paced:
+            _rate_limiter.acquire()
         if method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=json_data)
+            response = http_client.post(url, headers=headers, json=json_data)
         else:
-            response = requests.get(url, headers=headers)
-        
-        if response.status_code == 429 and attempt < max_retries:
-            # Linear backoff: 60s, 90s, 120s, 150s...
-            delay = 60 + (30 * attempt)
-            print(f"Rate limited (429). Attempt {attempt + 1}/{max_retries + 1}. Waiting {delay}s before retrying...")
-            time.sleep(delay)
-            continue
+            response = http_client.get(url, headers=headers)
+        if paced:
+            _rate_limiter.update(response.headers)
+
+        if response.status_code == 429:
+            delay = _rate_limiter.penalize(response.headers, attempt)
+            if attempt < max_retries:
+                print(f"Rate limited (429). Attempt {attempt + 1}/{max_retries + 1}. Waiting {delay:.0f}s before retrying...")
+                continue
         
         # Return the response (whether success, other errors, or final 429)
         return response
 
 
+def get_rate_limit_stats() -> dict:
+    """Return the shared rate limiter's state for metrics."""
+    return _rate_limiter.stats()
+
+
+def _active_cache():
+    """Return the cache for the active data provider; Alpaca uses the shared persistent cache."""
+    return get_data_provider().cache or _cache
+
+
+@contextmanager
+def use_memory_cache() -> Iterator[Cache]:
+    """Answer data requests from a fresh memory-only cache for the duration of the block.
+
+    Recording or replaying an HTTP archive runs inside this: the persistent
+    cache would otherwise answer requests before they reach the archive,
+    leaving them out of a recording and letting a replay read data the
+    archive does not hold.
+    """
+    global _cache
+    previous, _cache = _cache, create_memory_cache()
+    try:
+        yield _cache
+    finally:
+        _cache = previous
+
+
+def _shared_fetch(key: tuple, cache_entries: tuple[tuple[str, str], ...], func, *args):
+    """Run a fetch once per key across threads and across processes sharing the cache.
+
+    Concurrent callers in this process are coalesced by the single-flight
+    layer; the leader then holds a cache lease so other processes wait for
+    it and find the data stored instead of downloading it again.
+    """
+    provider = get_data_provider()
+    key = (provider.name, *key)
+
+    def leader():
+        with _active_cache().lease(":".join(map(str, key)), *cache_entries):
+            return func(*args)
+
+    return _singleflight.do(key, leader)
+
+
 def get_prices(
     ticker: str,
     start_date: str,
@@ -73,39 +151,168 @@ def get_prices(
     api_secret: str | None = None,
 ) -> list[Price]:
     """Fetch price data from cache or Alpaca API."""
-    cache_key = f"{ticker}_{start_date}_{end_date}"
+    return get_price_series(ticker, start_date, end_date, api_key=api_key, api_secret=api_secret).to_prices()
 
-    if cached_data := _cache.get_prices(cache_key):
-        return [Price(**price) for price in cached_data]
 
+def get_price_series(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+) -> PriceSeries:
+    """Fetch price data as a columnar series from cache or Alpaca API.
+
+    Bars are cached per ticker along with the date ranges already fetched, so
+    any window inside those ranges is served by slicing and only the
+    uncovered gaps are requested from the API.
+    """
+    cache = _active_cache()
+    series = cache.get_prices(ticker) or PriceSeries.empty()
+    for gap_start, gap_end in cache.get_missing_price_ranges(ticker, start_date, end_date):
+        series = series.merge(_shared_fetch(("prices", ticker, gap_start, gap_end), _price_entries([ticker]), _load_price_gap, ticker, gap_start, gap_end, api_key, api_secret))
+    return series.slice_dates(start_date, end_date)
+
+
+def get_prices_batch(
+    tickers: list[str],
+    start_date: str,
+    end_date: str,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+    chunk_size: int = PRICE_BATCH_SIZE,
+) -> dict[str, list[Price]]:
+    """Fetch price data for many tickers using Alpaca's multi-symbol bars endpoint."""
+    series_by_ticker = get_price_series_batch(tickers, start_date, end_date, api_key=api_key, api_secret=api_secret, chunk_size=chunk_size)
+    return {ticker: series.to_prices() for ticker, series in series_by_ticker.items()}
+
+
+def get_price_series_batch(
+    tickers: list[str],
+    start_date: str,
+    end_date: str,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+    chunk_size: int = PRICE_BATCH_SIZE,
+) -> dict[str, PriceSeries]:
+    """Fetch columnar price data for many tickers using Alpaca's multi-symbol bars endpoint.
+
+    Tickers missing the same date range are requested together in chunks of
+    ``chunk_size`` symbols, and the results are split back into the per-ticker
+    cache entries used by :func:`get_prices`. This is also the bulk ingestion
+    path into the price history store.
+    """
+    cache = _active_cache()
+    tickers = list(dict.fromkeys(tickers))
+    tickers_by_gap: dict[tuple[str, str], list[str]] = {}
+    for ticker in tickers:
+        for gap in cache.get_missing_price_ranges(ticker, start_date, end_date):
+            tickers_by_gap.setdefault(gap, []).append(ticker)
+
+    for (gap_start, gap_end), gap_tickers in tickers_by_gap.items():
+        for i in range(0, len(gap_tickers), chunk_size):
+            chunk = tuple(gap_tickers[i : i + chunk_size])
+            _shared_fetch(("prices_batch", chunk, gap_start, gap_end), _price_entries(chunk), _load_price_batch, chunk, gap_start, gap_end, api_key, api_secret)
+
+    # Every window is now covered, so these are served from the cache
+    return {ticker: get_price_series(ticker, start_date, end_date, api_key=api_key, api_secret=api_secret) for ticker in tickers}
+
+
+def _price_entries(tickers) -> tuple[tuple[str, str], ...]:
+    """Return the cache entries a price download fills for each ticker."""
+    return tuple((dataset, ticker) for ticker in tickers for dataset in ("prices", "price_ranges"))
+
+
+def _load_price_gap(ticker: str, start_date: str, end_date: str, api_key: str | None, api_secret: str | None) -> PriceSeries:
+    """Fetch one uncovered date range for a ticker and record it in the cache."""
+    cache = _active_cache()
+    if not cache.get_missing_price_ranges(ticker, start_date, end_date):
+        # Filled by a request that finished just before this one started
+        return cache.get_prices(ticker).slice_dates(start_date, end_date)
+    series = get_data_provider().fetch_prices(ticker, start_date, end_date, api_key, api_secret)
+    # Stored even when empty so the recorded range stays valid for gaps with no bars
+    cache.set_prices(ticker, series)
+    cache.add_price_range(ticker, start_date, end_date)
+    return series
+
+
+def _load_price_batch(tickers: tuple[str, ...], start_date: str, end_date: str, api_key: str | None, api_secret: str | None):
+    """Fetch one date range for a chunk of tickers and record it in the cache."""
+    cache = _active_cache()
+    # Skip tickers another process filled while this one waited for the lease
+    tickers = [ticker for ticker in tickers if cache.get_missing_price_ranges(ticker, start_date, end_date)]
+    if not tickers:
+        return
+    series_by_ticker = get_data_provider().fetch_prices_batch(tickers, start_date, end_date, api_key, api_secret)
+    for ticker in tickers:
+        cache.set_prices(ticker, series_by_ticker.get(ticker, PriceSeries.empty()))
+        cache.add_price_range(ticker, start_date, end_date)
+
+
+def _bars_to_series(bars: list[dict]) -> PriceSeries:
+    return PriceSeries.from_rows({"open": bar["o"], "close": bar["c"], "high": bar["h"], "low": bar["l"], "volume": bar["v"], "time": bar["t"]} for bar in bars)
+
+
+def _fetch_prices(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+) -> PriceSeries:
+    """Fetch daily bars for a single date range from Alpaca API, following pagination."""
     headers = _alpaca_headers(api_key, api_secret)
-    url = (
+    base_url = (
         f"https://data.alpaca.markets/v2/stocks/{ticker}/bars"
         f"?timeframe=1Day&start={start_date}&end={end_date}"
     )
-    response = _make_api_request(url, headers)
-    if response.status_code != 200:
-        raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
+    bars = []
+    url = base_url
+    while True:
+        response = _make_api_request(url, headers)
+        if response.status_code != 200:
+            raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
 
-    data = response.json()
-    bars = data.get("bars", [])
-    prices = [
-        Price(
-            open=bar.get("o"),
-            close=bar.get("c"),
-            high=bar.get("h"),
-            low=bar.get("l"),
-            volume=bar.get("v"),
-            time=bar.get("t"),
-        )
-        for bar in bars
-    ]
+        data = response.json()
+        bars.extend(data.get("bars") or [])
+        next_token = data.get("next_page_token")
+        if not next_token:
+            return _bars_to_series(bars)
+        url = f"{base_url}&page_token={next_token}"
 
-    if not prices:
-        return []
 
-    _cache.set_prices(cache_key, [p.model_dump() for p in prices])
-    return prices
+def _fetch_prices_batch(
+    tickers: list[str],
+    start_date: str,
+    end_date: str,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+) -> dict[str, PriceSeries]:
+    """Fetch daily bars for several tickers in one paginated multi-symbol request."""
+    headers = _alpaca_headers(api_key, api_secret)
+    base_url = (
+        f"https://data.alpaca.markets/v2/stocks/bars"
+        f"?symbols={','.join(tickers)}&timeframe=1Day&start={start_date}&end={end_date}&limit=10000"
+    )
+    bars_by_ticker: dict[str, list[dict]] = {}
+    url = base_url
+    while True:
+        response = _make_api_request(url, headers)
+        if response.status_code != 200:
+            raise Exception(f"Error fetching data: {','.join(tickers)} - {response.status_code} - {response.text}")
+
+        data = response.json()
+        for ticker, bars in (data.get("bars") or {}).items():
+            bars_by_ticker.setdefault(ticker, []).extend(bars)
+        next_token = data.get("next_page_token")
+        if not next_token:
+            return {ticker: _bars_to_series(bars) for ticker, bars in bars_by_ticker.items()}
+        url = f"{base_url}&page_token={next_token}"
+
+
+def _fetch_limit(limit: int) -> int:
+    """Return the limit to request for a fundamentals query, raised to the configured over-fetch limit."""
+    return max(limit, get_data_config()["overfetch_limit"] or 0)
 
 
 def get_financial_metrics(
@@ -116,17 +323,111 @@ def get_financial_metrics(
     api_key: str | None = None,
     api_secret: str | None = None,
 ) -> list[FinancialMetrics]:
-    """Fetch financial metrics from cache or Alpaca API."""
-    cache_key = f"{ticker}_{period}_{end_date}_{limit}"
+    """Fetch financial metrics from cache or Alpaca API.
+
+    Reports are kept per (ticker, period) in a point-in-time history that is
+    downloaded once, so the latest ``limit`` reports as of any ``end_date``
+    (one per backtest day) are found by binary search instead of a request.
+    Queries reaching further back than the history are fetched on their own.
+    """
+    if (bundle := get_data_bundle(ticker)) and (metrics := bundle.get_financial_metrics(end_date, period, limit)) is not None:
+        return metrics
+    cache = _active_cache()
+    if (metrics := _metrics_as_of(cache, ticker, end_date, period, limit)) is not None:
+        return metrics
+    history_key = f"{ticker}_{period}"
+    if cache.is_empty("financial_metrics", history_key):
+        return []
+    as_of = max(end_date, datetime.date.today().isoformat())
+    if not _shared_fetch(("metrics_history", history_key), (("metrics_history", f"history:{history_key}"), ("metrics_coverage", f"coverage:{history_key}"), ("empty_results", f"financial_metrics:{history_key}")), _load_metrics_history, ticker, period, as_of, api_key, api_secret):
+        return []
+    if (metrics := _metrics_as_of(cache, ticker, end_date, period, limit)) is not None:
+        return metrics
+
+    query_key = f"{ticker}_{period}_{end_date}"
+    if (metrics := _cached_metrics(cache, query_key, limit)) is not None:
+        return metrics
+    fetch_limit = _fetch_limit(limit)
+    cache_key = f"{query_key}_{fetch_limit}"
+    if cache.is_empty("financial_metrics", cache_key):
+        return []
 
-    if cached_data := _cache.get_financial_metrics(cache_key):
-        return [FinancialMetrics(**metric) for metric in cached_data]
+    cache_entries = (("financial_metrics", cache_key), ("empty_results", f"financial_metrics:{cache_key}"), ("query_limits", f"limits:financial_metrics:{query_key}"))
+    return _shared_fetch(("financial_metrics", cache_key), cache_entries, _load_financial_metrics, ticker, end_date, period, limit, fetch_limit, api_key, api_secret)
 
+
+def _cached_metrics(cache, query_key: str, limit: int) -> list[FinancialMetrics] | None:
+    """Answer a query from any cached query for the same ticker, period and end date that covers its limit."""
+    for fetched in [limit, *cache.get_query_limits("financial_metrics", query_key)]:
+        metrics = cache.get_financial_metrics(f"{query_key}_{fetched}", model=FinancialMetrics)
+        # A larger query holds the newest reports of a smaller one, and one that came back short holds them all
+        if metrics and (fetched >= limit or len(metrics) < fetched):
+            return metrics[-limit:][::-1]
+    return None
+
+
+def _metrics_as_of(cache, ticker: str, end_date: str, period: str, limit: int) -> list[FinancialMetrics] | None:
+    """Answer a query from the cached history, newest first, or return None if it cannot."""
+    history = cache.get_metrics_history(ticker, period, model=FinancialMetrics)
+    if history is None:
+        return None
+    metrics, coverage = history
+    if end_date > coverage["as_of"]:
+        return None
+    position = bisect_right(metrics, end_date, key=lambda metric: metric.report_period)
+    if position < limit and not coverage["complete"]:
+        # Older reports than the history holds would be needed
+        return None
+    return metrics[max(0, position - limit) : position][::-1]
+
+
+def _load_metrics_history(ticker: str, period: str, as_of: str, api_key: str | None, api_secret: str | None) -> bool:
+    """Download a ticker's recent reports for a period in one request and store them as its history.
+
+    Returns False if the ticker has no reports for the period.
+    """
+    cache = _active_cache()
+    history = cache.get_metrics_history(ticker, period)
+    if history is not None and history[1]["as_of"] >= as_of:
+        # Downloaded by a request that finished just before this one started
+        return True
+    if cache.is_empty("financial_metrics", f"{ticker}_{period}"):
+        return False
+    # The request carries no date, so it is the same on every day (and in a recorded archive); as_of only marks how fresh the history is
+    reports = get_data_provider().fetch_financial_metrics(ticker, None, period, METRICS_HISTORY_LIMIT, api_key, api_secret)
+    if not reports:
+        cache.set_empty("financial_metrics", f"{ticker}_{period}")
+        return False
+    cache.set_metrics_history(ticker, period, [m.model_dump() for m in reports], as_of=as_of, complete=len(reports) < METRICS_HISTORY_LIMIT)
+    return True
+
+
+def _load_financial_metrics(ticker: str, end_date: str, period: str, limit: int, fetch_limit: int, api_key: str | None, api_secret: str | None) -> list[FinancialMetrics]:
+    """Fetch ``fetch_limit`` reports from the active provider, record them in the cache and return the newest ``limit``."""
+    cache = _active_cache()
+    query_key = f"{ticker}_{period}_{end_date}"
+    if (metrics := _cached_metrics(cache, query_key, limit)) is not None:
+        return metrics
+    cache_key = f"{query_key}_{fetch_limit}"
+    if cache.is_empty("financial_metrics", cache_key):
+        return []
+
+    financial_metrics = get_data_provider().fetch_financial_metrics(ticker, end_date, period, fetch_limit, api_key, api_secret)
+    if not financial_metrics:
+        cache.set_empty("financial_metrics", cache_key)
+        return []
+
+    cache.set_financial_metrics(cache_key, [m.model_dump() for m in financial_metrics])
+    cache.add_query_limit("financial_metrics", query_key, fetch_limit)
+    return financial_metrics[:limit]
+
+
+def _fetch_financial_metrics(ticker: str, end_date: str | None, period: str, limit: int, api_key: str | None, api_secret: str | None) -> list[FinancialMetrics]:
+    """Fetch financial metrics from Alpaca fundamentals; without ``end_date`` the newest reports are returned."""
     headers = _alpaca_headers(api_key, api_secret)
-    url = (
-        f"https://data.alpaca.markets/v2/stocks/{ticker}/fundamentals"
-        f"?period={period}&limit={limit}&start={end_date}"
-    )
+    url = f"https://data.alpaca.markets/v2/stocks/{ticker}/fundamentals?period={period}&limit={limit}"
+    if end_date is not None:
+        url += f"&start={end_date}"
     response = _make_api_request(url, headers)
     if response.status_code != 200:
         raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
@@ -137,11 +438,6 @@ def get_financial_metrics(
     for item in fundamentals:
         item["ticker"] = data.get("symbol", ticker)
         financial_metrics.append(FinancialMetrics(**{k: item.get(k) for k in FinancialMetrics.model_fields}))
-
-    if not financial_metrics:
-        return []
-
-    _cache.set_financial_metrics(cache_key, [m.model_dump() for m in financial_metrics])
     return financial_metrics
 
 
@@ -154,7 +450,102 @@ def search_line_items(
     api_key: str | None = None,
     api_secret: str | None = None,
 ) -> list[LineItem]:
-    """Fetch line items using Alpaca fundamentals endpoint."""
+    """Fetch line items from cache or Alpaca fundamentals endpoint.
+
+    Line items are cached per (ticker, period, report_period) with their
+    fields merged across calls, so a later query for the same reports only
+    requests the fields that have not been fetched yet. A cached query with a
+    larger limit also answers smaller ones for the same ticker, period and
+    end date.
+    """
+    if (bundle := get_data_bundle(ticker)) and (items := bundle.search_line_items(line_items, end_date, period, limit)) is not None:
+        return items
+    cache = _active_cache()
+    if (cached := _cached_line_items(ticker, line_items, end_date, period, limit)) is not None:
+        return cached
+    query_key = f"{ticker}_{period}_{end_date}"
+    if cache.is_empty("line_items", f"{query_key}_{_fetch_limit(limit)}"):
+        return []
+
+    key = ("line_items", ticker, tuple(sorted(line_items)), end_date, period, limit)
+    cache_entries = (
+        ("line_items", ticker),
+        ("line_item_queries", f"{query_key}_{limit}"),
+        ("empty_results", f"line_items:{query_key}_{_fetch_limit(limit)}"),
+        ("query_limits", f"limits:line_items:{query_key}"),
+    )
+    return _shared_fetch(key, cache_entries, _load_line_items, ticker, line_items, end_date, period, limit, api_key, api_secret)
+
+
+def _covering_line_item_queries(ticker: str, end_date: str, period: str, limit: int) -> list[tuple[int, dict]]:
+    """Return the cached (limit, query) records for the same ticker, period and end date that cover ``limit`` reports."""
+    cache = _active_cache()
+    covering = []
+    for fetched in dict.fromkeys([limit, *cache.get_query_limits("line_items", f"{ticker}_{period}_{end_date}")]):
+        query = cache.get_line_item_query(ticker, period, end_date, fetched)
+        # A larger query holds the newest reports of a smaller one, and one that came back short holds them all
+        if query is not None and (fetched >= limit or len(query["report_periods"]) < fetched):
+            covering.append((fetched, query))
+    return covering
+
+
+def _line_item_rows(ticker: str, period: str, report_periods: list[str]) -> dict[str, dict] | None:
+    """Return the cached rows for the given reports by report period, or None if any was evicted."""
+    rows = {row["report_period"]: row for row in _active_cache().get_line_items(ticker) or [] if row["period"] == period}
+    if any(report_period not in rows for report_period in report_periods):
+        return None
+    return rows
+
+
+def _cached_line_items(ticker: str, line_items: list[str], end_date: str, period: str, limit: int) -> list[LineItem] | None:
+    """Answer a query from cached rows, or return None if any requested field is missing."""
+    fields = [*LineItem.model_fields, *line_items]
+    for _, query in _covering_line_item_queries(ticker, end_date, period, limit):
+        if not set(line_items) <= set(query["fields"]):
+            continue
+        report_periods = query["report_periods"][:limit]
+        if (rows := _line_item_rows(ticker, period, report_periods)) is not None:
+            return [LineItem(**{k: rows[report_period].get(k) for k in fields}) for report_period in report_periods]
+    return None
+
+
+def _load_line_items(ticker: str, line_items: list[str], end_date: str, period: str, limit: int, api_key: str | None, api_secret: str | None) -> list[LineItem]:
+    """Fetch the line item fields the cache lacks from the active provider and merge them in."""
+    cache = _active_cache()
+    if (cached := _cached_line_items(ticker, line_items, end_date, period, limit)) is not None:
+        return cached
+
+    # Only request the fields a covering query has not fetched before, provided its cached rows are still there
+    query_key = f"{ticker}_{period}_{end_date}"
+    fetch_limit, known_fields = _fetch_limit(limit), []
+    for fetched, query in _covering_line_item_queries(ticker, end_date, period, limit):
+        if _line_item_rows(ticker, period, query["report_periods"]) is not None:
+            fetch_limit, known_fields = fetched, query["fields"]
+            break
+    if cache.is_empty("line_items", f"{query_key}_{fetch_limit}"):
+        return []
+    missing_fields = [field for field in line_items if field not in known_fields]
+
+    rows = get_data_provider().fetch_line_items(ticker, missing_fields, end_date, period, fetch_limit, api_key, api_secret)
+    if not rows:
+        cache.set_empty("line_items", f"{query_key}_{fetch_limit}")
+        return []
+
+    cache.set_line_items(ticker, rows)
+    cache.set_line_item_query(
+        ticker,
+        period,
+        end_date,
+        fetch_limit,
+        report_periods=[row["report_period"] for row in rows],
+        fields=sorted(set(known_fields) | set(missing_fields)),
+    )
+    cache.add_query_limit("line_items", query_key, fetch_limit)
+    return _cached_line_items(ticker, line_items, end_date, period, limit)
+
+
+def _fetch_line_items(ticker: str, line_items: list[str], end_date: str, period: str, limit: int, api_key: str | None, api_secret: str | None) -> list[dict]:
+    """Fetch report rows holding the base line item fields plus ``line_items`` from Alpaca fundamentals."""
     headers = _alpaca_headers(api_key, api_secret)
     fields = ",".join(line_items)
     url = (
@@ -165,14 +556,12 @@ def search_line_items(
     if response.status_code != 200:
         raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
     data = response.json()
-    fundamentals = data.get("fundamentals", []) or data.get("data", [])
-    search_results = []
+    fundamentals = (data.get("fundamentals", []) or data.get("data", []))[:limit]
+    rows = []
     for item in fundamentals:
         item["ticker"] = data.get("symbol", ticker)
-        search_results.append(LineItem(**{k: item.get(k) for k in LineItem.model_fields}))
-    if not search_results:
-        return []
-    return search_results[:limit]
+        rows.append({k: item.get(k) for k in [*LineItem.model_fields, *line_items]})
+    return rows
 
 
 def get_insider_trades(
@@ -184,36 +573,103 @@ def get_insider_trades(
     api_secret: str | None = None,
 ) -> list[InsiderTrade]:
     """Fetch insider trades from cache or API."""
+    if (bundle := get_data_bundle(ticker)) and (trades := bundle.get_insider_trades(end_date, start_date, limit)) is not None:
+        return trades
+    cache = _active_cache()
     # Create a cache key that includes all parameters to ensure exact matches
     cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
     
     # Check cache first - simple exact match
-    if cached_data := _cache.get_insider_trades(cache_key):
-        return [InsiderTrade(**trade) for trade in cached_data]
+    if cached_data := cache.get_insider_trades(cache_key, model=InsiderTrade):
+        return cached_data[::-1]
+    if cache.is_empty("insider_trades", cache_key):
+        return []
 
-    # If not in cache, fetch from API
+    # If not in cache, fetch from API (once, even if several callers miss at the same time)
+    return _shared_fetch(("insider_trades", cache_key), (("insider_trades", cache_key), ("empty_results", f"insider_trades:{cache_key}")), _load_insider_trades, ticker, end_date, start_date, limit, cache_key, api_key, api_secret)
+
+
+def _load_insider_trades(ticker: str, end_date: str, start_date: str | None, limit: int, cache_key: str, api_key: str | None, api_secret: str | None) -> list[InsiderTrade]:
+    """Fetch insider trades from the active provider and record them in the cache."""
+    cache = _active_cache()
+    if cached_data := cache.get_insider_trades(cache_key, model=InsiderTrade):
+        return cached_data[::-1]
+    if cache.is_empty("insider_trades", cache_key):
+        return []
+
+    all_trades = get_data_provider().fetch_insider_trades(ticker, end_date, start_date, limit, api_key, api_secret)
+    if not all_trades:
+        cache.set_empty("insider_trades", cache_key)
+        return []
+    cache.set_insider_trades(cache_key, [trade.model_dump() for trade in all_trades])
+    return all_trades
+
+
+def _fetch_insider_trades(ticker: str, end_date: str, start_date: str | None, limit: int, api_key: str | None, api_secret: str | None) -> list[InsiderTrade]:
+    """Fetch up to ``limit`` insider trades from Alpaca."""
+    return list(islice(chain.from_iterable(_iter_insider_trades(ticker, end_date, start_date, limit, api_key, api_secret)), limit))
+
+
+def _iter_insider_trades(ticker: str, end_date: str, start_date: str | None, limit: int, api_key: str | None, api_secret: str | None) -> Iterator[list[InsiderTrade]]:
+    """Yield pages of insider trades from Alpaca, following ``next_page_token``."""
     headers = _alpaca_headers(api_key, api_secret)
-    url = (
+    base_url = (
         f"https://data.alpaca.markets/v2/stocks/{ticker}/insider_trades"
         f"?end={end_date}&limit={limit}"
     )
     if start_date:
-        url += f"&start={start_date}"
-    response = _make_api_request(url, headers)
-    if response.status_code != 200:
-        raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
-    data = response.json()
-    trades = data.get("trades", [])
-    all_trades = []
+        base_url += f"&start={start_date}"
     fields = InsiderTrade.model_fields.keys()
-    for t in trades:
-        item = {k: t.get(k) for k in fields}
-        item["ticker"] = ticker
-        all_trades.append(InsiderTrade(**item))
-    if not all_trades:
-        return []
-    _cache.set_insider_trades(cache_key, [trade.model_dump() for trade in all_trades])
-    return all_trades
+    url = base_url
+    while True:
+        response = _make_api_request(url, headers)
+        if response.status_code != 200:
+            raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
+        data = response.json()
+        yield [InsiderTrade(**{**{k: t.get(k) for k in fields}, "ticker": ticker}) for t in data.get("trades") or []]
+        next_token = data.get("next_page_token")
+        if not next_token:
+            return
+        url = f"{base_url}&page_token={next_token}"
+
+
+def iter_insider_trades(
+    ticker: str,
+    end_date: str,
+    start_date: str | None = None,
+    limit: int = 1000,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+) -> Iterator[InsiderTrade]:
+    """Yield insider trades from cache or API one page at a time.
+
+    Pages are requested only as the consumer reads them, so stopping early
+    (for example with ``itertools.islice``) saves the remaining requests. A
+    result read to the end is cached like one from :func:`get_insider_trades`.
+    """
+    if (bundle := get_data_bundle(ticker)) and (trades := bundle.get_insider_trades(end_date, start_date, limit)) is not None:
+        yield from trades
+        return
+    cache = _active_cache()
+    cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
+    if cached_data := cache.get_insider_trades(cache_key, model=InsiderTrade):
+        yield from reversed(cached_data)
+        return
+    if cache.is_empty("insider_trades", cache_key):
+        return
+
+    trades: list[InsiderTrade] = []
+    for page in get_data_provider().iter_insider_trades(ticker, end_date, start_date, limit, api_key, api_secret):
+        page = page[: limit - len(trades)]
+        trades.extend(page)
+        yield from page
+        if len(trades) >= limit:
+            break
+    # Only reached when the consumer read every trade, so the result is complete
+    if trades:
+        cache.set_insider_trades(cache_key, [trade.model_dump() for trade in trades])
+    else:
+        cache.set_empty("insider_trades", cache_key)
 
 
 def get_company_news(
@@ -224,53 +680,208 @@ def get_company_news(
     api_key: str | None = None,
     api_secret: str | None = None,
 ) -> list[CompanyNews]:
-    """Fetch company news from cache or API."""
-    # Create a cache key that includes all parameters to ensure exact matches
-    cache_key = f"{ticker}_{start_date or 'none'}_{end_date}_{limit}"
-    
-    # Check cache first - simple exact match
-    if cached_data := _cache.get_company_news(cache_key):
-        return [CompanyNews(**news) for news in cached_data]
+    """Fetch company news from cache or API.
 
-    # If not in cache, fetch from API
-    headers = _alpaca_headers(api_key, api_secret)
-    all_news = []
-    current_end_date = end_date
+    Articles are cached per ticker along with the date ranges already
+    fetched, so a request whose end date has moved forward only downloads
+    the missing tail. Without a start date the whole archive is covered;
+    use :func:`iter_company_news` to read only the newest articles.
+    """
+    if (bundle := get_data_bundle(ticker)) and (news := bundle.get_company_news(end_date, start_date)) is not None:
+        return news
+    cache = _active_cache()
+    for gap_start, gap_end in cache.get_missing_news_ranges(ticker, start_date or NEWS_HISTORY_START, end_date):
+        # Fetched once, even if several callers miss the same gap at the same time
+        _shared_fetch(("company_news", ticker, gap_start, gap_end), (("company_news", ticker), ("news_ranges", ticker)), _load_news_gap, ticker, gap_start, gap_end, limit, api_key, api_secret)
+
+    # Every range is cached now, so this only reads the cache
+    return list(iter_company_news(ticker, end_date, start_date, page_size=limit, api_key=api_key, api_secret=api_secret))
+
+
+def iter_company_news(
+    ticker: str,
+    end_date: str,
+    start_date: str | None = None,
+    page_size: int = 1000,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+) -> Iterator[CompanyNews]:
+    """Yield company news newest first, fetching uncovered dates page by page as the consumer reads.
+
+    Cached articles are served directly. Uncovered date ranges are requested
+    one page of ``page_size`` articles at a time, and only as far back as the
+    consumer iterates, so ``islice(iter_company_news(...), 100)`` stops
+    downloading after about 100 articles. Fetched pages are cached and the
+    days they fully cover are recorded, so later calls skip them.
+    """
+    start_date = start_date or NEWS_HISTORY_START
+    if (bundle := get_data_bundle(ticker)) and (held := bundle.held_company_news(end_date)) is not None:
+        news, held_from = held
+        yield from (item for item in news if item.date[:10] >= start_date)
+        if held_from is None or start_date >= held_from:
+            return
+        # Articles older than the bundle holds come from the cache or the API
+        end_date = _shift_date(held_from, -1)
+    yield from _news_between(_active_cache(), ticker, start_date, end_date, page_size, api_key, api_secret)
+
+
+def _news_between(cache, ticker: str, start_date: str, end_date: str, page_size: int, api_key: str | None, api_secret: str | None) -> Iterator[CompanyNews]:
+    """Yield cached articles and stream uncovered ranges between two dates, newest first."""
+    cursor = end_date
+    for gap_start, gap_end in reversed(cache.get_missing_news_ranges(ticker, start_date, end_date)):
+        yield from _cached_news(cache, ticker, _shift_date(gap_end, 1), cursor)
+        yield from _stream_news_gap(cache, ticker, gap_start, gap_end, page_size, api_key, api_secret)
+        cursor = _shift_date(gap_start, -1)
+    yield from _cached_news(cache, ticker, start_date, cursor)
+
+
+def get_recent_company_news(
+    ticker: str,
+    end_date: str,
+    lookback_days: int = 0,
+    articles: int = 0,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+) -> tuple[list[CompanyNews], str | None]:
+    """Fetch the newest ``articles`` articles and every article of the last ``lookback_days`` days, newest first.
 
+    News is read through :func:`iter_company_news` only as far back as both
+    need. Also returns the first day from which every article was read, or
+    None if the whole archive was.
+    """
+    window_start = _shift_date(end_date, -lookback_days)
+    news: list[CompanyNews] = []
+    items = iter_company_news(ticker, end_date, page_size=1000 if lookback_days else max(articles, 1), api_key=api_key, api_secret=api_secret)
+    try:
+        for item in items:
+            day = item.date[:10]
+            # Stop at the first older day once both are satisfied, so every day kept is complete
+            if len(news) >= articles and day < window_start and (not news or day < news[-1].date[:10]):
+                return news, _shift_date(day, 1)
+            news.append(item)
+    finally:
+        items.close()
+    return news, None
+
+
+def _shift_date(day: str, days: int) -> str:
+    return (datetime.date.fromisoformat(day) + datetime.timedelta(days=days)).isoformat()
+
+
+def _cached_news(cache, ticker: str, start_date: str, end_date: str) -> Iterator[CompanyNews]:
+    """Yield cached articles published between two dates, newest first."""
+    news = cache.get_company_news(ticker, model=CompanyNews) or []
+    # Articles are in date order, so the window's bounds are found by binary search
+    lo = bisect_left(news, start_date, key=lambda item: item.date[:10])
+    hi = bisect_right(news, end_date, key=lambda item: item.date[:10])
+    yield from reversed(news[lo:hi])
+
+
+def _stream_news_gap(cache, ticker: str, start_date: str, end_date: str, page_size: int, api_key: str | None, api_secret: str | None) -> Iterator[CompanyNews]:
+    """Yield an uncovered range's articles page by page, caching each page as it arrives.
+
+    Every page goes through :func:`_shared_fetch`, so threads and processes
+    streaming the same range download each page once.
+    """
+    seen: set[str] = set()
+    # Newest day that may still miss articles; days after it are cached once a page reaches past them
+    cursor, token = end_date, None
     while True:
-        url = (
-            f"https://data.alpaca.markets/v1beta1/news?symbols={ticker}&end={current_end_date}"
-            f"&limit={limit}"
-        )
-        if start_date:
-            url += f"&start={start_date}"
-        response = _make_api_request(url, headers)
-        if response.status_code != 200:
-            raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
+        key = ("company_news_page", ticker, start_date, end_date, token)
+        page = _shared_fetch(key, (("company_news", ticker), ("news_ranges", ticker)), _load_news_page, ticker, start_date, end_date, cursor, page_size, token, api_key, api_secret)
+        if page is None:
+            # Another process stored these days meanwhile, so the rest is read from the cache
+            yield from (item for item in _news_between(cache, ticker, start_date, cursor, page_size, api_key, api_secret) if item.url not in seen)
+            return
+        items, token = page
+        new_items = [item for item in items if item.url not in seen]
+        seen.update(item.url for item in new_items)
+        yield from new_items
+        if token is None:
+            return
+        if items:
+            cursor = min(cursor, min(item.date for item in items)[:10])
+
+
+def _load_news_page(ticker: str, start_date: str, end_date: str, cursor: str, page_size: int, token: str | None, api_key: str | None, api_secret: str | None) -> tuple[list[CompanyNews], str | None] | None:
+    """Fetch one page of a news range and record the days it completes.
+
+    Returns the page and the token of the next one, or None if the days up
+    to ``cursor`` were cached by someone else while this waited for the lease.
+    """
+    cache = _active_cache()
+    missing = cache.get_missing_news_ranges(ticker, start_date, cursor)
+    if not missing or missing[-1][1] < cursor:
+        return None
+    items, next_token = get_data_provider().fetch_company_news_page(ticker, start_date, end_date, page_size, token, api_key, api_secret)
+    cache.set_company_news(ticker, [item.model_dump() for item in items])
+    if next_token is None:
+        cache.add_news_range(ticker, start_date, cursor)
+    elif items:
+        # Pages arrive newest first, so every day after the oldest fetched article is complete
+        covered_from = _shift_date(min(item.date for item in items)[:10], 1)
+        if covered_from <= cursor:
+            cache.add_news_range(ticker, covered_from, cursor)
+    return items, next_token
+
+
+def _load_news_gap(ticker: str, start_date: str, end_date: str, limit: int, api_key: str | None, api_secret: str | None):
+    """Fetch one uncovered date range of news for a ticker and record it in the cache."""
+    cache = _active_cache()
+    if not cache.get_missing_news_ranges(ticker, start_date, end_date):
+        return
+    news = get_data_provider().fetch_company_news(ticker, start_date, end_date, limit, api_key, api_secret)
+    # Stored even when empty so the recorded range stays valid for quiet tickers
+    cache.set_company_news(ticker, [item.model_dump() for item in news])
+    cache.add_news_range(ticker, start_date, end_date)
+
+
+def _fetch_company_news(ticker: str, start_date: str, end_date: str, limit: int, api_key: str | None, api_secret: str | None) -> list[CompanyNews]:
+    """Fetch every article between start_date and end_date, newest first."""
+    news_by_url: dict[str, CompanyNews] = {}
+    for page in _iter_company_news(ticker, start_date, end_date, limit, api_key, api_secret):
+        for item in page:
+            news_by_url.setdefault(item.url, item)
+    return list(news_by_url.values())
+
+
+def _iter_company_news(ticker: str, start_date: str, end_date: str, limit: int, api_key: str | None, api_secret: str | None) -> Iterator[list[CompanyNews]]:
+    """Yield pages of up to ``limit`` articles between two dates, newest first, following ``next_page_token``."""
+    token = None
+    while True:
+        page, token = _fetch_company_news_page(ticker, start_date, end_date, limit, token, api_key, api_secret)
+        yield page
+        if not token:
+            return
 
-        data = response.json()
-        news_items = data.get("news", [])
-        for n in news_items:
-            item = {
-                "ticker": ticker,
-                "title": n.get("headline"),
-                "author": n.get("author"),
-                "source": n.get("source"),
-                "date": n.get("created_at"),
-                "url": n.get("url"),
-                "sentiment": n.get("sentiment"),
-            }
-            all_news.append(CompanyNews(**item))
 
-        next_token = data.get("next_page_token")
-        if not next_token or len(news_items) < limit:
-            break
-        current_end_date = all_news[-1].date.split("T")[0]
+def _fetch_company_news_page(ticker: str, start_date: str, end_date: str, limit: int, page_token: str | None, api_key: str | None, api_secret: str | None) -> tuple[list[CompanyNews], str | None]:
+    """Fetch one page of up to ``limit`` articles, newest first, and the token of the next page (None after the last)."""
+    headers = _alpaca_headers(api_key, api_secret)
+    url = (
+        f"https://data.alpaca.markets/v1beta1/news?symbols={ticker}&end={end_date}T23:59:59Z"
+        f"&limit={limit}&start={start_date}"
+    )
+    if page_token:
+        url = f"{url}&page_token={page_token}"
+    response = _make_api_request(url, headers)
+    if response.status_code != 200:
+        raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
 
-    if not all_news:
-        return []
-    _cache.set_company_news(cache_key, [news.model_dump() for news in all_news])
-    return all_news
+    data = response.json()
+    page = [
+        CompanyNews(
+            ticker=ticker,
+            title=n.get("headline"),
+            author=n.get("author"),
+            source=n.get("source"),
+            date=n.get("created_at"),
+            url=n.get("url"),
+            sentiment=n.get("sentiment"),
+        )
+        for n in data.get("news") or []
+    ]
+    return page, data.get("next_page_token") or None
 
 
 def get_market_cap(
@@ -293,19 +904,34 @@ def get_market_cap(
     return financial_metrics[0].market_cap
 
 
-def prices_to_df(prices: list[Price]) -> pd.DataFrame:
-    """Convert prices to a DataFrame."""
-    df = pd.DataFrame([p.model_dump() for p in prices])
-    df["Date"] = pd.to_datetime(df["time"])
-    df.set_index("Date", inplace=True)
-    numeric_cols = ["open", "close", "high", "low", "volume"]
-    for col in numeric_cols:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-    df.sort_index(inplace=True)
-    return df
+def get_request_stats() -> dict[str, int]:
+    """Return how many data fetches ran and how many requests were avoided.
+
+    ``saved_requests`` counts concurrent duplicates that were coalesced and
+    ``empty_hits`` counts lookups answered by a cached empty result.
+    """
+    stats = _singleflight.stats()
+    empty = _cache.empty_stats()
+    return {
+        "fetches": stats["executed"],
+        "saved_requests": stats["coalesced"],
+        "in_flight": stats["in_flight"],
+        "empty_results": empty["entries"],
+        "empty_hits": empty["hits"],
+    }
+
+
+def prices_to_df(prices: PriceSeries | list[Price]) -> pd.DataFrame:
+    """Convert prices to a DataFrame indexed by UTC timestamp.
+
+    A ``PriceSeries`` is wrapped without copying its arrays; a list of
+    ``Price`` objects is converted to a series first.
+    """
+    if not isinstance(prices, PriceSeries):
+        prices = PriceSeries.from_prices(prices)
+    return prices.to_df()
 
 
 # Update the get_price_data function to use the new functions
 def get_price_data(ticker: str, start_date: str, end_date: str, api_key: str = None) -> pd.DataFrame:
-    prices = get_prices(ticker, start_date, end_date, api_key=api_key)
-    return prices_to_df(prices)
+    return prices_to_df(get_price_series(ticker, start_date, end_date, api_key=api_key))
@@ -0,0 +1,206 @@
+"""Asyncio counterparts of the data functions in ``src.tools.api``.
+
+Each coroutine runs the synchronous implementation in a worker thread, so it
+shares the same cache, pooled HTTP client and pydantic return types. The
+number of requests in flight is bounded by a per-event-loop semaphore, which
+lets callers fan out over many tickers and datasets without flooding the
+API: wall-clock time then tracks the slowest request rather than the sum.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from src.config import get_http_config
+from src.data.models import CompanyNews, FinancialMetrics, InsiderTrade, LineItem, Price
+from src.data.price_series import PriceSeries
+from src.tools import api
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Return the concurrency limiter for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(get_http_config()["max_concurrent_requests"])
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the worker pool, sized to the HTTP connection pool it feeds."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=get_http_config()["pool_size"], thread_name_prefix="data-api")
+    return _executor
+
+
+async def _run(func: Callable[..., T], *args: Any, semaphore: Optional[asyncio.Semaphore] = None, **kwargs: Any) -> T:
+    async with semaphore or _get_semaphore():
+        loop = asyncio.get_running_loop()
+        # Copy the context so the worker sees the caller's active data provider
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(_get_executor(), functools.partial(context.run, func, *args, **kwargs))
+
+
+async def get_prices_async(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> list[Price]:
+    """Async version of :func:`src.tools.api.get_prices`."""
+    return await _run(api.get_prices, ticker, start_date, end_date, api_key=api_key, api_secret=api_secret, semaphore=semaphore)
+
+
+async def get_prices_batch_async(
+    tickers: List[str],
+    start_date: str,
+    end_date: str,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> Dict[str, list[Price]]:
+    """Async version of :func:`src.tools.api.get_prices_batch`."""
+    return await _run(api.get_prices_batch, tickers, start_date, end_date, api_key=api_key, api_secret=api_secret, semaphore=semaphore)
+
+
+async def get_price_series_batch_async(
+    tickers: List[str],
+    start_date: str,
+    end_date: str,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> Dict[str, PriceSeries]:
+    """Async version of :func:`src.tools.api.get_price_series_batch`."""
+    return await _run(api.get_price_series_batch, tickers, start_date, end_date, api_key=api_key, api_secret=api_secret, semaphore=semaphore)
+
+
+async def get_financial_metrics_async(
+    ticker: str,
+    end_date: str,
+    period: str = "ttm",
+    limit: int = 10,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> list[FinancialMetrics]:
+    """Async version of :func:`src.tools.api.get_financial_metrics`."""
+    return await _run(api.get_financial_metrics, ticker, end_date, period=period, limit=limit, api_key=api_key, api_secret=api_secret, semaphore=semaphore)
+
+
+async def search_line_items_async(
+    ticker: str,
+    line_items: list[str],
+    end_date: str,
+    period: str = "ttm",
+    limit: int = 10,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> list[LineItem]:
+    """Async version of :func:`src.tools.api.search_line_items`."""
+    return await _run(api.search_line_items, ticker, line_items, end_date, period=period, limit=limit, api_key=api_key, api_secret=api_secret, semaphore=semaphore)
+
+
+async def get_insider_trades_async(
+    ticker: str,
+    end_date: str,
+    start_date: str | None = None,
+    limit: int = 1000,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> list[InsiderTrade]:
+    """Async version of :func:`src.tools.api.get_insider_trades`."""
+    return await _run(api.get_insider_trades, ticker, end_date, start_date=start_date, limit=limit, api_key=api_key, api_secret=api_secret, semaphore=semaphore)
+
+
+async def get_company_news_async(
+    ticker: str,
+    end_date: str,
+    start_date: str | None = None,
+    limit: int = 1000,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> list[CompanyNews]:
+    """Async version of :func:`src.tools.api.get_company_news`."""
+    return await _run(api.get_company_news, ticker, end_date, start_date=start_date, limit=limit, api_key=api_key, api_secret=api_secret, semaphore=semaphore)
+
+
+async def get_recent_company_news_async(
+    ticker: str,
+    end_date: str,
+    lookback_days: int = 0,
+    articles: int = 0,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> tuple[list[CompanyNews], str | None]:
+    """Async version of :func:`src.tools.api.get_recent_company_news`."""
+    return await _run(api.get_recent_company_news, ticker, end_date, lookback_days=lookback_days, articles=articles, api_key=api_key, api_secret=api_secret, semaphore=semaphore)
+
+
+async def get_market_cap_async(
+    ticker: str,
+    end_date: str,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> float | None:
+    """Async version of :func:`src.tools.api.get_market_cap`."""
+    return await _run(api.get_market_cap, ticker, end_date, api_key=api_key, api_secret=api_secret, semaphore=semaphore)
+
+
+async def prefetch_async(
+    tickers: List[str],
+    start_date: str,
+    end_date: str,
+    price_start_date: str | None = None,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+    max_concurrency: int | None = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Warm the cache with prices, metrics, insider trades and news for all tickers.
+
+    All ticker/dataset requests are issued concurrently, bounded by
+    ``max_concurrency`` (or the configured default). Errors are returned in
+    place of the failing dataset rather than cancelling the other requests.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    keys = dict(api_key=api_key, api_secret=api_secret, semaphore=semaphore)
+    pending = {}
+    # Prices for the whole universe go through the multi-symbol bars endpoint
+    prices = asyncio.ensure_future(get_prices_batch_async(tickers, price_start_date or start_date, end_date, **keys))
+    for ticker in tickers:
+        pending[(ticker, "financial_metrics")] = get_financial_metrics_async(ticker, end_date, limit=10, **keys)
+        pending[(ticker, "insider_trades")] = get_insider_trades_async(ticker, end_date, start_date=start_date, limit=1000, **keys)
+        pending[(ticker, "company_news")] = get_company_news_async(ticker, end_date, start_date=start_date, limit=1000, **keys)
+
+    results = await asyncio.gather(*pending.values(), return_exceptions=True)
+    prices_by_ticker = (await asyncio.gather(prices, return_exceptions=True))[0]
+    prefetched: Dict[str, Dict[str, Any]] = {}
+    for ticker in tickers:
+        prices_result = prices_by_ticker if isinstance(prices_by_ticker, Exception) else prices_by_ticker.get(ticker, [])
+        prefetched[ticker] = {"prices": prices_result}
+    for (ticker, dataset), result in zip(pending, results):
+        prefetched[ticker][dataset] = result
+    return prefetched
@@ -0,0 +1,124 @@
+"""Record-and-replay archive for outbound HTTP requests.
+
+In ``record`` mode every request sent through the shared
+:class:`~src.tools.http_client.HttpClient` is stored together with its
+response; in ``replay`` mode responses are served from the archive and no
+connection is opened, so a backtest runs against exactly the data and status
+codes of the recorded run with no network latency or rate limiting.
+
+The archive is a single SQLite file indexed by a fingerprint of the method,
+URL (with query parameters) and JSON body. Request headers are left out of
+the fingerprint and never stored, so API keys do not end up on disk.
+Response bodies are zlib-compressed. Repeated identical requests, such as
+polling an order or retrying after a 429, are numbered so replay returns
+them in the recorded order; once a request has been replayed as many times
+as it was recorded, its last response is repeated.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import zlib
+from typing import Any, Dict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+MODES = ("record", "replay")
+
+
+class ArchiveMissError(LookupError):
+    """Raised in replay mode for a request that was never recorded."""
+
+
+class HttpArchive:
+    """SQLite archive of request/response pairs keyed by request fingerprint."""
+
+    def __init__(self, path: str, mode: str = "replay") -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown HTTP archive mode: {mode}")
+        self.path = path
+        self.mode = mode
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS exchanges (
+                fingerprint TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                method TEXT NOT NULL,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                PRIMARY KEY (fingerprint, seq)
+            )
+            """
+        )
+        self._conn.commit()
+        # Times each fingerprint was seen in this session, which picks the recorded response to serve
+        self._seen: Dict[str, int] = {}
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @staticmethod
+    def fingerprint(method: str, url: str, params: Any = None, json_body: Any = None) -> str:
+        """Return a stable key for a request, independent of headers and parameter order."""
+        parts = urlsplit(requests.Request(method.upper(), url, params=params).prepare().url)
+        prepared_url = urlunsplit(parts._replace(query=urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))))
+        body = json.dumps(json_body, sort_keys=True, default=str) if json_body is not None else ""
+        return hashlib.sha256(f"{method.upper()} {prepared_url}\n{body}".encode()).hexdigest()
+
+    def _next_seq(self, key: str) -> int:
+        with self._lock:
+            seq = self._seen.get(key, 0)
+            self._seen[key] = seq + 1
+            return seq
+
+    def record(self, method: str, url: str, response: requests.Response, params: Any = None, json_body: Any = None) -> None:
+        """Store a response under the request's fingerprint and call number."""
+        key = self.fingerprint(method, url, params, json_body)
+        seq = self._next_seq(key)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO exchanges (fingerprint, seq, method, url, status, headers, body) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, seq, method.upper(), response.url or url, response.status_code, json.dumps(dict(response.headers)), zlib.compress(response.content)),
+            )
+
+    def replay(self, method: str, url: str, params: Any = None, json_body: Any = None) -> requests.Response:
+        """Rebuild the recorded response for a request, or raise :class:`ArchiveMissError`."""
+        key = self.fingerprint(method, url, params, json_body)
+        seq = self._next_seq(key)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status, headers, body FROM exchanges WHERE fingerprint = ? AND seq <= ? ORDER BY seq DESC LIMIT 1",
+                (key, seq),
+            ).fetchone()
+        if row is None:
+            raise ArchiveMissError(f"No recorded response for {method.upper()} {url} in {self.path}")
+        response = requests.Response()
+        response.url, response.status_code = row[0], row[1]
+        response.headers = CaseInsensitiveDict(json.loads(row[2]))
+        response._content = zlib.decompress(row[3])
+        response.encoding = "utf-8"
+        return response
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM exchanges").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["ArchiveMissError", "HttpArchive", "MODES"]
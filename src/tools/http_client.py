@@ -0,0 +1,117 @@
+"""Shared, pooled HTTP client for all Alpaca requests.
+
+Every data and trading call goes through one :class:`HttpClient`, so TCP and
+TLS connections are kept alive and reused instead of being re-established for
+each request. The connection pool lives in a single ``HTTPAdapter`` which is
+mounted on a per-thread ``requests.Session``: the pool itself is thread-safe,
+while session state such as cookies is never shared between threads.
+
+An optional :class:`~src.tools.http_archive.HttpArchive` records every
+exchange or replays recorded ones without touching the network; see
+:func:`use_archive` and the ``archive_mode`` HTTP setting.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.config import get_http_config
+from src.tools.http_archive import HttpArchive
+
+
+class HttpClient:
+    """Keep-alive HTTP client with a bounded connection pool and default timeouts."""
+
+    def __init__(self, pool_size: int = 32, timeout: Tuple[float, float] = (5.0, 30.0), archive: Optional[HttpArchive] = None) -> None:
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.archive = archive
+        self._adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the calling thread's session, which shares the connection pool."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            self._local.session = session
+        return session
+
+    @property
+    def replaying(self) -> bool:
+        """True when responses come from the archive instead of the network."""
+        return self.archive is not None and self.archive.replaying
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request, applying the default timeout unless one is given."""
+        archive = self.archive
+        if archive is not None and archive.replaying:
+            return archive.replay(method, url, kwargs.get("params"), kwargs.get("json"))
+        kwargs.setdefault("timeout", self.timeout)
+        response = self.session.request(method, url, **kwargs)
+        if archive is not None:
+            archive.record(method, url, response, kwargs.get("params"), kwargs.get("json"))
+        return response
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._adapter.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Get the process-wide HTTP client, creating it from config on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                http_cfg = get_http_config()
+                archive = HttpArchive(http_cfg["archive_path"], http_cfg["archive_mode"]) if http_cfg["archive_mode"] else None
+                _client = HttpClient(
+                    pool_size=http_cfg["pool_size"],
+                    timeout=(http_cfg["connect_timeout"], http_cfg["read_timeout"]),
+                    archive=archive,
+                )
+    return _client
+
+
+@contextmanager
+def use_archive(path: str, mode: str) -> Iterator[HttpArchive]:
+    """Record to or replay from the archive at ``path`` for the duration of the block.
+
+    Run the block inside :func:`src.tools.api.use_memory_cache` as well, so
+    no request is answered by the persistent cache instead of the archive.
+    """
+    client = get_http_client()
+    previous = client.archive
+    archive = HttpArchive(path, mode)
+    client.archive = archive
+    try:
+        yield archive
+    finally:
+        client.archive = previous
+        archive.close()
+
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    """Send a GET request through the shared client."""
+    return get_http_client().request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs: Any) -> requests.Response:
+    """Send a POST request through the shared client."""
+    return get_http_client().request("POST", url, **kwargs)
+
+
+__all__ = ["HttpClient", "get_http_client", "get", "post", "use_archive"]
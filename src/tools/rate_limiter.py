@@ -0,0 +1,148 @@
+"""Process-wide token-bucket rate limiter driven by Alpaca's rate-limit headers.
+
+Every request reserves a token before it is sent. The bucket's capacity and
+refill rate come from ``X-RateLimit-Limit`` (requests per minute), the
+remaining balance is corrected from ``X-RateLimit-Remaining`` after each
+response, and once the server reports no requests left the limiter holds all
+callers until ``X-RateLimit-Reset``. Until the first headers arrive requests
+are not throttled.
+
+Reservations are made under a lock and each caller sleeps at most once for
+its own slot, so the limiter can be shared between threads; asyncio callers
+reach it through the worker threads of :mod:`src.tools.api_async`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional
+
+
+class RateLimiter:
+    """Token bucket that paces requests to stay within the server's limits."""
+
+    def __init__(
+        self,
+        limit_per_minute: Optional[float] = None,
+        clock: Optional[Callable[[], float]] = None,
+        sleep: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._limit: Optional[float] = None
+        self._tokens = 0.0
+        self._updated_at = self._now()
+        self._blocked_until = 0.0
+        self.waits = 0
+        self.total_wait = 0.0
+        self.rate_limited_responses = 0
+        if limit_per_minute:
+            self._set_limit(limit_per_minute)
+
+    def _now(self) -> float:
+        return self._clock() if self._clock else time.time()
+
+    def _set_limit(self, limit: float) -> None:
+        if self._limit is None:
+            self._tokens = limit
+        self._limit = limit
+
+    def _refill(self, now: float) -> None:
+        if self._limit is not None:
+            rate = self._limit / 60.0
+            self._tokens = min(self._limit, self._tokens + (now - self._updated_at) * rate)
+        self._updated_at = now
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = self._now()
+            self._refill(now)
+            wait = max(0.0, self._blocked_until - now)
+            if self._limit is not None:
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / (self._limit / 60.0))
+            if wait > 0:
+                self.waits += 1
+                self.total_wait += wait
+            return wait
+
+    def acquire(self) -> float:
+        """Block until a request may be sent; returns the time waited."""
+        wait = self._reserve()
+        if wait > 0:
+            (self._sleep or time.sleep)(wait)
+        return wait
+
+    def update(self, headers: Mapping[str, Any]) -> None:
+        """Resynchronize the bucket with the limit headers of a response."""
+        limit = _header_number(headers, "X-RateLimit-Limit")
+        remaining = _header_number(headers, "X-RateLimit-Remaining")
+        reset = _header_number(headers, "X-RateLimit-Reset")
+        with self._lock:
+            self._refill(self._now())
+            if limit:
+                self._set_limit(limit)
+            if remaining is not None and self._limit is not None:
+                self._tokens = min(self._tokens, remaining)
+            if remaining == 0 and reset is not None:
+                self._blocked_until = max(self._blocked_until, reset)
+
+    def penalize(self, headers: Mapping[str, Any], attempt: int) -> float:
+        """Pause all callers after a 429 and return the delay before the next attempt.
+
+        The pause lasts until ``X-RateLimit-Reset`` when the server sends it,
+        and otherwise falls back to a linear backoff of 60s, 90s, 120s, ...
+        """
+        reset = _header_number(headers, "X-RateLimit-Reset")
+        with self._lock:
+            now = self._now()
+            self.rate_limited_responses += 1
+            resume_at = reset if reset is not None and reset > now else now + 60 + 30 * attempt
+            self._blocked_until = max(self._blocked_until, resume_at)
+            self._tokens = min(self._tokens, 0.0)
+            return self._blocked_until - now
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current bucket state and throttling counters."""
+        with self._lock:
+            now = self._now()
+            self._refill(now)
+            return {
+                "limit_per_minute": self._limit,
+                "tokens": self._tokens if self._limit is not None else None,
+                "blocked_for": max(0.0, self._blocked_until - now),
+                "waits": self.waits,
+                "total_wait_seconds": self.total_wait,
+                "rate_limited_responses": self.rate_limited_responses,
+            }
+
+
+def _header_number(headers: Mapping[str, Any], name: str) -> Optional[float]:
+    """Read a numeric header, ignoring missing or malformed values."""
+    try:
+        value = headers.get(name)
+    except AttributeError:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+_rate_limiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter shared by all Alpaca requests."""
+    return _rate_limiter
+
+
+__all__ = ["RateLimiter", "get_rate_limiter"]
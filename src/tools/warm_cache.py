@@ -0,0 +1,212 @@
+"""Prefill the data cache for a universe of tickers.
+
+Run before market open so the day's agent runs and backtests are answered
+from the cache alone::
+
+    python -m src.tools.warm_cache --tickers-file universe.txt --start 2024-01-01 --end 2024-12-31
+
+For every ticker this downloads daily bars plus the requests the graph's
+prefetch node makes for the selected analysts (all of them by default), as
+planned from their declared data requirements (see
+:mod:`src.data.requirements`).
+Requests run concurrently up to ``--concurrency`` and all go through the
+shared rate limiter, so a large universe is paced by the API's limits rather
+than by round trips. Each finished ticker/dataset pair is appended to a
+progress file; running the same command again after an interruption skips
+the pairs already done and retries the ones that failed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, TextIO
+
+from colorama import Fore, Style
+from dateutil.relativedelta import relativedelta
+
+from src.config import get_http_config
+from src.data.requirements import DataRequirements
+from src.tools import api_async
+from src.tools.api import PRICE_BATCH_SIZE, get_rate_limit_stats, get_request_stats
+
+DEFAULT_PROGRESS_PATH = str(Path(__file__).resolve().parent.parent.parent / "data" / "warm_cache_progress.txt")
+
+
+def read_tickers(path: str) -> List[str]:
+    """Read tickers from a file, one per line or comma separated; ``#`` starts a comment."""
+    tickers = []
+    with open(path) as f:
+        for line in f:
+            tickers.extend(ticker.strip().upper() for ticker in line.split("#", 1)[0].split(",") if ticker.strip())
+    return list(dict.fromkeys(tickers))
+
+
+class WarmProgress:
+    """Append-only record of the ticker/dataset pairs a warm-up has finished.
+
+    The first line of the file holds the run's parameters. A file written for
+    different parameters is started over rather than resumed. Without a path
+    progress is only kept in memory.
+    """
+
+    def __init__(self, path: Optional[str], params: Dict[str, Any]) -> None:
+        self.path = path
+        self.done: Set[str] = set()
+        self._file: Optional[TextIO] = None
+        if path is None:
+            return
+        header = json.dumps(params, sort_keys=True)
+        lines = Path(path).read_text().splitlines() if os.path.exists(path) else []
+        if lines and lines[0] == header:
+            self.done.update(lines[1:])
+            self._file = open(path, "a")
+        else:
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._file = open(path, "w")
+            self._file.write(header + "\n")
+            self._file.flush()
+
+    def mark(self, task: str) -> None:
+        self.done.add(task)
+        if self._file is not None:
+            self._file.write(task + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _warm_jobs(tickers: List[str], start_date: str, end_date: str, plan: DataRequirements, done: Set[str], **keys: Any) -> List[tuple[List[str], Callable[[], Awaitable]]]:
+    """Return (task ids, request) pairs for every task not yet done."""
+    jobs = []
+    # Bars for many tickers come from one multi-symbol request
+    pending_prices = [ticker for ticker in tickers if f"{ticker}:prices" not in done]
+    for i in range(0, len(pending_prices), PRICE_BATCH_SIZE):
+        chunk = pending_prices[i : i + PRICE_BATCH_SIZE]
+        jobs.append(([f"{ticker}:prices" for ticker in chunk], functools.partial(api_async.get_price_series_batch_async, chunk, start_date, end_date, **keys)))
+    for ticker in tickers:
+        for period, limit in plan.financial_metrics.items():
+            jobs.append(([f"{ticker}:financial_metrics:{period}"], functools.partial(api_async.get_financial_metrics_async, ticker, end_date, period=period, limit=limit, **keys)))
+        for request in plan.line_items:
+            jobs.append(([f"{ticker}:line_items:{request.period}"], functools.partial(api_async.search_line_items_async, ticker, list(request.fields), end_date, period=request.period, limit=request.limit, **keys)))
+        if plan.insider_trades:
+            jobs.append(([f"{ticker}:insider_trades"], functools.partial(api_async.get_insider_trades_async, ticker, end_date, limit=plan.insider_trades, **keys)))
+        if plan.reads_news:
+            news = functools.partial(api_async.get_recent_company_news_async, ticker, end_date, lookback_days=plan.news_lookback_days, articles=plan.news_articles, **keys)
+            jobs.append(([f"{ticker}:company_news"], news))
+    return [(tasks, request) for tasks, request in jobs if not all(task in done for task in tasks)]
+
+
+async def warm_cache(
+    tickers: List[str],
+    start_date: str,
+    end_date: str,
+    plan: DataRequirements,
+    concurrency: Optional[int] = None,
+    progress: Optional[WarmProgress] = None,
+    report_every: Optional[float] = None,
+    api_key: str | None = None,
+    api_secret: str | None = None,
+) -> Dict[str, Any]:
+    """Fetch prices and the planned requests for every (distinct) ticker that ``progress`` has not recorded as done.
+
+    Returns how many tasks ran, how many were skipped as already done and
+    the error of each task that failed. Failed tasks are not recorded, so
+    the next run retries them.
+    """
+    progress = progress or WarmProgress(None, {})
+    semaphore = asyncio.Semaphore(concurrency or get_http_config()["max_concurrent_requests"])
+    jobs = _warm_jobs(tickers, start_date, end_date, plan, progress.done, api_key=api_key, api_secret=api_secret, semaphore=semaphore)
+    total = sum(len(tasks) for tasks, _ in jobs)
+    failures: Dict[str, Exception] = {}
+    finished = 0
+
+    async def run(tasks: List[str], request: Callable[[], Awaitable]) -> None:
+        nonlocal finished
+        try:
+            await request()
+        except Exception as e:
+            failures.update(dict.fromkeys(tasks, e))
+        else:
+            for task in tasks:
+                progress.mark(task)
+        finished += len(tasks)
+
+    async def report() -> None:
+        start = time.perf_counter()
+        while True:
+            await asyncio.sleep(report_every)
+            print(f"  {finished}/{total} tasks, {finished / (time.perf_counter() - start):.1f} tasks/s")
+
+    reporter = asyncio.ensure_future(report()) if report_every else None
+    try:
+        await asyncio.gather(*(run(tasks, request) for tasks, request in jobs))
+    finally:
+        if reporter is not None:
+            reporter.cancel()
+    return {"tasks": total, "skipped": len(tickers) * (1 + plan.request_count) - total, "failures": failures}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Prefill the data cache for a universe of tickers")
+    universe = parser.add_mutually_exclusive_group(required=True)
+    universe.add_argument("--tickers", type=str, help="Comma-separated list of stock ticker symbols")
+    universe.add_argument("--tickers-file", type=str, help="File with one ticker per line (or comma separated)")
+    parser.add_argument("--end", type=str, default=datetime.now().strftime("%Y-%m-%d"), help="End date in YYYY-MM-DD format (default: today)")
+    parser.add_argument("--start", type=str, help="Start date of prices in YYYY-MM-DD format (default: one year before --end)")
+    parser.add_argument("--analysts", type=str, help="Comma-separated analysts whose data to warm (default: all)")
+    parser.add_argument("--concurrency", type=int, help="Maximum requests in flight (default: http.max_concurrent_requests)")
+    parser.add_argument("--progress-file", type=str, default=DEFAULT_PROGRESS_PATH, help="File recording finished tasks so an interrupted run can resume")
+    parser.add_argument("--restart", action="store_true", help="Ignore the progress file and warm every task again")
+    parser.add_argument("--report-every", type=float, default=10.0, help="Seconds between progress lines (0 to disable)")
+    args = parser.parse_args(argv)
+
+    tickers = read_tickers(args.tickers_file) if args.tickers_file else list(dict.fromkeys(ticker.strip().upper() for ticker in args.tickers.split(",") if ticker.strip()))
+    start_date = args.start or (datetime.strptime(args.end, "%Y-%m-%d") - relativedelta(years=1)).strftime("%Y-%m-%d")
+    if args.restart and os.path.exists(args.progress_file):
+        os.remove(args.progress_file)
+    # Importing the analysts loads every agent module, so it is only done when run as a command
+    from src.utils.analysts import get_data_requirements
+
+    plan = get_data_requirements([analyst.strip() for analyst in args.analysts.split(",")] if args.analysts else None)
+    progress = WarmProgress(args.progress_file, {"start": start_date, "end": args.end, "plan": plan.to_dict()})
+
+    print(f"Warming the cache for {len(tickers)} tickers from {start_date} to {args.end} ({1 + plan.request_count} requests per ticker)...")
+    requests_before, limiter_before = get_request_stats(), get_rate_limit_stats()
+    started = time.perf_counter()
+    try:
+        result = asyncio.run(warm_cache(tickers, start_date, args.end, plan, concurrency=args.concurrency, progress=progress, report_every=args.report_every or None))
+    finally:
+        progress.close()
+    elapsed = time.perf_counter() - started
+    requests_after, limiter_after = get_request_stats(), get_rate_limit_stats()
+
+    for task, error in result["failures"].items():
+        print(f"{Fore.YELLOW}Warning: could not warm {task}: {error}{Style.RESET_ALL}")
+    completed = result["tasks"] - len(result["failures"])
+    print(
+        f"Warmed {completed} tasks in {elapsed:.1f}s ({completed / max(elapsed, 1e-9):.1f} tasks/s, {completed / (1 + plan.request_count) / max(elapsed, 1e-9):.2f} tickers/s); "
+        f"{result['skipped']} already done, {len(result['failures'])} failed"
+    )
+    print(
+        f"Downloads: {requests_after['fetches'] - requests_before['fetches']}, "
+        f"rate limit waits: {limiter_after['waits'] - limiter_before['waits']} "
+        f"({limiter_after['total_wait_seconds'] - limiter_before['total_wait_seconds']:.1f}s), "
+        f"429 responses: {limiter_after['rate_limited_responses'] - limiter_before['rate_limited_responses']}"
+    )
+    return 1 if result["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
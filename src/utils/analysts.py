@@ -18,8 +18,10 @@ from src.agents.warren_buffett import warren_buffett_agent
 from src.agents.rakesh_jhunjhunwala import rakesh_jhunjhunwala_agent
 from src.agents.mohnish_pabrai import mohnish_pabrai_agent
 from src.agents.research import research_analyst_agent
+from src.data.requirements import DataRequirements, LineItemRequest, plan_requests
 
-# Define analyst configuration - single source of truth
+# Define analyst configuration - single source of truth.
+# "data_requirements" declares what an analyst reads per ticker, so a run can prefetch it up front.
 ANALYST_CONFIG = {
     "research_analyst": {
         "display_name": "Research Analyst",
@@ -36,6 +38,11 @@ ANALYST_CONFIG = {
         "agent_func": aswath_damodaran_agent,
         "type": "analyst",
         "order": 0,
+        "data_requirements": DataRequirements(
+            financial_metrics={"ttm": 5},
+            line_items=(LineItemRequest("ttm", 10, ("free_cash_flow", "ebit", "interest_expense", "capital_expenditure", "depreciation_and_amortization", "outstanding_shares", "net_income", "total_debt")),),
+            market_cap=True,
+        ),
     },
     "ben_graham": {
         "display_name": "Ben Graham",
@@ -44,6 +51,11 @@ ANALYST_CONFIG = {
         "agent_func": ben_graham_agent,
         "type": "analyst",
         "order": 1,
+        "data_requirements": DataRequirements(
+            financial_metrics={"annual": 10},
+            line_items=(LineItemRequest("annual", 10, ("earnings_per_share", "revenue", "net_income", "book_value_per_share", "total_assets", "total_liabilities", "current_assets", "current_liabilities", "dividends_and_other_cash_distributions", "outstanding_shares")),),
+            market_cap=True,
+        ),
     },
     "bill_ackman": {
         "display_name": "Bill Ackman",
@@ -52,6 +64,11 @@ ANALYST_CONFIG = {
         "agent_func": bill_ackman_agent,
         "type": "analyst",
         "order": 2,
+        "data_requirements": DataRequirements(
+            financial_metrics={"annual": 5},
+            line_items=(LineItemRequest("annual", 5, ("revenue", "operating_margin", "debt_to_equity", "free_cash_flow", "total_assets", "total_liabilities", "dividends_and_other_cash_distributions", "outstanding_shares")),),
+            market_cap=True,
+        ),
     },
     "cathie_wood": {
         "display_name": "Cathie Wood",
@@ -60,6 +77,11 @@ ANALYST_CONFIG = {
         "agent_func": cathie_wood_agent,
         "type": "analyst",
         "order": 3,
+        "data_requirements": DataRequirements(
+            financial_metrics={"annual": 5},
+            line_items=(LineItemRequest("annual", 5, ("revenue", "gross_margin", "operating_margin", "debt_to_equity", "free_cash_flow", "total_assets", "total_liabilities", "dividends_and_other_cash_distributions", "outstanding_shares", "research_and_development", "capital_expenditure", "operating_expense")),),
+            market_cap=True,
+        ),
     },
     "charlie_munger": {
         "display_name": "Charlie Munger",
@@ -68,6 +90,13 @@ ANALYST_CONFIG = {
         "agent_func": charlie_munger_agent,
         "type": "analyst",
         "order": 4,
+        "data_requirements": DataRequirements(
+            financial_metrics={"annual": 10},
+            line_items=(LineItemRequest("annual", 10, ("revenue", "net_income", "operating_income", "return_on_invested_capital", "gross_margin", "operating_margin", "free_cash_flow", "capital_expenditure", "cash_and_equivalents", "total_debt", "shareholders_equity", "outstanding_shares", "research_and_development", "goodwill_and_intangible_assets")),),
+            market_cap=True,
+            insider_trades=100,
+            news_lookback_days=365,
+        ),
     },
     "michael_burry": {
         "display_name": "Michael Burry",
@@ -76,6 +105,13 @@ ANALYST_CONFIG = {
         "agent_func": michael_burry_agent,
         "type": "analyst",
         "order": 5,
+        "data_requirements": DataRequirements(
+            financial_metrics={"ttm": 5},
+            line_items=(LineItemRequest("ttm", 10, ("free_cash_flow", "net_income", "total_debt", "cash_and_equivalents", "total_assets", "total_liabilities", "outstanding_shares", "issuance_or_purchase_of_equity_shares")),),
+            market_cap=True,
+            insider_trades=1000,
+            news_lookback_days=365,
+        ),
     },
     "mohnish_pabrai": {
         "display_name": "Mohnish Pabrai",
@@ -84,6 +120,11 @@ ANALYST_CONFIG = {
         "agent_func": mohnish_pabrai_agent,
         "type": "analyst",
         "order": 6,
+        "data_requirements": DataRequirements(
+            financial_metrics={"annual": 8},
+            line_items=(LineItemRequest("annual", 8, ("revenue", "gross_profit", "gross_margin", "operating_income", "operating_margin", "net_income", "free_cash_flow", "total_debt", "cash_and_equivalents", "current_assets", "current_liabilities", "shareholders_equity", "capital_expenditure", "depreciation_and_amortization", "outstanding_shares")),),
+            market_cap=True,
+        ),
     },
     "peter_lynch": {
         "display_name": "Peter Lynch",
@@ -92,6 +133,12 @@ ANALYST_CONFIG = {
         "agent_func": peter_lynch_agent,
         "type": "analyst",
         "order": 6,
+        "data_requirements": DataRequirements(
+            line_items=(LineItemRequest("annual", 5, ("revenue", "earnings_per_share", "net_income", "operating_income", "gross_margin", "operating_margin", "free_cash_flow", "capital_expenditure", "cash_and_equivalents", "total_debt", "shareholders_equity", "outstanding_shares")),),
+            market_cap=True,
+            insider_trades=50,
+            news_articles=50,
+        ),
     },
     "phil_fisher": {
         "display_name": "Phil Fisher",
@@ -100,6 +147,12 @@ ANALYST_CONFIG = {
         "agent_func": phil_fisher_agent,
         "type": "analyst",
         "order": 7,
+        "data_requirements": DataRequirements(
+            line_items=(LineItemRequest("annual", 5, ("revenue", "net_income", "earnings_per_share", "free_cash_flow", "research_and_development", "operating_income", "operating_margin", "gross_margin", "total_debt", "shareholders_equity", "cash_and_equivalents", "ebit", "ebitda")),),
+            market_cap=True,
+            insider_trades=50,
+            news_articles=50,
+        ),
     },
     "rakesh_jhunjhunwala": {
         "display_name": "Rakesh Jhunjhunwala",
@@ -108,6 +161,11 @@ ANALYST_CONFIG = {
         "agent_func": rakesh_jhunjhunwala_agent,
         "type": "analyst",
         "order": 8,
+        "data_requirements": DataRequirements(
+            financial_metrics={"ttm": 5},
+            line_items=(LineItemRequest("ttm", 10, ("net_income", "earnings_per_share", "ebit", "operating_income", "revenue", "operating_margin", "total_assets", "total_liabilities", "current_assets", "current_liabilities", "free_cash_flow", "dividends_and_other_cash_distributions", "issuance_or_purchase_of_equity_shares")),),
+            market_cap=True,
+        ),
     },
     "stanley_druckenmiller": {
         "display_name": "Stanley Druckenmiller",
@@ -116,6 +174,13 @@ ANALYST_CONFIG = {
         "agent_func": stanley_druckenmiller_agent,
         "type": "analyst",
         "order": 9,
+        "data_requirements": DataRequirements(
+            financial_metrics={"annual": 5},
+            line_items=(LineItemRequest("annual", 5, ("revenue", "earnings_per_share", "net_income", "operating_income", "gross_margin", "operating_margin", "free_cash_flow", "capital_expenditure", "cash_and_equivalents", "total_debt", "shareholders_equity", "outstanding_shares", "ebit", "ebitda")),),
+            market_cap=True,
+            insider_trades=50,
+            news_articles=50,
+        ),
     },
     "warren_buffett": {
         "display_name": "Warren Buffett",
@@ -124,6 +189,11 @@ ANALYST_CONFIG = {
         "agent_func": warren_buffett_agent,
         "type": "analyst",
         "order": 10,
+        "data_requirements": DataRequirements(
+            financial_metrics={"ttm": 10},
+            line_items=(LineItemRequest("ttm", 10, ("capital_expenditure", "depreciation_and_amortization", "net_income", "outstanding_shares", "total_assets", "total_liabilities", "shareholders_equity", "dividends_and_other_cash_distributions", "issuance_or_purchase_of_equity_shares", "gross_profit", "revenue", "free_cash_flow")),),
+            market_cap=True,
+        ),
     },
     "technical_analyst": {
         "display_name": "Technical Analyst",
@@ -140,6 +210,9 @@ ANALYST_CONFIG = {
         "agent_func": fundamentals_analyst_agent,
         "type": "analyst",
         "order": 12,
+        "data_requirements": DataRequirements(
+            financial_metrics={"ttm": 10},
+        ),
     },
     "sentiment_analyst": {
         "display_name": "Sentiment Analyst",
@@ -148,6 +221,10 @@ ANALYST_CONFIG = {
         "agent_func": sentiment_analyst_agent,
         "type": "analyst",
         "order": 13,
+        "data_requirements": DataRequirements(
+            insider_trades=1000,
+            news_articles=100,
+        ),
     },
     "valuation_analyst": {
         "display_name": "Valuation Analyst",
@@ -156,6 +233,11 @@ ANALYST_CONFIG = {
         "agent_func": valuation_analyst_agent,
         "type": "analyst",
         "order": 14,
+        "data_requirements": DataRequirements(
+            financial_metrics={"ttm": 8},
+            line_items=(LineItemRequest("ttm", 8, ("free_cash_flow", "net_income", "depreciation_and_amortization", "capital_expenditure", "working_capital", "total_debt", "cash_and_equivalents", "interest_expense", "revenue", "operating_income", "ebit", "ebitda")),),
+            market_cap=True,
+        ),
     },
 }
 
@@ -168,6 +250,12 @@ def get_analyst_nodes():
     return {key: (f"{key}_agent", config["agent_func"]) for key, config in ANALYST_CONFIG.items()}
 
 
+def get_data_requirements(selected_analysts=None):
+    """Plan the data requests per ticker for the selected analysts (all of them by default)."""
+    keys = ANALYST_CONFIG if selected_analysts is None else selected_analysts
+    return plan_requests(ANALYST_CONFIG[key]["data_requirements"] for key in keys if "data_requirements" in ANALYST_CONFIG.get(key, {}))
+
+
 def get_agents_list():
     """Get the list of agents for API responses."""
     return [
@@ -0,0 +1,36 @@
+"""Run an analyst's per-ticker work concurrently.
+
+Analysts score each ticker independently: fetch its data, compute the
+signals, ask the LLM. :func:`run_per_ticker` runs that per-ticker body for all
+tickers on a bounded thread pool, so an agent takes about as long as its
+slowest ticker rather than the sum over tickers. Data requests made by the
+workers still share the cache, the HTTP pool and the rate limiter.
+"""
+
+from __future__ import annotations
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional, TypeVar
+
+from src.config import get_agent_config
+
+T = TypeVar("T")
+
+
+def run_per_ticker(tickers: Iterable[str], func: Callable[[str], T], max_workers: Optional[int] = None) -> Dict[str, T]:
+    """Call ``func(ticker)`` for every ticker and return the results by ticker, in the order of ``tickers``.
+
+    At most ``max_workers`` calls (default: ``agents.ticker_concurrency``)
+    run at once. Each call runs in a copy of the caller's context, so it sees
+    the run's data provider and prefetched bundles. If calls raise, the
+    others still finish and the error of the first failing ticker in order is
+    raised.
+    """
+    tickers = list(dict.fromkeys(tickers))
+    workers = min(len(tickers), max_workers or get_agent_config()["ticker_concurrency"])
+    if workers <= 1:
+        return {ticker: func(ticker) for ticker in tickers}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="agent-ticker") as executor:
+        futures = {ticker: executor.submit(contextvars.copy_context().run, func, ticker) for ticker in tickers}
+    return {ticker: future.result() for ticker, future in futures.items()}
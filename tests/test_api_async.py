@@ -0,0 +1,63 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+from src.tools import api_async
+
+
+def slow(result):
+    def fetch(*args, **kwargs):
+        time.sleep(0.2)
+        return result
+
+    return fetch
+
+
+def test_prefetch_runs_tickers_and_datasets_concurrently():
+    tickers = [f"T{i}" for i in range(5)]
+    with patch("src.tools.api.get_prices_batch", slow({ticker: ["price"] for ticker in tickers})), \
+         patch("src.tools.api.get_financial_metrics", slow(["metric"])), \
+         patch("src.tools.api.get_insider_trades", slow(["trade"])), \
+         patch("src.tools.api.get_company_news", slow(["news"])):
+        start = time.perf_counter()
+        results = asyncio.run(api_async.prefetch_async(tickers, "2024-01-01", "2024-02-01", max_concurrency=20))
+        elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.0  # 16 requests of 0.2s each, far below the 3.2s sequential time
+    assert results["T3"] == {"prices": ["price"], "financial_metrics": ["metric"], "insider_trades": ["trade"], "company_news": ["news"]}
+
+
+def test_concurrency_limit_is_respected():
+    in_flight = 0
+    peak = 0
+
+    def fetch(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        time.sleep(0.05)
+        in_flight -= 1
+        return []
+
+    async def run():
+        semaphore = asyncio.Semaphore(2)
+        await asyncio.gather(*(api_async.get_company_news_async(f"T{i}", "2024-01-01", semaphore=semaphore) for i in range(6)))
+
+    with patch("src.tools.api.get_company_news", fetch):
+        asyncio.run(run())
+
+    assert peak == 2
+
+
+def test_errors_are_returned_per_dataset():
+    def fail(*args, **kwargs):
+        raise Exception("boom")
+
+    with patch("src.tools.api.get_prices_batch", fail), \
+         patch("src.tools.api.get_financial_metrics", slow([])), \
+         patch("src.tools.api.get_insider_trades", slow([])), \
+         patch("src.tools.api.get_company_news", slow([])):
+        results = asyncio.run(api_async.prefetch_async(["AAPL"], "2024-01-01", "2024-02-01"))
+
+    assert isinstance(results["AAPL"]["prices"], Exception)
+    assert results["AAPL"]["company_news"] == []
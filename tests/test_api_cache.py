@@ -0,0 +1,291 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.data.cache import Cache
+from src.tools import api
+
+
+def bars_response(dates):
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = {
+        "bars": [{"t": f"{d}T05:00:00Z", "o": 1.0, "c": 2.0, "h": 3.0, "l": 0.5, "v": 100} for d in dates]
+    }
+    return response
+
+
+@pytest.fixture
+def cache():
+    fresh = Cache()
+    with patch("src.tools.api._cache", fresh):
+        yield fresh
+
+
+def test_sub_windows_are_served_from_cached_superset(cache):
+    dates = ["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"]
+    with patch("src.tools.api._make_api_request", return_value=bars_response(dates)) as mock_request:
+        assert len(api.get_prices("AAPL", "2024-01-01", "2024-01-31")) == 4
+        window = api.get_prices("AAPL", "2024-01-03", "2024-01-04")
+
+    assert [p.time[:10] for p in window] == ["2024-01-03", "2024-01-04"]
+    assert mock_request.call_count == 1
+
+
+def test_only_uncovered_gap_is_fetched(cache):
+    with patch("src.tools.api._make_api_request", return_value=bars_response(["2024-01-02"])):
+        api.get_prices("AAPL", "2024-01-01", "2024-01-10")
+    with patch("src.tools.api._make_api_request", return_value=bars_response(["2024-01-12"])) as mock_request:
+        prices = api.get_prices("AAPL", "2024-01-05", "2024-01-15")
+
+    assert mock_request.call_count == 1
+    assert "start=2024-01-11&end=2024-01-15" in mock_request.call_args[0][0]
+    assert [p.time[:10] for p in prices] == ["2024-01-12"]
+
+
+def test_empty_gap_is_not_refetched(cache):
+    with patch("src.tools.api._make_api_request", return_value=bars_response([])) as mock_request:
+        assert api.get_prices("AAPL", "2024-01-06", "2024-01-07") == []
+        assert api.get_prices("AAPL", "2024-01-06", "2024-01-07") == []
+
+    assert mock_request.call_count == 1
+
+
+def test_batch_splits_multi_symbol_pages_into_ticker_entries(cache):
+    def page(bars, token=None):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {
+            "bars": {t: [{"t": f"{d}T05:00:00Z", "o": 1.0, "c": 2.0, "h": 3.0, "l": 0.5, "v": 100} for d in ds] for t, ds in bars.items()},
+            "next_page_token": token,
+        }
+        return response
+
+    responses = [
+        page({"AAPL": ["2024-01-02", "2024-01-03"], "MSFT": ["2024-01-02"]}, token="next"),
+        page({"MSFT": ["2024-01-03"]}),
+    ]
+    with patch("src.tools.api._make_api_request", side_effect=responses) as mock_request:
+        result = api.get_prices_batch(["AAPL", "MSFT", "AAPL"], "2024-01-01", "2024-01-05")
+        again = api.get_prices("MSFT", "2024-01-03", "2024-01-03")
+
+    assert mock_request.call_count == 2
+    assert "symbols=AAPL,MSFT" in mock_request.call_args_list[0][0][0]
+    assert "page_token=next" in mock_request.call_args_list[1][0][0]
+    assert [len(result["AAPL"]), len(result["MSFT"])] == [2, 2]
+    assert [p.time[:10] for p in again] == ["2024-01-03"]
+
+
+def fundamentals_response(fields, periods=("2024-03-31", "2023-12-31")):
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = {
+        "symbol": "AAPL",
+        "fundamentals": [
+            {"report_period": p, "period": "ttm", "currency": "USD", **{f: float(i) for i, f in enumerate(fields)}} for p in periods
+        ],
+    }
+    return response
+
+
+def test_line_items_fetch_only_missing_fields(cache):
+    with patch("src.tools.api._make_api_request", return_value=fundamentals_response(["revenue", "net_income"])):
+        first = api.search_line_items("AAPL", ["revenue", "net_income"], "2024-06-30")
+    with patch("src.tools.api._make_api_request", return_value=fundamentals_response(["free_cash_flow"])) as mock_request:
+        subset = api.search_line_items("AAPL", ["net_income"], "2024-06-30")
+        overlap = api.search_line_items("AAPL", ["revenue", "free_cash_flow"], "2024-06-30")
+
+    assert [item.revenue for item in first] == [0.0, 0.0]
+    assert [item.net_income for item in subset] == [1.0, 1.0]
+    assert not hasattr(subset[0], "revenue")
+    assert mock_request.call_count == 1
+    assert mock_request.call_args[0][0].endswith("fields=free_cash_flow")
+    assert [(item.report_period, item.revenue, item.free_cash_flow) for item in overlap] == [
+        ("2024-03-31", 0.0, 0.0),
+        ("2023-12-31", 0.0, 0.0),
+    ]
+
+
+def test_empty_results_are_not_refetched(cache):
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = {"trades": [], "news": [], "fundamentals": []}
+    with patch("src.tools.api._make_api_request", return_value=response) as mock_request:
+        for _ in range(3):
+            assert api.get_insider_trades("TINY", "2024-01-31") == []
+            assert api.get_company_news("TINY", "2024-01-31") == []
+            assert api.get_financial_metrics("TINY", "2024-01-31") == []
+            assert api.search_line_items("TINY", ["revenue"], "2024-01-31") == []
+
+    assert mock_request.call_count == 4
+    assert api.get_request_stats()["empty_hits"] == 6
+
+
+def test_news_tail_is_fetched_incrementally(cache):
+    def news_response(dates):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {"news": [
+            {"headline": d, "author": "a", "source": "s", "created_at": f"{d}T14:00:00Z", "url": f"https://news/{d}"} for d in dates
+        ]}
+        return response
+
+    with patch("src.tools.api._make_api_request", return_value=news_response(["2024-01-09", "2024-01-03"])):
+        api.get_company_news("AAPL", "2024-01-10", limit=50)
+    with patch("src.tools.api._make_api_request", return_value=news_response(["2024-01-11"])) as mock_request:
+        news = api.get_company_news("AAPL", "2024-01-11", limit=50)
+        again = api.get_company_news("AAPL", "2024-01-11", start_date="2024-01-05", limit=50)
+
+    assert mock_request.call_count == 1
+    assert "end=2024-01-11T23:59:59Z" in mock_request.call_args[0][0]
+    assert "start=2024-01-11" in mock_request.call_args[0][0]
+    assert [item.title for item in news] == ["2024-01-11", "2024-01-09", "2024-01-03"]
+    assert [item.title for item in again] == ["2024-01-11", "2024-01-09"]
+
+
+def test_metrics_for_each_backtest_day_come_from_one_history_download(cache):
+    periods = ["2023-03-31", "2023-06-30", "2023-09-30", "2023-12-31", "2024-03-31"]
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = {"fundamentals": [
+        {"report_period": p, "period": "ttm", "currency": "USD", "market_cap": float(i)} for i, p in enumerate(reversed(periods))
+    ]}
+    with patch("src.tools.api._make_api_request", return_value=response) as mock_request:
+        days = [f"2024-01-{d:02d}" for d in range(2, 32)] + [f"2024-04-{d:02d}" for d in range(1, 31)]
+        latest = {day: api.get_financial_metrics("AAPL", day, limit=2) for day in days}
+        market_cap = api.get_market_cap("AAPL", "2023-10-15")
+
+    assert mock_request.call_count == 1
+    # The history request holds no date, so it is the same URL on every day a run or recording is made
+    assert mock_request.call_args[0][0] == "https://data.alpaca.markets/v2/stocks/AAPL/fundamentals?period=ttm&limit=40"
+    assert [m.report_period for m in latest["2024-01-15"]] == ["2023-12-31", "2023-09-30"]
+    assert [m.report_period for m in latest["2024-04-15"]] == ["2024-03-31", "2023-12-31"]
+    assert market_cap == 2.0
+
+
+def test_metrics_older_than_partial_history_are_fetched_separately(cache):
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = {"fundamentals": [
+        {"report_period": f"{2023 - i}-12-31", "period": "ttm", "currency": "USD"} for i in range(api.METRICS_HISTORY_LIMIT)
+    ]}
+    oldest = f"{2024 - api.METRICS_HISTORY_LIMIT}-12-31"
+    with patch("src.tools.api._make_api_request", return_value=response) as mock_request:
+        api.get_financial_metrics("AAPL", "2024-01-31", limit=2)
+        api.get_financial_metrics("AAPL", oldest, limit=2)
+        api.get_financial_metrics("AAPL", "2000-06-30", limit=2)
+
+    assert mock_request.call_count == 2
+
+
+def test_smaller_limits_are_served_from_a_larger_query(cache):
+    periods = ("2024-03-31", "2023-12-31", "2023-09-30", "2023-06-30")
+    with patch("src.tools.api._make_api_request", return_value=fundamentals_response(["revenue"], periods)) as mock_request:
+        api.search_line_items("AAPL", ["revenue"], "2024-06-30", limit=4)
+        smaller = api.search_line_items("AAPL", ["revenue"], "2024-06-30", limit=2)
+        single = api.search_line_items("AAPL", ["revenue"], "2024-06-30", limit=1)
+
+    assert mock_request.call_count == 1
+    assert [item.report_period for item in smaller] == ["2024-03-31", "2023-12-31"]
+    assert [item.report_period for item in single] == ["2024-03-31"]
+
+
+def test_overfetch_limit_requests_the_maximum_once(cache):
+    periods = ("2024-03-31", "2023-12-31", "2023-09-30")
+    config = {"provider": "alpaca", "local_path": "", "overfetch_limit": 10}
+    with patch("src.tools.api.get_data_config", return_value=config), \
+         patch("src.tools.api._make_api_request", return_value=fundamentals_response(["revenue"], periods)) as mock_request:
+        first = api.search_line_items("AAPL", ["revenue"], "2024-06-30", limit=1)
+        larger = api.search_line_items("AAPL", ["revenue"], "2024-06-30", limit=8)
+
+    assert mock_request.call_count == 1
+    assert "limit=10" in mock_request.call_args[0][0]
+    assert len(first) == 1
+    assert len(larger) == 3
+
+
+def news_page(dates, token=None):
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = {
+        "news": [{"headline": d, "author": "a", "source": "s", "created_at": f"{d}T14:00:00Z", "url": f"https://news/{d}"} for d in dates],
+        "next_page_token": token,
+    }
+    return response
+
+
+def test_news_stream_stops_requesting_when_consumer_has_enough(cache):
+    pages = [news_page(["2024-01-09", "2024-01-08"], "p2"), news_page(["2024-01-07", "2024-01-06"], "p3"), news_page(["2024-01-05"])]
+    with patch("src.tools.api._make_api_request", side_effect=pages) as mock_request:
+        first = list(islice(api.iter_company_news("AAPL", "2024-01-10", page_size=2), 3))
+    assert [item.title for item in first] == ["2024-01-09", "2024-01-08", "2024-01-07"]
+    assert mock_request.call_count == 2
+    assert mock_request.call_args[0][0].endswith("&page_token=p2")
+
+    # Days after the oldest fetched article are covered, so the same read needs no request
+    with patch("src.tools.api._make_api_request") as mock_request:
+        again = list(islice(api.iter_company_news("AAPL", "2024-01-10", page_size=2), 3))
+    assert [item.title for item in again] == ["2024-01-09", "2024-01-08", "2024-01-07"]
+    mock_request.assert_not_called()
+
+
+def test_concurrent_news_streams_download_each_page_once(cache):
+    pages = {None: news_page(["2024-01-09", "2024-01-08"], "p2"), "p2": news_page(["2024-01-07", "2024-01-06"])}
+
+    def request(url, headers):
+        time.sleep(0.05)
+        return pages["p2" if url.endswith("&page_token=p2") else None]
+
+    with patch("src.tools.api._make_api_request", side_effect=request) as mock_request, ThreadPoolExecutor(max_workers=3) as pool:
+        results = list(pool.map(lambda _: [item.title for item in api.iter_company_news("AAPL", "2024-01-10", start_date="2024-01-01", page_size=2)], range(3)))
+
+    assert results == [["2024-01-09", "2024-01-08", "2024-01-07", "2024-01-06"]] * 3
+    assert mock_request.call_count == 2
+
+
+def test_recent_news_reads_only_as_far_back_as_declared(cache):
+    pages = [news_page(["2024-01-09", "2024-01-08"], "p2"), news_page(["2024-01-07", "2024-01-06"], "p3"), news_page(["2024-01-05"])]
+    with patch("src.tools.api._make_api_request", side_effect=pages) as mock_request:
+        news, covered_from = api.get_recent_company_news("AAPL", "2024-01-10", articles=2)
+    # An article from an older day shows the newest two days were read in full
+    assert [item.title for item in news] == ["2024-01-09", "2024-01-08"]
+    assert covered_from == "2024-01-08"
+    assert mock_request.call_count == 2
+
+    with patch("src.tools.api._make_api_request", side_effect=[news_page(["2024-01-05"])]) as mock_request:
+        news, covered_from = api.get_recent_company_news("AAPL", "2024-01-10", lookback_days=7)
+    assert [item.title for item in news][-1] == "2024-01-05" and covered_from is None
+    assert mock_request.call_count == 1
+
+
+def test_insider_trade_stream_follows_page_tokens(cache):
+    def trades_page(dates, token=None):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {"trades": [{"filing_date": d, "issuer": "X"} for d in dates], "next_page_token": token}
+        return response
+
+    with patch("src.tools.api._make_api_request", side_effect=[trades_page(["2024-01-09"], "p2"), trades_page(["2024-01-05"])]) as mock_request:
+        trades = list(api.iter_insider_trades("AAPL", "2024-01-10", limit=5))
+    with patch("src.tools.api._make_api_request") as cached_request:
+        cached = api.get_insider_trades("AAPL", "2024-01-10", limit=5)
+
+    assert mock_request.call_count == 2
+    assert [t.filing_date for t in trades] == [t.filing_date for t in cached] == ["2024-01-09", "2024-01-05"]
+    cached_request.assert_not_called()
+
+
+def test_memory_cache_keeps_archived_runs_off_the_persistent_cache(cache):
+    with patch("src.tools.api._make_api_request", return_value=bars_response(["2024-01-02"])):
+        api.get_prices("AAPL", "2024-01-01", "2024-01-10")
+
+    with api.use_memory_cache() as memory:
+        assert memory is not cache and memory._disk is None and memory._history is None
+        with patch("src.tools.api._make_api_request", return_value=bars_response(["2024-01-02"])) as mock_request:
+            api.get_prices("AAPL", "2024-01-01", "2024-01-10")
+        # The warm shared cache did not answer, so the request reached the archive
+        assert mock_request.call_count == 1
+    assert api._cache is cache
@@ -3,12 +3,22 @@ import pytest
 from unittest.mock import Mock, patch, call
 
 from src.tools.api import _make_api_request, get_prices
+from src.tools.rate_limiter import RateLimiter
+
+
+@pytest.fixture(autouse=True)
+def rate_limiter():
+    """Give each test a fresh limiter on a frozen clock so waits are exact."""
+    limiter = RateLimiter(clock=lambda: 1_000_000.0)
+    with patch('src.tools.api._rate_limiter', limiter):
+        yield limiter
+
 
 class TestRateLimiting:
     """Test suite for API rate limiting functionality."""
 
-    @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.rate_limiter.time.sleep')
+    @patch('src.tools.api.http_client.get')
     def test_handles_single_rate_limit(self, mock_get, mock_sleep):
         """Test that API retries once after a 429 and succeeds."""
         # Setup mock responses: first 429, then 200
@@ -31,7 +41,7 @@ class TestRateLimiting:
         assert result.status_code == 200
         assert result.text == "Success"
         
-        # Verify requests.get was called twice
+        # Verify http_client.get was called twice
         assert mock_get.call_count == 2
         mock_get.assert_has_calls([
             call(url, headers=headers),
@@ -41,8 +51,8 @@ class TestRateLimiting:
         # Verify sleep was called once with 60 seconds (first retry)
         mock_sleep.assert_called_once_with(60)
 
-    @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.rate_limiter.time.sleep')
+    @patch('src.tools.api.http_client.get')
     def test_handles_multiple_rate_limits(self, mock_get, mock_sleep):
         """Test that API retries multiple times after 429s."""
         # Setup mock responses: three 429s, then 200
@@ -70,7 +80,7 @@ class TestRateLimiting:
         assert result.status_code == 200
         assert result.text == "Success"
         
-        # Verify requests.get was called 4 times
+        # Verify http_client.get was called 4 times
         assert mock_get.call_count == 4
         
         # Verify sleep was called 3 times with linear backoff: 60s, 90s, 120s
@@ -78,8 +88,8 @@ class TestRateLimiting:
         expected_calls = [call(60), call(90), call(120)]
         mock_sleep.assert_has_calls(expected_calls)
 
-    @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.post')
+    @patch('src.tools.rate_limiter.time.sleep')
+    @patch('src.tools.api.http_client.post')
     def test_handles_post_rate_limiting(self, mock_post, mock_sleep):
         """Test that POST requests handle rate limiting."""
         # Setup mock responses: first 429, then 200
@@ -103,7 +113,7 @@ class TestRateLimiting:
         assert result.status_code == 200
         assert result.text == "Success"
         
-        # Verify requests.post was called twice
+        # Verify http_client.post was called twice
         assert mock_post.call_count == 2
         mock_post.assert_has_calls([
             call(url, headers=headers, json=json_data),
@@ -113,8 +123,8 @@ class TestRateLimiting:
         # Verify sleep was called once with 60 seconds (first retry)
         mock_sleep.assert_called_once_with(60)
 
-    @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.rate_limiter.time.sleep')
+    @patch('src.tools.api.http_client.get')
     def test_ignores_other_errors(self, mock_get, mock_sleep):
         """Test that non-429 errors are returned without retrying."""
         # Setup mock response: 500 error
@@ -134,14 +144,14 @@ class TestRateLimiting:
         assert result.status_code == 500
         assert result.text == "Internal Server Error"
         
-        # Verify requests.get was called only once
+        # Verify http_client.get was called only once
         assert mock_get.call_count == 1
         
         # Verify sleep was never called
         mock_sleep.assert_not_called()
 
-    @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.rate_limiter.time.sleep')
+    @patch('src.tools.api.http_client.get')
     def test_normal_success_requests(self, mock_get, mock_sleep):
         """Test that successful requests return immediately without retry."""
         # Setup mock response: 200 success
@@ -161,19 +171,20 @@ class TestRateLimiting:
         assert result.status_code == 200
         assert result.text == "Success"
         
-        # Verify requests.get was called only once
+        # Verify http_client.get was called only once
         assert mock_get.call_count == 1
         
         # Verify sleep was never called
         mock_sleep.assert_not_called()
 
     @patch('src.tools.api._cache')
-    @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.rate_limiter.time.sleep')
+    @patch('src.tools.api.http_client.get')
     def test_full_integration(self, mock_get, mock_sleep, mock_cache):
         """Test that get_prices function properly handles rate limiting."""
         # Mock cache to return None (cache miss)
         mock_cache.get_prices.return_value = None
+        mock_cache.get_missing_price_ranges.return_value = [("2024-01-01", "2024-01-02")]
         
         # Setup mock responses: first 429, then 200 with valid data
         mock_429_response = Mock()
@@ -215,8 +226,8 @@ class TestRateLimiting:
         mock_cache.get_prices.assert_called_once()
         mock_cache.set_prices.assert_called_once()
 
-    @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.rate_limiter.time.sleep')
+    @patch('src.tools.api.http_client.get')
     def test_max_retries_exceeded(self, mock_get, mock_sleep):
         """Test that function stops retrying after max_retries and returns final 429."""
         # Setup mock responses: all 429s (exceeds max retries)
@@ -236,7 +247,7 @@ class TestRateLimiting:
         assert result.status_code == 429
         assert result.text == "Too Many Requests"
         
-        # Verify requests.get was called 3 times (1 initial + 2 retries)
+        # Verify http_client.get was called 3 times (1 initial + 2 retries)
         assert mock_get.call_count == 3
         
         # Verify sleep was called 2 times with linear backoff: 60s, 90s
@@ -245,5 +256,98 @@ class TestRateLimiting:
         mock_sleep.assert_has_calls(expected_calls)
 
 
+class FakeClock:
+    """Clock whose time only moves when the limiter sleeps."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def limit_response(status_code=200, limit=None, remaining=None, reset=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = {}
+    if limit is not None:
+        response.headers["X-RateLimit-Limit"] = str(limit)
+    if remaining is not None:
+        response.headers["X-RateLimit-Remaining"] = str(remaining)
+    if reset is not None:
+        response.headers["X-RateLimit-Reset"] = str(reset)
+    return response
+
+
+class TestHeaderPacing:
+    """Test suite for token-bucket pacing driven by rate-limit headers."""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def limiter(self, clock):
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        with patch('src.tools.api._rate_limiter', limiter):
+            yield limiter
+
+    @patch('src.tools.api.http_client.get')
+    def test_429_waits_exactly_until_reset(self, mock_get, limiter, clock):
+        """Test that a 429 with a reset header sleeps until that reset time."""
+        mock_get.side_effect = [
+            limit_response(429, limit=200, remaining=0, reset=clock.now + 7),
+            limit_response(200, limit=200, remaining=199),
+        ]
+
+        result = _make_api_request("https://data.alpaca.markets/test", {})
+
+        assert result.status_code == 200
+        assert clock.sleeps == [7]
+        assert limiter.stats()["rate_limited_responses"] == 1
+
+    @patch('src.tools.api.http_client.get')
+    def test_exhausted_quota_pauses_before_rejection(self, mock_get, limiter, clock):
+        """Test that remaining=0 holds the next request until reset without a 429."""
+        mock_get.side_effect = [
+            limit_response(200, limit=200, remaining=0, reset=clock.now + 12),
+            limit_response(200, limit=200, remaining=199),
+        ]
+
+        _make_api_request("https://data.alpaca.markets/test", {})
+        assert clock.sleeps == []
+        _make_api_request("https://data.alpaca.markets/test", {})
+
+        assert clock.sleeps == [12]
+        assert mock_get.call_count == 2
+
+    def test_requests_are_paced_at_the_advertised_rate(self, limiter, clock):
+        """Test that once the bucket is empty tokens are handed out at limit/60 per second."""
+        limiter.update({"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "2"})
+
+        for _ in range(4):
+            limiter.acquire()
+
+        # Two tokens were left, then one token per second at 60 requests/minute
+        assert clock.sleeps == [pytest.approx(1.0), pytest.approx(1.0)]
+        assert limiter.stats()["waits"] == 2
+
+    def test_stats_expose_bucket_state(self, limiter, clock):
+        """Test that limiter state is available for metrics."""
+        assert limiter.stats()["limit_per_minute"] is None
+
+        limiter.update({"X-RateLimit-Limit": "200", "X-RateLimit-Remaining": "150", "X-RateLimit-Reset": str(clock.now + 30)})
+        stats = limiter.stats()
+
+        assert stats["limit_per_minute"] == 200
+        assert stats["tokens"] == 150
+        assert stats["blocked_for"] == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
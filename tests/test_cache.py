@@ -0,0 +1,288 @@
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.data.cache import Cache
+from src.data.disk_cache import DiskCache
+from src.data.history_store import HistoryStore
+from src.data.models import CompanyNews
+from src.data.price_series import PriceSeries
+
+
+def make_disk(tmp_path, max_bytes=10_000_000, ttls=None):
+    return DiskCache(str(tmp_path / "cache.db"), max_bytes=max_bytes, ttls=ttls or {})
+
+
+def test_disk_round_trip(tmp_path):
+    disk = make_disk(tmp_path)
+    rows = [{"time": "2024-01-02", "close": 1.5}]
+    disk.set("prices", "AAPL", rows)
+    assert disk.get("prices", "AAPL") == rows
+    assert disk.get("prices", "MSFT") is None
+    assert disk.stats()["prices"]["entries"] == 1
+
+
+def test_disk_connections_close_when_their_threads_exit(tmp_path):
+    disk = make_disk(tmp_path)
+    disk.set("prices", "AAPL", [{"time": "2024-01-02"}])
+
+    # Short-lived pools, as each agent call starts one
+    for _ in range(20):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert all(pool.map(lambda _: disk.get("prices", "AAPL"), range(16)))
+
+    # Only the main thread's connection is left open
+    assert len(disk._conns) == 1
+    disk.close()
+
+
+def test_disk_ttl_expires_per_dataset(tmp_path, monkeypatch):
+    disk = make_disk(tmp_path, ttls={"company_news": 10, "prices": 1000})
+    disk.set("company_news", "AAPL", [{"date": "2024-01-02"}])
+    disk.set("prices", "AAPL", [{"time": "2024-01-02"}])
+
+    now = time.time()
+    monkeypatch.setattr("src.data.disk_cache.time.time", lambda: now + 100)
+    assert disk.get("company_news", "AAPL") is None
+    assert disk.get("prices", "AAPL") is not None
+
+
+def test_disk_evicts_least_recently_used(tmp_path, monkeypatch):
+    clock = iter(range(1, 100))
+    monkeypatch.setattr("src.data.disk_cache.time.time", lambda: next(clock))
+    payload = [{"time": str(i), "note": "x" * 50} for i in range(20)]
+    disk = make_disk(tmp_path)
+    disk.set("prices", "A", payload)
+    entry_size = disk.stats()["prices"]["bytes"]
+    disk.max_bytes = entry_size * 2
+
+    disk.set("prices", "B", payload)
+    disk.get("prices", "A")  # A becomes the most recently used entry
+    disk.set("prices", "C", payload)
+
+    assert disk.get("prices", "A") is not None
+    assert disk.get("prices", "B") is None
+    assert disk.get("prices", "C") is not None
+
+
+def test_restarted_cache_starts_warm(tmp_path):
+    rows = [{"open": 1.0, "close": 1.5, "high": 2.0, "low": 0.5, "volume": 100, "time": "2024-01-02T05:00:00Z"}]
+    Cache(disk=make_disk(tmp_path)).set_prices("AAPL", rows)
+
+    restarted = Cache(disk=make_disk(tmp_path))
+    assert restarted.get_prices("AAPL").to_rows() == rows
+    assert Cache().get_prices("AAPL") is None
+
+
+def test_missing_price_ranges_returns_uncovered_gaps():
+    cache = Cache()
+    cache.set_prices("AAPL", [{"open": 1.0, "close": 1.0, "high": 1.0, "low": 1.0, "volume": 1, "time": "2024-02-01T05:00:00Z"}])
+    cache.add_price_range("AAPL", "2024-01-10", "2024-01-20")
+    cache.add_price_range("AAPL", "2024-02-01", "2024-02-10")
+
+    assert cache.get_missing_price_ranges("AAPL", "2024-01-12", "2024-01-18") == []
+    assert cache.get_missing_price_ranges("AAPL", "2024-01-01", "2024-02-15") == [
+        ("2024-01-01", "2024-01-09"),
+        ("2024-01-21", "2024-01-31"),
+        ("2024-02-11", "2024-02-15"),
+    ]
+    cache.add_price_range("AAPL", "2024-01-21", "2024-01-31")
+    assert cache.get_price_ranges("AAPL") == [["2024-01-10", "2024-02-10"]]
+
+
+def test_empty_results_expire_on_their_own_ttl(tmp_path, monkeypatch):
+    cache = Cache(disk=make_disk(tmp_path, ttls={"empty_results": 60}), empty_ttl=60)
+    assert not cache.is_empty("company_news", "TINY")
+    cache.set_empty("company_news", "TINY")
+
+    restarted = Cache(disk=make_disk(tmp_path, ttls={"empty_results": 60}), empty_ttl=60)
+    assert restarted.is_empty("company_news", "TINY")
+    assert restarted.get_company_news("TINY") is None
+    assert restarted.empty_stats() == {"entries": 1, "hits": 1}
+
+    now = time.time()
+    monkeypatch.setattr("src.data.cache.time.time", lambda: now + 120)
+    assert not restarted.is_empty("company_news", "TINY")
+
+
+def test_only_settled_days_of_coverage_are_persisted(tmp_path):
+    today = datetime.now(timezone.utc).date().isoformat()
+    cache = Cache(disk=make_disk(tmp_path))
+    cache.set_company_news("AAPL", [])
+    cache.add_news_range("AAPL", "2024-01-01", today)
+    assert cache.get_missing_news_ranges("AAPL", "2024-01-01", today) == []
+
+    restarted = Cache(disk=make_disk(tmp_path))
+    assert restarted.get_missing_news_ranges("AAPL", "2024-01-01", today) == [(today, today)]
+
+
+def test_in_memory_coverage_of_today_expires(monkeypatch):
+    today = datetime.now(timezone.utc).date().isoformat()
+    cache = Cache(unsettled_ttl=60)
+    cache.set_company_news("AAPL", [])
+    cache.add_news_range("AAPL", "2024-01-01", "2024-01-31")
+    cache.add_news_range("AAPL", "2024-02-01", today)
+    assert cache.get_missing_news_ranges("AAPL", "2024-01-01", today) == []
+
+    now = time.time()
+    monkeypatch.setattr("src.data.cache.time.time", lambda: now + 120)
+    assert cache.get_missing_news_ranges("AAPL", "2024-01-01", today) == [(today, today)]
+    cache.add_news_range("AAPL", today, today)
+    assert cache.get_missing_news_ranges("AAPL", "2024-01-01", today) == []
+
+
+def test_memory_tier_evicts_least_recently_used_within_budget():
+    rows = [{"filing_date": f"2024-01-{i + 1:02d}", "title": "x" * 100} for i in range(10)]
+    cache = Cache()
+    cache.set_insider_trades("A", rows)
+    entry_size = cache.memory_stats()["insider_trades"]["bytes"]
+
+    cache = Cache(memory_max_bytes={"insider_trades": entry_size * 2})
+    cache.set_insider_trades("A", rows)
+    cache.set_insider_trades("B", rows)
+    cache.get_insider_trades("A")  # A becomes the most recently used entry
+    cache.set_insider_trades("C", rows)
+
+    assert cache.get_insider_trades("B") is None
+    assert cache.get_insider_trades("A") == rows
+    assert cache.memory_stats()["insider_trades"] == {"entries": 2, "bytes": entry_size * 2, "max_bytes": entry_size * 2, "evictions": 1}
+
+
+def test_reads_race_evictions_without_errors(tmp_path):
+    cache = Cache(disk=make_disk(tmp_path), memory_max_bytes={"line_items": 2_000, "line_item_queries": 500})
+    rows = [{"period": "ttm", "report_period": "2024-01-01", "revenue": 1.0}]
+
+    def write(i):
+        cache.set_line_items(f"T{i % 50}", rows)
+        cache.set_line_item_query(f"T{i % 50}", "ttm", "2024-12-31", 1, ["2024-01-01"], ["revenue"])
+
+    def read(i):
+        # Entries are evicted by the writers while these look them up
+        return cache.get_line_items(f"T{i % 50}"), cache.get_line_item_query(f"T{i % 50}", "ttm", "2024-12-31", 1)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(write if i % 2 else read, i) for i in range(2_000)]
+        for future in futures:
+            future.result()
+
+
+def test_rows_are_kept_unique_and_in_time_order():
+    cache = Cache()
+    cache.set_insider_trades("AAPL", [{"filing_date": "2024-01-03"}, {"filing_date": "2024-01-01"}])
+    cache.set_insider_trades("AAPL", [{"filing_date": "2024-01-02"}, {"filing_date": "2024-01-03", "dup": True}, {"filing_date": "2024-01-05"}])
+
+    assert cache.get_insider_trades("AAPL") == [
+        {"filing_date": "2024-01-01"},
+        {"filing_date": "2024-01-02"},
+        {"filing_date": "2024-01-03"},
+        {"filing_date": "2024-01-05"},
+    ]
+
+
+def test_insider_trades_filed_on_one_day_are_all_kept(tmp_path):
+    trades = [{"filing_date": "2024-01-02", "name": name, "transaction_date": "2024-01-01", "transaction_shares": shares} for name, shares in [("A", 10.0), ("B", 10.0), ("A", -5.0)]]
+    cache = Cache(disk=make_disk(tmp_path))
+    cache.set_insider_trades("AAPL", trades)
+    cache.set_insider_trades("AAPL", trades[:1] + [{"filing_date": "2024-01-03", "name": "C", "transaction_date": "2024-01-03", "transaction_shares": 1.0}])
+
+    assert len(cache.get_insider_trades("AAPL")) == 4
+    assert Cache(disk=make_disk(tmp_path)).get_insider_trades("AAPL")[:3] == trades
+
+
+def test_cached_rows_are_validated_once_and_shared():
+    def article(day, url):
+        return {"ticker": "AAPL", "title": url, "author": "a", "source": "s", "date": f"2024-01-{day:02d}T10:00:00Z", "url": url}
+
+    cache = Cache()
+    cache.set_company_news("AAPL", [article(1, "a"), article(3, "c")])
+    first = cache.get_company_news("AAPL", model=CompanyNews)
+    cache.set_company_news("AAPL", [article(2, "b"), article(4, "d")])
+    second = cache.get_company_news("AAPL", model=CompanyNews)
+
+    assert [item.url for item in second] == ["a", "b", "c", "d"]
+    assert second[0] is first[0] and second[2] is first[1]
+    # Inserts swap in new lists, so what a reader was handed is never changed under it
+    cache.set_company_news("AAPL", [article(5, "e")])
+    assert [item.url for item in first] == ["a", "c"] and [item.url for item in second] == ["a", "b", "c", "d"]
+    assert cache.get_company_news("AAPL") == [article(day, url) for day, url in zip(range(1, 6), "abcde")]
+    with pytest.raises(ValidationError):
+        second[0].title = "changed"
+
+
+def test_lease_lets_one_of_several_workers_download(tmp_path):
+    # Each worker has its own Cache and connection, as separate processes would
+    downloads = []
+
+    def worker():
+        cache = Cache(disk=make_disk(tmp_path))
+        with cache.lease("insider_trades:AAPL", ("insider_trades", "AAPL")):
+            if cache.get_insider_trades("AAPL") is None:
+                downloads.append(1)
+                time.sleep(0.1)
+                cache.set_insider_trades("AAPL", [{"filing_date": "2024-01-02"}])
+        return cache.get_insider_trades("AAPL")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: worker(), range(4)))
+
+    assert len(downloads) == 1
+    assert results == [[{"filing_date": "2024-01-02"}]] * 4
+    assert sqlite3.connect(tmp_path / "cache.db").execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_lease_drops_only_the_leased_datasets(tmp_path):
+    cache = Cache(disk=make_disk(tmp_path))
+    cache.set_line_items("AAPL", [{"period": "ttm", "report_period": "2024-01-01"}])
+    cache.set_company_news("AAPL", [])
+    cache.add_news_range("AAPL", "2024-01-01", "2024-01-31")
+
+    with cache.lease("line_items:AAPL", ("line_items", "AAPL")):
+        assert cache.memory_stats()["line_items"]["entries"] == 0
+        assert cache.memory_stats()["company_news"]["entries"] == 1
+        assert cache.memory_stats()["news_ranges"]["entries"] == 1
+
+
+def test_history_store_maps_prices_across_restarts(tmp_path):
+    rows = [
+        {"open": 1.0, "close": 1.5, "high": 2.0, "low": 0.5, "volume": 100, "time": f"2024-01-0{day}T05:00:00Z"}
+        for day in (2, 3, 4)
+    ]
+    cache = Cache(history=HistoryStore(str(tmp_path / "history")))
+    cache.set_prices("AAPL", rows[:2])
+    cache.set_prices("AAPL", rows[2:])
+    cache.add_price_range("AAPL", "2024-01-01", "2024-01-04")
+
+    restarted = Cache(history=HistoryStore(str(tmp_path / "history")))
+    series = restarted.get_prices("AAPL")
+    assert series.to_rows() == rows
+    assert isinstance(series.close, np.memmap)
+    assert np.shares_memory(series.slice_dates("2024-01-03", "2024-01-04").close, series.close)
+    assert restarted.get_missing_price_ranges("AAPL", "2024-01-01", "2024-01-05") == [("2024-01-05", "2024-01-05")]
+    assert series.nbytes == 0  # mapped columns do not count against the memory budget
+    assert len(os.listdir(tmp_path / "history" / "AAPL")) == 3  # one version, "current" and "ranges.json"
+
+
+
+def test_history_store_evicts_least_recently_used_tickers(tmp_path):
+    rows = [{"open": 1.0, "close": 1.5, "high": 2.0, "low": 0.5, "volume": 100, "time": f"2024-01-{day:02d}T05:00:00Z"} for day in range(1, 29)]
+    series = PriceSeries.from_rows(rows)
+    store = HistoryStore(str(tmp_path / "history"))
+    store.write("A", series)
+    entry_size = sum(f.stat().st_size for f in (tmp_path / "history" / "A").rglob("*") if f.is_file())
+
+    store = HistoryStore(str(tmp_path / "history"), max_bytes=entry_size * 2)
+    time.sleep(0.01)
+    store.write("B", series)
+    time.sleep(0.01)
+    store.read("A")  # A becomes the most recently used ticker
+    time.sleep(0.01)
+    store.write("C", series)
+
+    assert store.tickers() == ["A", "C"]
+    assert store.stats() == {"bytes": entry_size * 2, "max_bytes": entry_size * 2, "evictions": 1}
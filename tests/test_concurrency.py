@@ -0,0 +1,87 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.agents.fundamentals import fundamentals_analyst_agent
+from src.data.bundle import DataBundle, get_data_bundle, use_data_bundles
+from src.data.models import FinancialMetrics
+from src.utils.concurrency import run_per_ticker
+
+
+def test_run_per_ticker_runs_tickers_at_once_and_keeps_their_order():
+    tickers = ["AAA", "BBB", "CCC"]
+    # Every call waits for the others, so this only finishes if they all run at once
+    barrier = threading.Barrier(len(tickers), timeout=5)
+
+    def analyze(ticker):
+        barrier.wait()
+        # Later tickers finish first
+        time.sleep(0.01 * (len(tickers) - tickers.index(ticker)))
+        return ticker.lower()
+
+    results = run_per_ticker(tickers, analyze)
+
+    assert list(results.items()) == [("AAA", "aaa"), ("BBB", "bbb"), ("CCC", "ccc")]
+
+
+def test_run_per_ticker_bounds_the_calls_in_flight():
+    in_flight = peak = 0
+    lock = threading.Lock()
+
+    def analyze(ticker):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return ticker
+
+    results = run_per_ticker([f"T{i}" for i in range(8)], analyze, max_workers=3)
+
+    assert list(results) == [f"T{i}" for i in range(8)]
+    assert peak == 3
+
+
+def test_run_per_ticker_finishes_every_ticker_and_raises_the_first_error():
+    finished = []
+
+    def analyze(ticker):
+        if ticker != "AAA":
+            finished.append(ticker)
+        if ticker in ("BBB", "CCC"):
+            raise ValueError(ticker)
+        return ticker
+
+    with pytest.raises(ValueError, match="BBB"):
+        run_per_ticker(["AAA", "BBB", "CCC", "DDD"], analyze)
+
+    assert sorted(finished) == ["BBB", "CCC", "DDD"]
+
+
+def test_run_per_ticker_calls_see_the_callers_data_bundles():
+    bundles = {ticker: DataBundle(ticker=ticker, end_date="2024-12-31") for ticker in ("AAA", "BBB")}
+
+    with use_data_bundles(bundles):
+        results = run_per_ticker(["AAA", "BBB"], get_data_bundle)
+
+    assert results == bundles
+
+
+def test_fundamentals_agent_merges_signals_in_ticker_order():
+    tickers = ["AAA", "BBB", "CCC"]
+    metrics = FinancialMetrics(ticker="AAA", report_period="2024-09-30", period="ttm", currency="USD", **{name: None for name in FinancialMetrics.model_fields if name not in ("ticker", "report_period", "period", "currency")})
+
+    def get_financial_metrics(ticker, end_date, period, limit, api_key):
+        # The first ticker answers last; the second has no metrics and is left out
+        time.sleep(0.05 if ticker == "AAA" else 0)
+        return [] if ticker == "BBB" else [metrics]
+
+    state = {"data": {"tickers": tickers, "end_date": "2024-12-31", "analyst_signals": {}}, "messages": [], "metadata": {"show_reasoning": False}}
+    with patch("src.agents.fundamentals.get_financial_metrics", side_effect=get_financial_metrics):
+        result = fundamentals_analyst_agent(state)
+
+    assert list(result["data"]["analyst_signals"]["fundamentals_analyst_agent"]) == ["AAA", "CCC"]
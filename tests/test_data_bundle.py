@@ -0,0 +1,78 @@
+from unittest.mock import patch
+
+from src.data.bundle import build_data_bundles, get_data_bundle
+from src.data.models import CompanyNews, FinancialMetrics, InsiderTrade, LineItem
+from src.data.providers import bind_data_provider
+from src.data.requirements import DataRequirements, LineItemRequest, plan_requests
+from src.tools import api
+
+
+def metrics(count):
+    fields = dict.fromkeys(FinancialMetrics.model_fields)
+    return [FinancialMetrics(**{**fields, "ticker": "AAA", "period": "ttm", "currency": "USD", "report_period": f"{2024 - i}-12-31", "market_cap": 100.0 + i}) for i in range(count)]
+
+
+def trades(dates):
+    fields = dict.fromkeys(InsiderTrade.model_fields)
+    return [InsiderTrade(**{**fields, "ticker": "AAA", "filing_date": day}) for day in dates]
+
+
+def line_items(ticker, fields, end_date, period="ttm", limit=10, **kwargs):
+    return [LineItem(ticker=ticker, report_period="2024-12-31", period=period, currency="USD", **{name: 1.0 for name in fields})]
+
+
+def test_prefetched_bundles_answer_agent_queries():
+    news = [CompanyNews(ticker="AAA", title="t", author="a", source="s", date=f"2024-0{m}-01T00:00:00Z", url=f"https://x/{m}") for m in (3, 1)]
+    with patch("src.tools.api.get_financial_metrics", side_effect=lambda *args, **kwargs: metrics(3)), patch("src.tools.api.search_line_items", side_effect=line_items), patch(
+        "src.tools.api.get_insider_trades", return_value=trades(["2024-06-01", "2024-02-01"])
+    ), patch("src.tools.api.get_recent_company_news", return_value=(news, "2024-01-01")):
+        plan = DataRequirements(
+            financial_metrics={"ttm": 3},
+            line_items=(LineItemRequest("annual", 10, ("revenue", "net_income")),),
+            insider_trades=1000,
+            news_lookback_days=365,
+        )
+        bundles = build_data_bundles(["AAA"], "2024-12-31", plan)
+
+    state = {"data": {"bundles": bundles}, "metadata": {}}
+
+    def agent(state):
+        return (
+            api.get_financial_metrics("AAA", "2024-12-31", limit=2),
+            api.get_market_cap("AAA", "2024-12-31"),
+            api.search_line_items("AAA", ["revenue"], "2024-12-31", period="annual", limit=5),
+            api.get_insider_trades("AAA", "2024-12-31", start_date="2024-03-01"),
+            api.get_company_news("AAA", "2024-12-31", start_date="2024-02-01"),
+            list(api.iter_company_news("AAA", "2024-12-31", start_date="2024-01-01")),
+        )
+
+    with patch("src.tools.api._make_api_request") as mock_request:
+        reports, market_cap, items, recent_trades, recent_news, newest_news = bind_data_provider(agent)(state)
+
+    mock_request.assert_not_called()
+    assert [m.report_period for m in reports] == ["2024-12-31", "2023-12-31"]
+    assert market_cap == 100.0
+    assert items[0].revenue == 1.0 and "net_income" not in items[0].model_dump()
+    assert [t.filing_date for t in recent_trades] == ["2024-06-01"]
+    assert [n.url for n in recent_news] == ["https://x/3"]
+    assert [n.url for n in newest_news] == ["https://x/3", "https://x/1"]
+    # Outside a bound node the bundles are not consulted
+    assert get_data_bundle("AAA") is None
+
+
+def test_planner_merges_analyst_requirements_into_one_request_per_period():
+    buffett = DataRequirements(financial_metrics={"ttm": 10}, line_items=(LineItemRequest("ttm", 10, ("revenue", "net_income")),), market_cap=True)
+    graham = DataRequirements(financial_metrics={"annual": 10}, line_items=(LineItemRequest("annual", 10, ("revenue",)),), market_cap=True)
+    valuation = DataRequirements(financial_metrics={"ttm": 8}, line_items=(LineItemRequest("ttm", 8, ("ebit", "revenue")),), market_cap=True)
+    lynch = DataRequirements(line_items=(LineItemRequest("annual", 5, ("earnings_per_share",)),), market_cap=True, insider_trades=50, news_articles=50)
+    sentiment = DataRequirements(insider_trades=1000, news_articles=100)
+    burry = DataRequirements(news_lookback_days=365)
+
+    plan = plan_requests([buffett, graham, valuation, lynch, sentiment, burry])
+
+    assert plan.financial_metrics == {"ttm": 10, "annual": 10}
+    assert plan.line_items == (LineItemRequest("ttm", 10, ("revenue", "net_income", "ebit")), LineItemRequest("annual", 10, ("revenue", "earnings_per_share")))
+    assert (plan.insider_trades, plan.news_lookback_days, plan.news_articles) == (1000, 365, 100)
+    assert sum(r.request_count for r in [buffett, graham, valuation, lynch, sentiment, burry]) == 14
+    assert plan.request_count == 6
+    assert plan_requests([lynch]).financial_metrics == {"ttm": 1}
@@ -0,0 +1,104 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.data import providers as providers_module
+from src.data.providers import LocalDataProvider, bind_data_provider, get_data_provider, use_data_provider
+from src.tools import api, api_async
+
+
+@pytest.fixture
+def local_root(tmp_path):
+    (tmp_path / "prices").mkdir()
+    pd.DataFrame(
+        {
+            "time": ["2024-01-02T05:00:00Z", "2024-01-03T05:00:00Z", "2024-01-04T05:00:00Z"],
+            "open": [1.0, 2.0, 3.0],
+            "close": [1.5, 2.5, 3.5],
+            "high": [2.0, 3.0, 4.0],
+            "low": [0.5, 1.5, 2.5],
+            "volume": [100, 200, 300],
+        }
+    ).to_csv(tmp_path / "prices" / "AAA.csv", index=False)
+
+    (tmp_path / "line_items").mkdir()
+    reports = [
+        {"ticker": "AAA", "report_period": period, "period": "ttm", "currency": "USD", "revenue": revenue, "net_income": None}
+        for period, revenue in [("2023-06-30", 10.0), ("2023-12-31", 12.0), ("2024-06-30", 15.0)]
+    ]
+    (tmp_path / "line_items" / "AAA.json").write_text(json.dumps(reports))
+
+    (tmp_path / "company_news").mkdir()
+    pd.DataFrame(
+        {
+            "title": ["old", "new"],
+            "author": ["a", "b"],
+            "source": ["s", "s"],
+            "date": ["2024-01-02T10:00:00Z", "2024-01-04T10:00:00Z"],
+            "url": ["https://x/1", "https://x/2"],
+            "sentiment": [None, "positive"],
+        }
+    ).to_csv(tmp_path / "company_news" / "AAA.csv", index=False)
+    return tmp_path
+
+
+def test_local_provider_serves_api_calls_without_http(local_root):
+    with patch("src.tools.api._make_api_request") as mock_request, use_data_provider(f"local:{local_root}"):
+        prices = api.get_prices("AAA", "2024-01-03", "2024-01-31")
+        items = api.search_line_items("AAA", ["revenue"], "2024-01-31", limit=5)
+        news = api.get_company_news("AAA", "2024-01-31", start_date="2024-01-01")
+        trades = api.get_insider_trades("AAA", "2024-01-31")
+
+    assert [p.time[:10] for p in prices] == ["2024-01-03", "2024-01-04"]
+    assert [(item.report_period, item.revenue) for item in items] == [("2023-12-31", 12.0), ("2023-06-30", 10.0)]
+    assert [item.title for item in news] == ["new", "old"]
+    assert news[1].sentiment is None
+    assert trades == []
+    mock_request.assert_not_called()
+
+
+def test_local_provider_keeps_its_own_cache(local_root):
+    shared = api._cache
+    with use_data_provider(f"local:{local_root}"):
+        api.get_prices("AAA", "2024-01-02", "2024-01-04")
+        provider = get_data_provider()
+
+    assert isinstance(provider, LocalDataProvider)
+    assert provider.cache.get_prices("AAA") is not None
+    assert api._active_cache() is shared
+    # The snapshot's cache is held to the configured memory budgets
+    assert provider.cache.memory_stats()["prices"]["max_bytes"] == shared.memory_stats()["prices"]["max_bytes"] is not None
+
+
+def test_bound_node_and_async_calls_use_metadata_provider(local_root):
+    def node(state):
+        return get_data_provider().name
+
+    state = {"metadata": {"data_provider": f"local:{local_root}"}}
+    assert bind_data_provider(node)(state) == "local"
+    assert bind_data_provider(node)({"metadata": {}}) == get_data_provider().name
+
+    async def fetch():
+        with use_data_provider(f"local:{local_root}"):
+            return await api_async.get_prices_async("AAA", "2024-01-02", "2024-01-04")
+
+    assert len(asyncio.run(fetch())) == 3
+
+
+def test_local_provider_keeps_lookups_inside_its_root(local_root):
+    provider = LocalDataProvider(str(local_root / "prices"))
+    for ticker in ("../prices/AAA", "..", "/etc/passwd", ".hidden"):
+        with pytest.raises(ValueError, match="Invalid ticker"):
+            provider.fetch_prices(ticker, "2024-01-01", "2024-12-31")
+    assert provider.fetch_prices("BRK.B", "2024-01-01", "2024-12-31") is not None
+
+
+def test_only_a_few_providers_are_kept_open(tmp_path):
+    providers = [get_data_provider(f"local:{tmp_path / str(i)}") for i in range(20)]
+
+    assert get_data_provider(f"local:{tmp_path / '19'}") is providers[-1]
+    assert get_data_provider(f"local:{tmp_path / '0'}") is not providers[0]
+    assert len(providers_module._providers) <= providers_module._MAX_PROVIDERS
@@ -0,0 +1,82 @@
+import ast
+import inspect
+from pathlib import Path
+
+import pytest
+
+from src.data.requirements import DataRequirements, LineItemRequest
+from src.tools import api
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+# Agents import LLM clients, so their sources and ANALYST_CONFIG are read without importing them
+ANALYSTS = ast.parse((SRC / "utils" / "analysts.py").read_text())
+
+
+def declared_requirements():
+    """Map each analyst's agent module to the DataRequirements it declares in ANALYST_CONFIG."""
+    modules = {alias.asname or alias.name: node.module for node in ANALYSTS.body if isinstance(node, ast.ImportFrom) and node.module.startswith("src.agents") for alias in node.names}
+    config = next(node.value for node in ANALYSTS.body if isinstance(node, ast.Assign) and node.targets[0].id == "ANALYST_CONFIG")
+    declared = {}
+    for entry in config.values:
+        fields = {key.value: value for key, value in zip(entry.keys, entry.values)}
+        if "data_requirements" in fields:
+            expression = ast.Expression(fields["data_requirements"])
+            requirements = eval(compile(expression, "analysts.py", "eval"), {"DataRequirements": DataRequirements, "LineItemRequest": LineItemRequest})
+            declared[modules[fields["agent_func"].id]] = requirements
+    return declared
+
+
+def lookback_days(tree, expression):
+    """Return the ``timedelta(days=N)`` a start date expression looks back, following a local name to its assignment."""
+    if isinstance(expression, ast.Name):
+        expression = next(node.value for node in ast.walk(tree) if isinstance(node, ast.Assign) and any(isinstance(target, ast.Name) and target.id == expression.id for target in node.targets))
+    deltas = [node for node in ast.walk(expression) if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "timedelta"]
+    return ast.literal_eval(next(kw.value for kw in deltas[0].keywords if kw.arg == "days")) if deltas else None
+
+
+def data_calls(module):
+    """Yield (function name, bound arguments) for each data call in an agent module."""
+    tree = ast.parse((SRC.parent / Path(*module.split("."))).with_suffix(".py").read_text())
+    streamed = set()
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)):
+            continue
+        if node.func.id == "islice" and isinstance(node.args[0], ast.Call) and getattr(node.args[0].func, "id", None) == "iter_company_news":
+            # News streams are only bounded by how many articles the agent takes from them
+            streamed.add(node.args[0])
+            yield "iter_company_news", {"articles": ast.literal_eval(node.args[1])}
+        elif node.func.id == "iter_company_news" and node not in streamed:
+            # ast.walk visits the islice before the stream it wraps, so this stream is unbounded
+            yield "iter_company_news", {"articles": None}
+        elif node.func.id == "get_company_news":
+            start_date = next((kw.value for kw in node.keywords if kw.arg == "start_date"), node.args[2] if len(node.args) > 2 else None)
+            yield "get_company_news", {"lookback_days": lookback_days(tree, start_date) if start_date is not None else None}
+        elif node.func.id in ("get_financial_metrics", "search_line_items", "get_insider_trades", "get_market_cap"):
+            # Only the arguments that decide what is fetched are literals; the rest are placeholders
+            value = lambda arg: ast.literal_eval(arg) if isinstance(arg, (ast.Constant, ast.List)) else None
+            bound = inspect.signature(getattr(api, node.func.id)).bind(*map(value, node.args), **{kw.arg: value(kw.value) for kw in node.keywords})
+            bound.apply_defaults()
+            yield node.func.id, bound.arguments
+
+
+@pytest.mark.parametrize("module, requirements", sorted(declared_requirements().items()))
+def test_declared_requirements_cover_what_each_agent_fetches(module, requirements):
+    calls = list(data_calls(module))
+    assert calls
+
+    for name, args in calls:
+        if name == "get_financial_metrics":
+            assert requirements.financial_metrics.get(args["period"], 0) >= args["limit"]
+        elif name == "search_line_items":
+            assert any(
+                request.period == args["period"] and request.limit >= args["limit"] and set(args["line_items"]) <= set(request.fields)
+                for request in requirements.line_items
+            ), f"{module} reads {args['period']} line items not declared: {args['line_items']}"
+        elif name == "iter_company_news":
+            assert args["articles"] is not None and requirements.news_articles >= args["articles"], f"{module} streams more news than it declares"
+        elif name == "get_company_news":
+            assert args["lookback_days"] is not None and requirements.news_lookback_days >= args["lookback_days"], f"{module} reads news further back than it declares"
+        elif name == "get_insider_trades":
+            assert requirements.insider_trades >= args["limit"]
+        else:
+            assert requirements.market_cap
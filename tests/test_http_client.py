@@ -0,0 +1,76 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from src.tools.http_client import HttpClient
+
+
+class PeerRecordingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    peers: set = set()
+
+    def do_GET(self):
+        PeerRecordingHandler.peers.add(self.client_address)
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    PeerRecordingHandler.peers = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PeerRecordingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_connections_are_reused(server_url):
+    client = HttpClient(pool_size=4)
+    for _ in range(10):
+        assert client.request("GET", server_url).status_code == 200
+    client.close()
+
+    assert len(PeerRecordingHandler.peers) == 1
+
+
+def test_default_timeout_is_applied():
+    client = HttpClient(timeout=(1.0, 2.0))
+    with patch("requests.Session.request") as mock_request:
+        client.request("GET", "https://example.invalid")
+        client.request("GET", "https://example.invalid", timeout=9)
+
+    assert mock_request.call_args_list[0].kwargs["timeout"] == (1.0, 2.0)
+    assert mock_request.call_args_list[1].kwargs["timeout"] == 9
+
+
+def test_archive_replays_recorded_exchanges_without_network(server_url, tmp_path):
+    from src.tools.http_archive import ArchiveMissError, HttpArchive
+
+    path = str(tmp_path / "archive.db")
+    recorder = HttpClient(archive=HttpArchive(path, "record"))
+    recorded = [recorder.request("GET", server_url, params={"b": 2, "a": 1}, headers={"APCA-API-KEY-ID": "secret"}) for _ in range(2)]
+    recorder.close()
+    assert len(recorder.archive) == 2
+    recorder.archive.close()
+
+    replayer = HttpClient(archive=HttpArchive(path, "replay"))
+    with patch("requests.Session.request") as mock_request:
+        replayed = [replayer.request("GET", server_url, params={"a": 1, "b": 2}) for _ in range(3)]
+        with pytest.raises(ArchiveMissError):
+            replayer.request("GET", f"{server_url}/other")
+
+    mock_request.assert_not_called()
+    assert [r.status_code for r in replayed] == [200, 200, 200]
+    assert replayed[0].json() == recorded[0].json() == {}
+    with open(path, "rb") as f:
+        assert b"secret" not in f.read()
@@ -0,0 +1,43 @@
+import numpy as np
+
+from src.data.models import Price
+from src.data.price_series import PriceSeries
+from src.tools.api import prices_to_df
+
+
+def bar(date, close, volume=100):
+    return {"open": close - 1, "close": close, "high": close + 1, "low": close - 2, "volume": volume, "time": f"{date}T05:00:00Z"}
+
+
+def test_from_rows_sorts_and_keeps_last_duplicate():
+    series = PriceSeries.from_rows([bar("2024-01-03", 3.0), bar("2024-01-02", 2.0), bar("2024-01-03", 4.0)])
+
+    assert series.time_strings() == ["2024-01-02T05:00:00Z", "2024-01-03T05:00:00Z"]
+    assert series.close.tolist() == [2.0, 4.0]
+
+
+def test_merge_prefers_newer_bars_and_slice_is_a_view():
+    base = PriceSeries.from_rows([bar("2024-01-02", 2.0), bar("2024-01-03", 3.0)])
+    merged = base.merge(PriceSeries.from_rows([bar("2024-01-03", 5.0), bar("2024-01-04", 4.0)]))
+
+    assert merged.close.tolist() == [2.0, 5.0, 4.0]
+    window = merged.slice_dates("2024-01-03", "2024-01-03")
+    assert window.close.tolist() == [5.0]
+    assert np.shares_memory(window.close, merged.close)
+
+
+def test_bytes_round_trip_and_price_models():
+    series = PriceSeries.from_rows([bar("2024-01-02", 2.0, volume=7)])
+
+    restored = PriceSeries.from_bytes(series.to_bytes())
+    assert restored.to_prices() == [Price(**bar("2024-01-02", 2.0, volume=7))]
+
+
+def test_prices_to_df_wraps_series_without_copying():
+    series = PriceSeries.from_rows([bar("2024-01-02", 2.0), bar("2024-01-03", 3.0)])
+
+    df = prices_to_df(series)
+    assert list(df.columns) == ["open", "close", "high", "low", "volume"]
+    assert str(df.index.tz) == "UTC"
+    assert np.shares_memory(df["close"].to_numpy(), series.close)
+    assert prices_to_df(series.to_prices()).equals(df)
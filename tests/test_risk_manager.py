@@ -8,6 +8,7 @@ from src.agents.risk_manager import (
 )
 from src.tools.api import prices_to_df
 from src.data.models import Price
+from src.data.price_series import PriceSeries
 
 
 @pytest.fixture
@@ -65,7 +66,7 @@ def test_var_and_stop_loss_metrics(state, price_series):
     remaining_limit = position_limit - current_price * 10 - potential_loss
     remaining_limit = max(0.0, remaining_limit)
 
-    with patch("src.agents.risk_manager.get_prices", return_value=price_series), \
+    with patch("src.agents.risk_manager.get_price_series_batch", return_value={"AAA": PriceSeries.from_prices(price_series)}), \
          patch("src.agents.risk_manager.progress.update_status"):
         result = risk_management_agent(state)
 
@@ -0,0 +1,69 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.data.cache import Cache
+from src.tools import api
+from src.tools.singleflight import SingleFlight
+
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return ["result"]
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        results = list(pool.map(lambda _: flight.do("AAPL", fetch), range(5)))
+
+    assert results == [["result"]] * 5
+    assert len(calls) == 1
+    assert flight.stats() == {"executed": 1, "coalesced": 4, "in_flight": 0}
+
+
+def test_errors_are_propagated_to_waiters():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(flight.do, "key", fail)
+        started.wait()
+        waiter = pool.submit(flight.do, "key", fail)
+        for future in (leader, waiter):
+            with pytest.raises(ValueError):
+                future.result()
+
+    # The key is released, so a later call runs again
+    assert flight.do("key", lambda: 1) == 1
+
+
+def test_concurrent_agents_trigger_one_metrics_request():
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = {"fundamentals": [{"report_period": "2024-03-31", "period": "ttm", "currency": "USD"}]}
+
+    def slow_request(*args, **kwargs):
+        time.sleep(0.2)
+        return response
+
+    with patch("src.tools.api._cache", Cache()), \
+         patch("src.tools.api._singleflight", SingleFlight()), \
+         patch("src.tools.api._make_api_request", side_effect=slow_request) as mock_request:
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            results = list(pool.map(lambda _: api.get_financial_metrics("AAPL", "2024-06-30"), range(3)))
+        stats = api.get_request_stats()
+
+    assert mock_request.call_count == 1
+    assert all(len(r) == 1 for r in results)
+    assert stats["saved_requests"] == 2
@@ -0,0 +1,43 @@
+import asyncio
+from unittest.mock import patch
+
+from src.data.requirements import DataRequirements, LineItemRequest
+from src.tools.warm_cache import WarmProgress, read_tickers, warm_cache
+
+PLAN = DataRequirements(financial_metrics={"ttm": 10}, line_items=(LineItemRequest("annual", 5, ("revenue",)),), insider_trades=50, news_articles=100)
+TASKS_PER_TICKER = 1 + PLAN.request_count
+
+
+def test_warm_cache_resumes_and_retries_failed_tasks(tmp_path):
+    (tmp_path / "universe.txt").write_text("aaa, bbb  # core\nAAA\n")
+    tickers = read_tickers(str(tmp_path / "universe.txt"))
+    path = str(tmp_path / "progress.txt")
+    params = {"start": "2024-01-01", "end": "2024-12-31"}
+
+    def news(ticker, *args, **kwargs):
+        if ticker == "BBB":
+            raise RuntimeError("boom")
+        return [], None
+
+    def run():
+        progress = WarmProgress(path, params)
+        try:
+            return asyncio.run(warm_cache(tickers, "2024-01-01", "2024-12-31", PLAN, progress=progress))
+        finally:
+            progress.close()
+
+    with patch("src.tools.api.get_price_series_batch", return_value={}) as prices, patch("src.tools.api.get_financial_metrics", return_value=[]), patch(
+        "src.tools.api.search_line_items", return_value=[]
+    ), patch("src.tools.api.get_insider_trades", return_value=[]), patch("src.tools.api.get_recent_company_news", side_effect=news) as company_news:
+        first = run()
+        assert prices.call_count == 1 and prices.call_args.args[0] == ["AAA", "BBB"]
+        prices.reset_mock()
+        company_news.reset_mock()
+        second = run()
+
+    assert tickers == ["AAA", "BBB"]
+    assert first["tasks"] == 2 * TASKS_PER_TICKER and list(first["failures"]) == ["BBB:company_news"]
+    # Only the failed task is tried again
+    assert second["tasks"] == 1 and second["skipped"] == 2 * TASKS_PER_TICKER - 1
+    prices.assert_not_called()
+    assert [call.args[0] for call in company_news.call_args_list] == ["BBB"]